@@ -1,12 +1,16 @@
 """Price Monitoring Agent - Tracks fund prices in real-time"""
-import asyncio
 import logging
 import os
-from datetime import datetime
-from typing import Dict, List
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Set
 import aiohttp
 from bs4 import BeautifulSoup
+from app.models.database import PriceHistory, SessionLocal
+from app.services.adaptive_polling import VOLATILITY_WINDOW, AdaptivePolling
+from app.services.market_calendar import market_calendar
 from app.services.price_fetcher import get_price_fetcher
+from app.services.ring_buffer import PriceRingBuffer
+from app.services.write_behind import price_history_writer
 
 logger = logging.getLogger(__name__)
 
@@ -17,13 +21,24 @@ FUNDS = {
     "az_shariah": {"ticker": "ASO", "url": "https://thndr.app/"},
 }
 
+# Ticks kept per fund in the in-memory ring buffer
+HISTORY_CAPACITY = int(os.getenv("PRICE_HISTORY_CAPACITY", "10000"))
+
+# Closed markets: keep polling until the closing print settles, then only occasionally
+CLOSE_SETTLE_SECONDS = float(os.getenv("MARKET_CLOSE_SETTLE_SECONDS", "1200"))
+CLOSED_REFRESH_SECONDS = float(os.getenv("MARKET_CLOSED_REFRESH_SECONDS", "1800"))
+
+# A move above this raises a HIGH_VOLATILITY alert (AgentOrchestrator._fund_alerts); funds past ALERT_PROXIMITY of it are polled fastest
+VOLATILITY_ALERT_PCT = 5.0
+ALERT_PROXIMITY = 0.8
+
 
 class PriceMonitor:
     """Monitor real-time prices for investment funds"""
 
     def __init__(self):
         self.prices = {}
-        self.price_history = {}
+        self.price_history: Dict[str, PriceRingBuffer] = {}
         # Enforce Real Data for Production Readiness
         # We want to fail if real data is not available, rather than silently falling back to mock
         use_real_data = True
@@ -31,6 +46,13 @@ class PriceMonitor:
         
         # Removed mock_fetcher to prevent accidental usage
 
+        self.calendar = market_calendar
+        self._fetched_at: Dict[str, float] = {}  # epoch of each fund's last successful fetch
+        self.last_fetched: List[str] = []  # funds with a new tick from the latest monitor_all_funds
+        # Per-fund poll intervals; funds near a signal threshold are watched closely
+        self.polling = AdaptivePolling()
+        self.watchlist: Set[str] = set()
+
     async def fetch_price(self, fund_name: str) -> Dict:
         """Fetch current price for a fund"""
         try:
@@ -45,16 +67,7 @@ class PriceMonitor:
             # In production, we want to know if data is missing, not see fake numbers.
 
             if price_info:
-                self.prices[fund_name] = price_info
-                
-                # Update history
-                if fund_name not in self.price_history:
-                    self.price_history[fund_name] = []
-                self.price_history[fund_name].append(price_info)
-                
-                # Keep last 100 records
-                if len(self.price_history[fund_name]) > 100:
-                    self.price_history[fund_name].pop(0)
+                self._record_price(fund_name, price_info)
                 
             return price_info
 
@@ -62,11 +75,137 @@ class PriceMonitor:
             logger.error(f"Error fetching price for {fund_name}: {e}")
             return None
 
+    def _record_price(self, fund_name: str, price_info: Dict) -> bool:
+        """
+        Store latest price and append it to the fund's history. A tick carrying
+        the timestamp already recorded (a quote served again from cache) only
+        refreshes the latest price; returns whether it was a new tick.
+        """
+        previous = self.prices.get(fund_name)
+        self.prices[fund_name] = price_info
+        if previous is not None and previous.get("timestamp") == price_info.get("timestamp"):
+            return False
+
+        # Update history (fixed capacity, oldest ticks are overwritten)
+        if fund_name not in self.price_history:
+            self.price_history[fund_name] = PriceRingBuffer(HISTORY_CAPACITY)
+        self.price_history[fund_name].append_tick(price_info)
+
+        # Persist asynchronously; never blocks the monitoring cycle
+        price_history_writer.submit(price_info)
+        return True
+
+    def load_history(self, session_factory=SessionLocal, limit: int = HISTORY_CAPACITY) -> int:
+        """Fill the ring buffers from persisted PriceHistory (blocking, run at startup)"""
+        db = session_factory()
+        loaded = 0
+        try:
+            for fund_name in FUNDS:
+                rows = (
+                    db.query(PriceHistory)
+                    .filter(PriceHistory.fund_name == fund_name)
+                    .order_by(PriceHistory.timestamp.desc())
+                    .limit(limit)
+                    .all()
+                )
+                if not rows:
+                    continue
+                buffer = self.price_history.setdefault(fund_name, PriceRingBuffer(HISTORY_CAPACITY))
+                for row in reversed(rows):
+                    # Stored as naive UTC
+                    epoch = row.timestamp.replace(tzinfo=timezone.utc).timestamp()
+                    buffer.append(row.price, row.change_percent or 0.0, row.volume or 0, epoch)
+                loaded += len(rows)
+        finally:
+            db.close()
+        logger.info(f"Loaded {loaded} persisted price ticks into history")
+        return loaded
+
     async def monitor_all_funds(self) -> List[Dict]:
-        """Monitor all funds simultaneously"""
-        tasks = [self.fetch_price(fund_name) for fund_name in FUNDS.keys()]
-        results = await asyncio.gather(*tasks)
-        return [r for r in results if r]
+        """
+        Monitor all funds with one batched fetch of their shared proxy symbols.
+        Funds whose market is closed are only fetched when due; otherwise their
+        last close is served again, marked stale.
+        """
+        now = datetime.now(timezone.utc)
+        due = {fund_name: fund_data for fund_name, fund_data in FUNDS.items() if self._fetch_due(fund_name, now)}
+        try:
+            results = await self.fetcher.fetch_prices(due) if due else {}
+        except Exception as e:
+            logger.error(f"Error fetching prices for all funds: {e}")
+            return []
+
+        self.last_fetched = []
+        prices = []
+        for fund_name in FUNDS:
+            price_info = results.get(fund_name)
+            if price_info:
+                self._fetched_at[fund_name] = now.timestamp()
+                if self._record_price(fund_name, self._with_market(fund_name, price_info, now)):
+                    self.last_fetched.append(fund_name)
+                self._schedule_next_poll(fund_name, price_info, now)
+            elif fund_name not in due and fund_name in self.prices:
+                # Not due yet, or market closed: the last price stays valid, just not live
+                self.prices[fund_name] = self._with_market(fund_name, self.prices[fund_name], now)
+            else:
+                continue
+            prices.append(self.prices[fund_name])
+
+        skipped = [fund_name for fund_name in FUNDS if fund_name not in due]
+        if skipped:
+            logger.debug(f"💤 Not due or market closed, serving last price for: {', '.join(skipped)}")
+        return prices
+
+    def _fetch_due(self, fund_name: str, now: datetime) -> bool:
+        """
+        Open markets are polled at each fund's adaptive interval; closed ones
+        until the close settles, then every CLOSED_REFRESH_SECONDS.
+        """
+        if fund_name not in self.prices:
+            return True
+        symbols = self.fetcher.proxy_symbols(fund_name)
+        if not symbols or self.calendar.is_open(symbols[0], now):
+            return self.polling.is_due(fund_name, now.timestamp())
+        fetched_at = self._fetched_at.get(fund_name, 0.0)
+        last_close = self.calendar.last_close(symbols[0], now)
+        if last_close is not None and fetched_at < last_close.timestamp() + CLOSE_SETTLE_SECONDS:
+            return True
+        return now.timestamp() - fetched_at >= CLOSED_REFRESH_SECONDS
+
+    def _schedule_next_poll(self, fund_name: str, price_info: Dict, now: datetime):
+        """Derive the fund's next poll from its recent volatility and distance to the ``_fund_alerts`` volatility threshold"""
+        history = self.price_history[fund_name]
+        near_alert = abs(price_info.get("change") or 0.0) >= VOLATILITY_ALERT_PCT * ALERT_PROXIMITY
+        self.polling.observe(
+            fund_name,
+            history.prices(VOLATILITY_WINDOW),
+            history.timestamps(VOLATILITY_WINDOW),
+            urgent=near_alert or fund_name in self.watchlist,
+            now=now.timestamp(),
+        )
+
+    def watch(self, fund_names: Iterable[str]):
+        """Funds close to a recommendation threshold; newly watched ones are polled at the fastest rate"""
+        fund_names = set(fund_names)
+        for fund_name in fund_names - self.watchlist:
+            self.polling.expedite(fund_name)
+        self.watchlist = fund_names
+
+    def market_status(self, fund_name: str, at: datetime = None) -> Dict:
+        """Calendar state of the market behind a fund's primary proxy symbol"""
+        symbols = self.fetcher.proxy_symbols(fund_name)
+        if not symbols:
+            return {"symbol": None, "market": None, "open": True, "last_close": None, "next_open": None}
+        return self.calendar.status(symbols[0], at)
+
+    def any_market_open(self, at: datetime = None) -> bool:
+        """Whether any market behind a fund price is trading"""
+        symbols = [s[0] for s in (self.fetcher.proxy_symbols(f) for f in FUNDS) if s]
+        return not symbols or any(self.calendar.is_open(symbol, at) for symbol in symbols)
+
+    def _with_market(self, fund_name: str, price_info: Dict, now: datetime) -> Dict:
+        status = self.market_status(fund_name, now)
+        return {**price_info, "market_open": status["open"], "stale": not status["open"], "market": status}
 
     def get_price_change_24h(self, fund_name: str) -> float:
         """Get 24h price change percentage"""
@@ -82,8 +221,13 @@ class PriceMonitor:
         """Detect price discrepancies between markets"""
         # This will compare prices across different brokers/platforms
         # For now, returns mock opportunities
-        opportunities = []
         prices = await self.monitor_all_funds()
+        return self.find_opportunities(prices)
+
+    @staticmethod
+    def find_opportunities(prices: List[Dict]) -> List[Dict]:
+        """Flag large price swings in already-fetched prices"""
+        opportunities = []
 
         for price in prices:
             if abs(price["change"]) > 2:  # Threshold for opportunity
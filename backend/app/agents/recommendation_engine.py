@@ -1,7 +1,12 @@
 """Recommendation Engine - Generates buy/sell recommendations"""
 import logging
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from app.services.indicators import WilderRSI, compute_signals, wilder_rsi
+from app.services.ring_buffer import PriceRingBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -20,18 +25,47 @@ class RecommendationEngine:
     # Weights
     WEIGHTS = {"price": 0.3, "sentiment": 0.7}
 
+    RSI_PERIOD = 14
+    RSI_OVERSOLD = 30
+    RSI_OVERBOUGHT = 70
+    INDICATOR_WINDOW = 200  # ticks per fund fed to the vectorized indicators
+    MIN_BAND_WIDTH = 0.001  # ignore Bollinger signals when bands are flat (e.g. simulated savings NAV)
+    SIGNAL_PROXIMITY = 0.75  # inputs past 75% of both STRONG thresholds count as near the signal
+
     def __init__(self):
         self.recommendations = {}
+        # Per-fund incremental indicator state, updated O(1) per new tick
+        self.rsi_state: Dict[str, WilderRSI] = {}
+        # Latest vectorized indicators per fund, reused until the fund's prices change
+        self.indicators: Dict[str, Dict] = {}
 
     async def generate_recommendation(
-        self, fund_name: str, price_data: Dict, sentiment_data: Dict, price_history: List[Dict] = None
+        self,
+        fund_name: str,
+        price_data: Dict,
+        sentiment_data: Dict,
+        price_history: Optional[Union[PriceRingBuffer, List[Dict]]] = None,
+        indicators: Optional[Dict] = None,
     ) -> Dict:
-        """Generate recommendation based on price and sentiment"""
+        """Generate recommendation based on price, sentiment and technical indicators"""
         price_change = price_data.get("change", 0)
         sentiment_score = sentiment_data.get("overall_score", 0)
         
-        # Calculate RSI
-        rsi = self.calculate_rsi(price_history) if price_history else 50.0
+        # Calculate RSI (incrementally when we get the live ring buffer)
+        if isinstance(price_history, PriceRingBuffer):
+            rsi = self.sync_indicators(fund_name, price_history)
+        elif price_history:
+            rsi = self.calculate_rsi(self._history_prices(price_history))
+        else:
+            rsi = self.get_rsi(fund_name)
+
+        # Bollinger bands: closing outside a band is a mean-reversion signal
+        indicators = indicators or {}
+        percent_b = indicators.get("bb_percent_b")
+        band_width = indicators.get("bb_width")
+        bands_usable = percent_b is not None and band_width is not None and band_width >= self.MIN_BAND_WIDTH
+        below_band = bands_usable and percent_b < 0
+        above_band = bands_usable and percent_b > 1
 
         # Simple recommendation logic
         # RSI < 30 is oversold (Buy signal), RSI > 70 is overbought (Sell signal)
@@ -54,9 +88,9 @@ class RecommendationEngine:
         elif (
             price_change < t["BUY"]["price_drop"]
             and sentiment_score > t["BUY"]["sentiment"]
-        ) or rsi < 30: # Added RSI buy signal
+        ) or rsi < self.RSI_OVERSOLD or below_band: # Added RSI / Bollinger buy signals
             recommendation = "BUY"
-            confidence = min(0.9, 0.5 + sentiment_score + (0.1 if rsi < 30 else 0))
+            confidence = min(0.9, 0.5 + sentiment_score + (0.1 if rsi < self.RSI_OVERSOLD else 0) + (0.05 if below_band else 0))
         elif (
             price_change > t["STRONG_SELL"]["price_rise"]
             and sentiment_score < t["STRONG_SELL"]["sentiment"]
@@ -66,9 +100,9 @@ class RecommendationEngine:
         elif (
             price_change > t["SELL"]["price_rise"]
             and sentiment_score < t["SELL"]["sentiment"]
-        ) or rsi > 70: # Added RSI sell signal
+        ) or rsi > self.RSI_OVERBOUGHT or above_band: # Added RSI / Bollinger sell signals
             recommendation = "SELL"
-            confidence = min(0.9, 0.5 - sentiment_score + (0.1 if rsi > 70 else 0))
+            confidence = min(0.9, 0.5 - sentiment_score + (0.1 if rsi > self.RSI_OVERBOUGHT else 0) + (0.05 if above_band else 0))
 
         return {
             "fund": fund_name,
@@ -77,45 +111,74 @@ class RecommendationEngine:
             "price_change": price_change,
             "sentiment_score": sentiment_score,
             "rsi": rsi,
+            "indicators": indicators,
             "reason": self._generate_reason(
-                recommendation, price_change, sentiment_score, rsi
+                recommendation, price_change, sentiment_score, rsi, indicators, bands_usable
             ),
             "target_price": price_data.get("price", 0)
             * (1 + (0.02 if "BUY" in recommendation else -0.02)),
             "timestamp": datetime.now().isoformat(),
         }
 
-    def calculate_rsi(self, price_history: List[Dict], period: int = 14) -> float:
-        """Calculate Relative Strength Index (RSI)"""
-        if not price_history or len(price_history) < period + 1:
-            return 50.0
-            
-        prices = [p["price"] for p in price_history]
-        changes = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-        
-        # We need at least 'period' changes
-        if len(changes) < period:
+    def near_strong_signal(self, price_change: float, sentiment_score: float) -> bool:
+        """Whether price and sentiment are both close to (or past) a STRONG_BUY/STRONG_SELL boundary"""
+        t = self.THRESHOLDS
+        p = self.SIGNAL_PROXIMITY
+        near_buy = (
+            price_change < t["STRONG_BUY"]["price_drop"] * p
+            and sentiment_score > t["STRONG_BUY"]["sentiment"] * p
+        )
+        near_sell = (
+            price_change > t["STRONG_SELL"]["price_rise"] * p
+            and sentiment_score < t["STRONG_SELL"]["sentiment"] * p
+        )
+        return near_buy or near_sell
+
+    @staticmethod
+    def _history_prices(price_history: Union[PriceRingBuffer, List[Dict]]) -> Sequence[float]:
+        """Prices from a ring buffer (zero-copy view) or a legacy list of price dicts"""
+        if isinstance(price_history, PriceRingBuffer):
+            return price_history.prices()
+        return [p["price"] for p in price_history]
+
+    def calculate_rsi(self, prices: Sequence[float], period: int = RSI_PERIOD) -> float:
+        """Calculate Wilder-smoothed Relative Strength Index (RSI) over a whole series"""
+        if prices is None or len(prices) < period + 1:
             return 50.0
-            
-        # Use only the last 'period' changes
-        recent_changes = changes[-period:]
-        
-        gains = [c for c in recent_changes if c > 0]
-        losses = [abs(c) for c in recent_changes if c < 0]
-        
-        avg_gain = sum(gains) / period if gains else 0
-        avg_loss = sum(losses) / period if losses else 0
-        
-        if avg_loss == 0:
-            return 100.0
-            
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return round(rsi, 2)
+        return wilder_rsi(prices, period)
+
+    def sync_indicators(self, fund_name: str, history: PriceRingBuffer) -> float:
+        """
+        Bring a fund's indicator state up to date with its tick history.
+        Only ticks newer than the last one seen are applied, so the cost is
+        O(new ticks) rather than O(history); an unknown fund is backfilled once.
+        """
+        state = self.rsi_state.get(fund_name)
+        timestamps = history.timestamps()
+        if state is None or state.last_timestamp is None:
+            # Unknown fund, or state created before its history loaded: backfill it all
+            state = self.rsi_state[fund_name] = WilderRSI(self.RSI_PERIOD)
+            start = 0
+        else:
+            start = int(np.searchsorted(timestamps, state.last_timestamp, side="right"))
+
+        if start < len(timestamps):
+            state.backfill(history.prices()[start:], timestamps[start:])
+        return state.value
+
+    def get_rsi(self, fund_name: str) -> float:
+        """Current RSI for a fund from its incremental state"""
+        state = self.rsi_state.get(fund_name)
+        return state.value if state else 50.0
 
     def _generate_reason(
-        self, recommendation: str, price_change: float, sentiment_score: float, rsi: float = 50.0
+        self,
+        recommendation: str,
+        price_change: float,
+        sentiment_score: float,
+        rsi: float = 50.0,
+        indicators: Optional[Dict] = None,
+        bands_usable: bool = False,
     ) -> str:
         """Generate human-readable reason for recommendation"""
         reasons = []
@@ -129,31 +192,62 @@ class RecommendationEngine:
         elif sentiment_score < t["STRONG_SELL"]["sentiment"]:
             reasons.append("Strong negative sentiment")
             
-        if rsi < 30:
+        if rsi < self.RSI_OVERSOLD:
             reasons.append(f"RSI Oversold ({rsi})")
-        elif rsi > 70:
+        elif rsi > self.RSI_OVERBOUGHT:
             reasons.append(f"RSI Overbought ({rsi})")
 
+        indicators = indicators or {}
+        percent_b = indicators.get("bb_percent_b")
+        if bands_usable and percent_b < 0:
+            reasons.append("Below lower Bollinger band")
+        elif bands_usable and percent_b > 1:
+            reasons.append("Above upper Bollinger band")
+
+        # MACD is reported only when it confirms the call
+        macd_hist = indicators.get("macd_hist")
+        if macd_hist is not None:
+            if "BUY" in recommendation and macd_hist > 0:
+                reasons.append("MACD bullish")
+            elif "SELL" in recommendation and macd_hist < 0:
+                reasons.append("MACD bearish")
+
         return " | ".join(reasons) if reasons else "Neutral indicators"
 
     async def generate_all_recommendations(
         self,
         price_data: Dict[str, Dict],
         sentiment_data: Dict[str, Dict],
-        price_history: Dict[str, List[Dict]] = None
+        price_history: Dict[str, PriceRingBuffer] = None
     ) -> List[Dict]:
         """Generate recommendations for all funds"""
         recommendations = []
 
+        # Indicators for every fund in one vectorized pass
+        histories = {
+            fund_name: price_history[fund_name]
+            for fund_name in price_data
+            if price_history and fund_name in price_history
+        }
+        signals = self.update_indicators(histories)
+
         for fund_name, prices in price_data.items():
             sentiment = sentiment_data.get(fund_name, {})
-            history = price_history.get(fund_name, []) if price_history else []
+            history = price_history.get(fund_name) if price_history else None
             
-            rec = await self.generate_recommendation(fund_name, prices, sentiment, history)
+            rec = await self.generate_recommendation(
+                fund_name, prices, sentiment, history, signals.get(fund_name)
+            )
             recommendations.append(rec)
 
         return recommendations
 
+    def update_indicators(self, histories: Dict[str, PriceRingBuffer]) -> Dict[str, Dict]:
+        """Recompute indicators for the given funds only (one vectorized pass) and cache them"""
+        signals = compute_signals(histories, self.INDICATOR_WINDOW)
+        self.indicators.update(signals)
+        return signals
+
     def get_top_opportunities(
         self, recommendations: List[Dict], limit: int = 3
     ) -> List[Dict]:
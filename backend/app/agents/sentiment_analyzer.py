@@ -4,7 +4,10 @@ import os
 from datetime import datetime
 from typing import Dict, List
 import re
+import asyncio
+from app.agents.price_monitor import FUNDS
 from app.services.sentiment_fetcher import get_sentiment_fetcher, MockSentimentFetcher
+from app.services.write_behind import sentiment_record_writer
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +92,8 @@ class SentimentAnalyzer:
                  
             if result:
                 self.sentiment_cache[fund_name] = result
+                # Persisted in batches off the event loop
+                sentiment_record_writer.submit(result)
                 
             return result
             
@@ -96,33 +101,18 @@ class SentimentAnalyzer:
             logger.error(f"Error fetching sentiment for {fund_name}: {e}")
             return None
 
-    async def get_trending_keywords(self, fund_name: str) -> List[str]:
-        """Get trending keywords for a fund on X/Farcaster"""
+    async def get_trending_keywords(self, fund_name: str, k: int = 10) -> List[str]:
+        """Get the top ``k`` trending keywords for a fund (empty until real data has been seen)"""
         try:
-            keywords = await self.fetcher.get_trending_keywords(fund_name)
-            if not keywords:
-                keywords = await self.mock_fetcher.get_trending_keywords(fund_name)
-            return keywords
+            return await self.fetcher.get_trending_keywords(fund_name, k)
         except Exception as e:
             logger.error(f"Error fetching keywords for {fund_name}: {e}")
             return []
 
     async def analyze_all_funds(self) -> List[Dict]:
-        """Analyze sentiment for all funds"""
-        # TODO: Refactor to get funds list dynamically or from config
-        funds = [
-            "halan_saving",
-            "az_gold",
-            "az_opportunity",
-            "az_shariah",
-        ]
-        tasks = [self.fetch_sentiment_for_fund(fund) for fund in funds]
-        results = []
-        for task in tasks:
-            result = await task
-            if result:
-                results.append(result)
-        return results
+        """Analyze sentiment for all funds concurrently (limits live in the fetcher)"""
+        results = await asyncio.gather(*(self.fetch_sentiment_for_fund(fund) for fund in FUNDS))
+        return [result for result in results if result]
 
     def get_sentiment_alert(self, fund_name: str, threshold: float = 0.7) -> str:
         """Generate sentiment-based alert"""
@@ -2,7 +2,7 @@
 import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routes import prices, sentiment, recommendations
+from app.routes import prices, sentiment, recommendations, stream
 from app.models.database import init_db
 
 # Initialize logging
@@ -29,7 +29,12 @@ app.add_middleware(
 )
 
 import asyncio
-from app.orchestrator import start_continuous_monitoring
+from app.orchestrator import orchestrator, start_continuous_monitoring
+from app.services.executors import EXECUTORS, run_watchdog
+from app.services.http_client import http_client
+from app.services.scheduler import scheduler
+from app.services.text_scorer import shutdown_pool as shutdown_scoring_pool, text_scorer
+from app.services.write_behind import WRITERS
 
 # Initialize database
 @app.on_event("startup")
@@ -38,16 +43,43 @@ async def startup_event():
     logger.info("Initializing database...")
     init_db()
     logger.info("Database initialized")
+
+    # Shared HTTP connection pool for all sentiment sources
+    await http_client.start()
+
+    # Load the sentiment lexicon once, before any worker processes fork
+    text_scorer.load()
+
+    # Start write-behind persistence before the first ticks arrive
+    for writer in WRITERS:
+        await writer.start()
     
+    # Restore persisted history so indicators (RSI) are valid from the first cycle
+    await orchestrator.warm_start()
+
     # Start background monitoring loop
     logger.info("Starting background monitoring...")
-    asyncio.create_task(start_continuous_monitoring())
+    await start_continuous_monitoring()
+    asyncio.create_task(run_watchdog())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release background resources"""
+    await scheduler.stop()
+    for writer in WRITERS:
+        await writer.stop()
+    for executor in EXECUTORS:
+        executor.shutdown()
+    await http_client.close()
+    shutdown_scoring_pool()
 
 
 # Include routers
 app.include_router(prices.router)
 app.include_router(sentiment.router)
 app.include_router(recommendations.router)
+app.include_router(stream.router)
 
 
 @app.get("/")
@@ -60,6 +92,7 @@ async def root():
             "prices": "/api/prices",
             "sentiment": "/api/sentiment",
             "recommendations": "/api/recommendations",
+            "stream": "/api/stream/cycles",
             "docs": "/docs",
         },
     }
@@ -1,5 +1,5 @@
 """Database models and configuration"""
-from sqlalchemy import create_engine, Column, String, Float, DateTime, Integer, Boolean
+from sqlalchemy import create_engine, inspect, text, Column, String, Float, DateTime, Integer, Boolean, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
@@ -39,9 +39,29 @@ class SentimentRecord(Base):
     negative = Column(Float)
     overall_score = Column(Float)
     source_count = Column(Integer)
+    new_items = Column(Integer, default=0)  # items first seen in this fetch
     timestamp = Column(DateTime, default=datetime.utcnow, index=True)
 
 
+class SentimentRollup(Base):
+    """Pre-aggregated sentiment per fund and time bucket (hour / day)"""
+    __tablename__ = "sentiment_rollups"
+    __table_args__ = (
+        UniqueConstraint("fund_name", "resolution", "bucket_start", name="uq_sentiment_rollup_bucket"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    fund_name = Column(String, index=True)
+    resolution = Column(String)  # hour, day
+    bucket_start = Column(DateTime, index=True)
+    samples = Column(Integer, default=0)  # sentiment records in the bucket
+    item_count = Column(Integer, default=0)  # sum of their new items
+    score_sum = Column(Float, default=0.0)
+    positive_sum = Column(Float, default=0.0)
+    neutral_sum = Column(Float, default=0.0)
+    negative_sum = Column(Float, default=0.0)
+
+
 class TradeRecommendation(Base):
     """Store trade recommendations"""
     __tablename__ = "trade_recommendations"
@@ -84,3 +104,9 @@ def get_db():
 def init_db():
     """Initialize database tables"""
     Base.metadata.create_all(bind=engine)
+
+    # create_all does not alter existing tables
+    columns = {c["name"] for c in inspect(engine).get_columns("sentiment_records")}
+    if "new_items" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE sentiment_records ADD COLUMN new_items INTEGER DEFAULT 0"))
@@ -5,15 +5,39 @@ This is the main orchestration logic that ties everything together
 
 import asyncio
 import logging
+import os
+import time
 from datetime import datetime
-from typing import Dict, List
-from app.agents.price_monitor import PriceMonitor
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from app.agents.price_monitor import VOLATILITY_ALERT_PCT, PriceMonitor
 from app.agents.sentiment_analyzer import SentimentAnalyzer
 from app.agents.recommendation_engine import RecommendationEngine
+from app.services.broadcaster import cycle_broadcaster
+from app.services.dependency_graph import PIPELINE, DependencyGraph
+from app.services.executors import db_executor
+from app.services.phase_executor import Phase, PhaseExecutor
+from app.services.scheduler import scheduler
+from app.services.snapshot import Snapshot, snapshot_store
 from app.services.trading_service import trading_service
 
 logger = logging.getLogger(__name__)
 
+# Agent cadences: quotes move far faster than news
+PRICE_INTERVAL = float(os.getenv("PRICE_INTERVAL_SECONDS", "10"))
+PRICE_JITTER = float(os.getenv("PRICE_JITTER_SECONDS", "1"))
+SENTIMENT_INTERVAL = float(os.getenv("SENTIMENT_INTERVAL_SECONDS", "300"))
+SENTIMENT_JITTER = float(os.getenv("SENTIMENT_JITTER_SECONDS", "15"))
+# Latency budgets of the cycle phases (scheduled and manual); a late phase falls back to its last known good data
+PRICE_PHASE_DEADLINE = float(os.getenv("CYCLE_PRICE_DEADLINE_SECONDS", "15"))
+SENTIMENT_PHASE_DEADLINE = float(os.getenv("CYCLE_SENTIMENT_DEADLINE_SECONDS", "12"))
+RECOMMENDATION_PHASE_DEADLINE = float(os.getenv("CYCLE_RECOMMENDATION_DEADLINE_SECONDS", "10"))
+# While every market is closed, news is only polled this often
+SENTIMENT_CLOSED_INTERVAL = float(os.getenv("SENTIMENT_CLOSED_INTERVAL_SECONDS", "1800"))
+
+# Snapshot field each input phase publishes
+SNAPSHOT_FIELDS = {"prices": "prices", "sentiment": "sentiments"}
+
 
 class AgentOrchestrator:
     """
@@ -24,6 +48,9 @@ class AgentOrchestrator:
     2. Sentiment Analyzer → Analyzes social signals
     3. Recommendation Engine → Combines signals into actionable recommendations
     4. Alert System → Notifies users of opportunities
+
+    Prices and sentiment run on their own cadences; steps 3-4 rerun
+    whenever either of them publishes an update.
     """
 
     def __init__(self):
@@ -35,63 +62,267 @@ class AgentOrchestrator:
         self.last_sentiment = {}
         self.last_recommendations = {}
 
+        # In-flight refreshes and fetches: concurrent callers (scheduled jobs,
+        # ?refresh=true requests) share one run instead of racing on the inputs
+        self._refreshes: Dict[str, asyncio.Task] = {}
+        # Price and sentiment updates land independently; recomputes run one at a time
+        self._recompute_lock = asyncio.Lock()
+        self._sentiment_updated_at: float = None  # monotonic
+
+        # Incremental recomputation: per-fund dirty tracking over price → indicators → recommendation → alerts → auto-trade
+        self.graph = DependencyGraph(PIPELINE)
+        self._alerts: Dict[str, List[Dict]] = {}
+        self._alert_count = 0
+        self._signal_counts: Counter = Counter()
+        self._near_signal: Set[str] = set()
+        # Last signal auto-trading acted on per fund: a STRONG signal trades once, not on every tick
+        self._traded_signals: Dict[str, str] = {}
+
+    async def warm_start(self):
+        """Restore price history from the database and backfill indicator state"""
+        try:
+            await db_executor.run(self.price_monitor.load_history)
+        except Exception as e:
+            logger.error(f"❌ Could not load persisted price history: {e}")
+            return
+
+        for fund_name, history in self.price_monitor.price_history.items():
+            self.recommendation_engine.sync_indicators(fund_name, history)
+        logger.info(f"🔥 Indicator state warmed for {len(self.price_monitor.price_history)} funds")
+
+    async def fetch_prices(self) -> List[Dict]:
+        """Price phase: fetch quotes and record them as the latest inputs (one fetch at a time, shared)"""
+        return await self._single_flight("fetch_prices", self._fetch_prices)
+
+    async def fetch_sentiment(self) -> List[Dict]:
+        """Sentiment phase: analyze social signals and record them as the latest inputs (one run at a time, shared)"""
+        return await self._single_flight("fetch_sentiment", self._fetch_sentiment)
+
+    async def _fetch_prices(self) -> List[Dict]:
+        logger.info("📊 Price Monitoring")
+        prices = await self.price_monitor.monitor_all_funds()
+        self.last_prices = {p["fund"]: p for p in prices}
+        self._track_prices(self.price_monitor.last_fetched)
+        return prices
+
+    async def _fetch_sentiment(self) -> List[Dict]:
+        logger.info("💬 Sentiment Analysis")
+        sentiments = await self.sentiment_analyzer.analyze_all_funds()
+        self.last_sentiment = {s["fund"]: s for s in sentiments}
+        self._sentiment_updated_at = time.monotonic()
+        self._track_sentiment(sentiments)
+        return sentiments
+
+    async def update_prices(self) -> List[Dict]:
+        """Scheduled price job: fetch, publish and recompute what changed, each phase within its deadline"""
+        phases = await self._run_phases("prices", ("prices",))
+        return phases["prices"].value
+
+    async def update_sentiment(self) -> List[Dict]:
+        """Scheduled sentiment job: fetch, publish and recompute what changed, each phase within its deadline"""
+        phases = await self._run_phases("sentiment", ("sentiment",))
+        return phases["sentiment"].value
+
+    async def _run_phases(self, trigger: str, inputs: Tuple[str, ...]) -> Dict:
+        """
+        Fetch ``inputs`` ("prices" and/or "sentiment") concurrently, publish
+        them, then recompute recommendations. Every phase has a deadline; a
+        late or failed fetch contributes its last known good data, marked stale.
+        """
+        fetches = {
+            "prices": Phase("prices", self.fetch_prices, deadline=PRICE_PHASE_DEADLINE, fallback=self._stale_prices),
+            "sentiment": Phase(
+                "sentiment", self.fetch_sentiment, deadline=SENTIMENT_PHASE_DEADLINE, fallback=self._stale_sentiment
+            ),
+        }
+        return await PhaseExecutor([
+            *(fetches[name] for name in inputs),
+            Phase("publish", lambda: self._publish_inputs(inputs), depends_on=inputs),
+            Phase(
+                "recommendations",
+                # Shielded: a late recompute still finishes and publishes, the caller just stops waiting
+                lambda: asyncio.shield(self.recompute_recommendations(trigger)),
+                depends_on=("publish",),
+                deadline=RECOMMENDATION_PHASE_DEADLINE,
+            ),
+        ]).run()
+
+    def _stale_prices(self) -> List[Dict]:
+        """Last known good prices, flagged as not refreshed this cycle"""
+        self.last_prices = {fund: {**p, "stale": True} for fund, p in self.last_prices.items()}
+        return list(self.last_prices.values())
+
+    def _stale_sentiment(self) -> List[Dict]:
+        """Last known good sentiment, flagged as not refreshed this cycle"""
+        self.last_sentiment = {fund: {**s, "stale": True} for fund, s in self.last_sentiment.items()}
+        return list(self.last_sentiment.values())
+
+    async def poll_sentiment(self):
+        """Scheduled sentiment phase, slowed to SENTIMENT_CLOSED_INTERVAL while every market is closed"""
+        if (
+            self._sentiment_updated_at is not None
+            and not self.price_monitor.any_market_open()
+            and time.monotonic() - self._sentiment_updated_at < SENTIMENT_CLOSED_INTERVAL
+        ):
+            return
+        await self.update_sentiment()
+
+    def _track_prices(self, funds: List[str]):
+        """
+        Fingerprint the price inputs of freshly fetched funds. The last tick's
+        timestamp is part of it: a new tick at an unchanged price still moves
+        RSI and the other indicator windows.
+        """
+        for fund in funds:
+            price = self.last_prices.get(fund)
+            if price:
+                history = self.price_monitor.price_history.get(fund)
+                last_tick = float(history.timestamps(1)[0]) if history is not None and len(history) else None
+                self.graph.set(fund, "price", [price.get("price"), price.get("change"), last_tick])
+
+    def _track_sentiment(self, sentiments: List[Dict]):
+        for sentiment in sentiments:
+            self.graph.set(sentiment["fund"], "sentiment", [
+                sentiment.get("overall_score"), sentiment.get("sentiment_distribution"), sentiment.get("trending"),
+            ])
+
+    async def recompute_recommendations(self, trigger: str = "cycle") -> Dict:
+        """
+        Recommendation phase, run whenever an input updates. Walks the
+        dependency graph and recomputes, per fund, only what changed:
+        1. Indicators (one vectorized pass over funds with new prices)
+        2. Recommendations
+        3. Alerts
+        4. Paper trades
+        Then publishes the snapshot and broadcasts the result with its change set.
+        """
+        async with self._recompute_lock:
+            if not self.last_prices:
+                return {"status": "waiting", "trigger": trigger, "timestamp": datetime.now().isoformat()}
+
+            started = datetime.now()
+            engine = self.recommendation_engine
+            history = self.price_monitor.price_history
+
+            indicator_funds = self.graph.take("indicators")
+            if indicator_funds:
+                signals = engine.update_indicators({f: history[f] for f in indicator_funds if f in history})
+                for fund in indicator_funds:
+                    self.graph.set(fund, "indicators", _rounded(signals.get(fund)))
+
+            rec_funds = self.graph.take("recommendation")
+            if rec_funds:
+                logger.info(f"🤖 Recommendation Generation ({trigger} updated, {len(rec_funds)} fund(s))")
+            for fund in rec_funds:
+                price = self.last_prices.get(fund)
+                if not price:
+                    continue
+                rec = await engine.generate_recommendation(
+                    fund, price, self.last_sentiment.get(fund, {}), history.get(fund), engine.indicators.get(fund)
+                )
+                self._set_recommendation(rec)
+                self.graph.set(fund, "recommendation", [rec["recommendation"], round(rec["confidence"], 4), rec["reason"]])
+                # Funds about to cross a STRONG threshold get polled at the fastest rate
+                if engine.near_strong_signal(rec["price_change"], rec["sentiment_score"]):
+                    self._near_signal.add(fund)
+                else:
+                    self._near_signal.discard(fund)
+            if rec_funds:
+                self.price_monitor.watch(self._near_signal)
+
+            for fund in self.graph.take("alerts"):
+                rec = self.last_recommendations.get(fund)
+                if rec is None:
+                    continue
+                alerts = self._fund_alerts(rec, self.last_sentiment.get(fund), self.last_prices.get(fund))
+                self._set_alerts(fund, alerts)
+                self.graph.set(fund, "alerts", [[a["type"], a["confidence"]] for a in alerts])
+
+            # Auto-Trade on Strong Signals (Paper Trading), only for changed signals or prices
+            trade_recs = [self.last_recommendations[f] for f in self.graph.take("auto_trade") if f in self.last_recommendations]
+            if trade_recs:
+                await self._process_auto_trading(trade_recs)
+                for rec in trade_recs:
+                    self.graph.set(rec["fund"], "auto_trade", [rec["recommendation"], self.last_prices.get(rec["fund"], {}).get("price")])
+
+            changes = self.graph.drain_changes()
+            summary = {
+                "funds_monitored": len(self.last_prices),
+                "strong_buy_signals": self._signal_counts["STRONG_BUY"],
+                "strong_sell_signals": self._signal_counts["STRONG_SELL"],
+                "alerts_generated": self._alert_count,
+            }
+            result = {
+                "status": "success",
+                "trigger": trigger,
+                "timestamp": datetime.now().isoformat(),
+                "cycle_time_seconds": (datetime.now() - started).total_seconds(),
+                "changes": changes,
+                "summary": summary,
+            }
+            if not any(node in changes for node in ("recommendation", "alerts", "price", "sentiment")):
+                # Nothing visible changed: keep the current snapshot and spare the dashboards
+                result["snapshot_version"] = snapshot_store.current().version
+                return result
+
+            alerts = [alert for fund_alerts in self._alerts.values() for alert in fund_alerts]
+            # Publish a new read-only snapshot for the API routes
+            snapshot = snapshot_store.publish(
+                recommendations=self.last_recommendations,
+                alerts=alerts,
+                summary=summary,
+            )
+            result.update({
+                "prices": list(self.last_prices.values()),
+                "opportunities": PriceMonitor.find_opportunities(list(self.last_prices.values())),
+                "sentiments": list(self.last_sentiment.values()),
+                "recommendations": list(self.last_recommendations.values()),
+                "alerts": alerts,
+                "snapshot_version": snapshot.version,
+            })
+
+            # Push to live dashboards (never blocks on slow clients)
+            cycle_broadcaster.publish(result)
+            return result
+
+    def _set_recommendation(self, rec: Dict):
+        """Replace a fund's recommendation, keeping the strong-signal counters in step"""
+        previous = self.last_recommendations.get(rec["fund"])
+        if previous is not None:
+            self._signal_counts[previous["recommendation"]] -= 1
+        self._signal_counts[rec["recommendation"]] += 1
+        self.last_recommendations[rec["fund"]] = rec
+
+    def _set_alerts(self, fund: str, alerts: List[Dict]):
+        self._alert_count += len(alerts) - len(self._alerts.get(fund, ()))
+        if alerts:
+            self._alerts[fund] = alerts
+        else:
+            self._alerts.pop(fund, None)
+
     async def run_full_cycle(self) -> Dict:
         """
-        Execute a complete monitoring cycle:
-        1. Fetch prices
-        2. Analyze sentiment
-        3. Generate recommendations
-        4. Detect alerts
+        Execute a complete monitoring cycle as a DAG of phases:
+        1. Fetch prices and analyze sentiment concurrently, each within its deadline
+        2. Publish both as the cycle's inputs
+        3. Generate recommendations, alerts and paper trades
+        A phase that misses its deadline contributes its last known good
+        data, marked stale, so the cycle takes max(prices, sentiment).
         """
         logger.info("🔄 Starting agent orchestration cycle...")
         
         cycle_start = datetime.now()
         
         try:
-            # Phase 1: Price Monitoring
-            logger.info("📊 Phase 1: Price Monitoring")
-            prices = await self.price_monitor.monitor_all_funds()
-            self.last_prices = {p["fund"]: p for p in prices}
-            
-            # Phase 2: Sentiment Analysis
-            logger.info("💬 Phase 2: Sentiment Analysis")
-            sentiments = await self.sentiment_analyzer.analyze_all_funds()
-            self.last_sentiment = {s["fund"]: s for s in sentiments}
-            
-            # Phase 3: Generate Recommendations
-            logger.info("🤖 Phase 3: Recommendation Generation")
-            recommendations = await self.recommendation_engine.generate_all_recommendations(
-                self.last_prices, self.last_sentiment, self.price_monitor.price_history
-            )
-            self.last_recommendations = {r["fund"]: r for r in recommendations}
-            
-            # Phase 4: Detect Alerts & Execute Paper Trades
-            logger.info("🚨 Phase 4: Alert Detection & Paper Trading")
-            alerts = self._generate_alerts(prices, sentiments, recommendations)
-            
-            # Auto-Trade on Strong Signals (Paper Trading)
-            await self._process_auto_trading(recommendations)
-            
-            # Phase 5: Compile Results
-            cycle_time = (datetime.now() - cycle_start).total_seconds()
-            
-            result = {
-                "status": "success",
-                "timestamp": datetime.now().isoformat(),
-                "cycle_time_seconds": cycle_time,
-                "prices": prices,
-                "sentiments": sentiments,
-                "recommendations": recommendations,
-                "alerts": alerts,
-                "summary": {
-                    "funds_monitored": len(prices),
-                    "strong_buy_signals": len([r for r in recommendations if r["recommendation"] == "STRONG_BUY"]),
-                    "strong_sell_signals": len([r for r in recommendations if r["recommendation"] == "STRONG_SELL"]),
-                    "alerts_generated": len(alerts),
-                }
-            }
-            
-            logger.info(f"✅ Cycle completed in {cycle_time:.2f}s - {result['summary']}")
+            phases = await self._run_phases("cycle", ("prices", "sentiment"))
+
+            result = phases["recommendations"].value
+            if result is None:
+                raise RuntimeError(f"Recommendation phase: {phases['recommendations'].error}")
+            result["cycle_time_seconds"] = (datetime.now() - cycle_start).total_seconds()
+            result["phases"] = {name: phase.to_dict() for name, phase in phases.items()}
+            result["stale_phases"] = [name for name, phase in phases.items() if phase.stale]
+            logger.info(f"✅ Cycle completed in {result['cycle_time_seconds']:.2f}s - {result.get('summary')}")
             return result
             
         except Exception as e:
@@ -104,86 +335,121 @@ class AgentOrchestrator:
                 "timestamp": datetime.now().isoformat(),
             }
 
+    async def _publish_inputs(self, inputs: Tuple[str, ...]):
+        latest = {"prices": self.last_prices, "sentiment": self.last_sentiment}
+        snapshot_store.publish(**{SNAPSHOT_FIELDS[name]: latest[name] for name in inputs})
+
+    async def refresh_prices(self) -> Snapshot:
+        """Force a live price fetch and publish it (concurrent callers share one fetch)"""
+        async def _refresh():
+            await self.update_prices()
+            return snapshot_store.current()
+
+        return await self._single_flight("prices", _refresh)
+
+    async def refresh_sentiment(self) -> Snapshot:
+        """Force a live sentiment fetch and publish it (concurrent callers share one fetch)"""
+        async def _refresh():
+            await self.update_sentiment()
+            return snapshot_store.current()
+
+        return await self._single_flight("sentiment", _refresh)
+
+    async def refresh_all(self) -> Snapshot:
+        """Force a full cycle (concurrent callers share one cycle)"""
+        async def _refresh():
+            await self.run_full_cycle()
+            return snapshot_store.current()
+
+        return await self._single_flight("cycle", _refresh)
+
+    async def _single_flight(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._refreshes.get(key)
+        if task is None or task.done():
+            task = asyncio.create_task(factory())
+            self._refreshes[key] = task
+        return await asyncio.shield(task)
+
     async def _process_auto_trading(self, recommendations: List[Dict]):
-        """Execute paper trades based on strong recommendations"""
+        """Execute paper trades when a fund's signal changes to a strong one"""
         for rec in recommendations:
-            if rec["confidence"] > 0.85: # High confidence threshold for auto-trade
-                fund_name = rec["fund"]
+            fund_name = rec["fund"]
+            signal = rec["recommendation"]
+            if signal == self._traded_signals.get(fund_name):
+                continue  # unchanged signal: already acted on
+            if signal not in ("STRONG_BUY", "STRONG_SELL"):
+                self._traded_signals[fund_name] = signal
+                continue
+
+            if rec["confidence"] > trading_service.AUTO_TRADE_CONFIDENCE: # High confidence threshold for auto-trade
                 price_data = self.last_prices.get(fund_name, {})
                 current_price = price_data.get("price", 0)
                 
                 if current_price > 0:
-                    if rec["recommendation"] == "STRONG_BUY":
-                         trading_service.execute_paper_trade(fund_name, "BUY", current_price, rec["confidence"])
-                    elif rec["recommendation"] == "STRONG_SELL":
-                         trading_service.execute_paper_trade(fund_name, "SELL", current_price, rec["confidence"])
+                    action = "BUY" if signal == "STRONG_BUY" else "SELL"
+                    trading_service.execute_paper_trade(fund_name, action, current_price, rec["confidence"])
+                    self._traded_signals[fund_name] = signal
 
 
-    def _generate_alerts(self, prices: List, sentiments: List, recommendations: List) -> List[Dict]:
-        """
-        Generate actionable alerts based on combined signals
-        """
+    def _fund_alerts(self, rec: Dict, sentiment: Optional[Dict], price_data: Optional[Dict]) -> List[Dict]:
+        """Alerts for one fund from its recommendation, sentiment and price"""
         alerts = []
-        
-        for rec in recommendations:
-            fund = rec["fund"]
-            
-            # Alert 1: Strong Buy Signal
-            if rec["recommendation"] == "STRONG_BUY" and rec["confidence"] > 0.8:
-                alerts.append({
-                    "type": "STRONG_BUY",
-                    "fund": fund,
-                    "title": f"🟢 Strong Buy Signal: {fund}",
-                    "message": rec["reason"],
-                    "confidence": rec["confidence"],
-                    "action": "CONSIDER_BUY",
-                })
-            
-            # Alert 2: Strong Sell Signal
-            elif rec["recommendation"] == "STRONG_SELL" and rec["confidence"] > 0.8:
+        fund = rec["fund"]
+
+        # Alert 1: Strong Buy Signal
+        if rec["recommendation"] == "STRONG_BUY" and rec["confidence"] > 0.8:
+            alerts.append({
+                "type": "STRONG_BUY",
+                "fund": fund,
+                "title": f"🟢 Strong Buy Signal: {fund}",
+                "message": rec["reason"],
+                "confidence": rec["confidence"],
+                "action": "CONSIDER_BUY",
+            })
+
+        # Alert 2: Strong Sell Signal
+        elif rec["recommendation"] == "STRONG_SELL" and rec["confidence"] > 0.8:
+            alerts.append({
+                "type": "STRONG_SELL",
+                "fund": fund,
+                "title": f"🔴 Strong Sell Signal: {fund}",
+                "message": rec["reason"],
+                "confidence": rec["confidence"],
+                "action": "CONSIDER_SELL",
+            })
+
+        # Alert 3: Sentiment Shift
+        if sentiment:
+            if sentiment["overall_score"] > 0.7 and sentiment.get("trending"):
                 alerts.append({
-                    "type": "STRONG_SELL",
+                    "type": "SENTIMENT_SURGE",
                     "fund": fund,
-                    "title": f"🔴 Strong Sell Signal: {fund}",
-                    "message": rec["reason"],
-                    "confidence": rec["confidence"],
-                    "action": "CONSIDER_SELL",
+                    "title": f"📈 Sentiment Surge: {fund}",
+                    "message": f"Strong positive sentiment ({sentiment['overall_score']:.0%})",
+                    "confidence": sentiment["overall_score"],
+                    "action": "WATCH_FUND",
                 })
-            
-            # Alert 3: Sentiment Shift
-            sentiment = next((s for s in sentiments if s["fund"] == fund), None)
-            if sentiment:
-                if sentiment["overall_score"] > 0.7 and sentiment.get("trending"):
-                    alerts.append({
-                        "type": "SENTIMENT_SURGE",
-                        "fund": fund,
-                        "title": f"📈 Sentiment Surge: {fund}",
-                        "message": f"Strong positive sentiment ({sentiment['overall_score']:.0%})",
-                        "confidence": sentiment["overall_score"],
-                        "action": "WATCH_FUND",
-                    })
-                elif sentiment["overall_score"] < -0.7:
-                    alerts.append({
-                        "type": "SENTIMENT_DROP",
-                        "fund": fund,
-                        "title": f"📉 Negative Sentiment: {fund}",
-                        "message": f"Strong negative sentiment ({abs(sentiment['overall_score']):.0%})",
-                        "confidence": abs(sentiment["overall_score"]),
-                        "action": "CAUTION_FUND",
-                    })
-            
-            # Alert 4: Price Volatility
-            price_data = next((p for p in prices if p["fund"] == fund), None)
-            if price_data and abs(price_data["change"]) > 5:
+            elif sentiment["overall_score"] < -0.7:
                 alerts.append({
-                    "type": "HIGH_VOLATILITY",
+                    "type": "SENTIMENT_DROP",
                     "fund": fund,
-                    "title": f"⚡ High Volatility: {fund}",
-                    "message": f"{price_data['change']:.1f}% price movement",
-                    "confidence": 0.9,
-                    "action": "MONITOR_CLOSELY",
+                    "title": f"📉 Negative Sentiment: {fund}",
+                    "message": f"Strong negative sentiment ({abs(sentiment['overall_score']):.0%})",
+                    "confidence": abs(sentiment["overall_score"]),
+                    "action": "CAUTION_FUND",
                 })
-        
+
+        # Alert 4: Price Volatility
+        if price_data and abs(price_data["change"]) > VOLATILITY_ALERT_PCT:
+            alerts.append({
+                "type": "HIGH_VOLATILITY",
+                "fund": fund,
+                "title": f"⚡ High Volatility: {fund}",
+                "message": f"{price_data['change']:.1f}% price movement",
+                "confidence": 0.9,
+                "action": "MONITOR_CLOSELY",
+            })
+
         return alerts
 
     async def get_trading_opportunities(self, min_confidence: float = 0.75) -> List[Dict]:
@@ -245,21 +511,27 @@ class AgentOrchestrator:
         }
 
 
+def _rounded(values: Optional[Dict], digits: int = 6) -> Optional[Dict]:
+    """Indicator values rounded so float noise does not count as a change"""
+    if values is None:
+        return None
+    return {k: round(v, digits) if isinstance(v, float) else v for k, v in values.items()}
+
+
 # Global orchestrator instance
 orchestrator = AgentOrchestrator()
 
 
-async def start_continuous_monitoring(interval_seconds: int = 30):
+async def start_continuous_monitoring(
+    price_interval: float = PRICE_INTERVAL,
+    sentiment_interval: float = SENTIMENT_INTERVAL,
+):
     """
     Start continuous monitoring in background
-    Runs orchestrator cycle every N seconds
+    Prices and sentiment each run on their own drift-free schedule;
+    both slow down while the markets behind the funds are closed
     """
-    logger.info(f"🚀 Starting continuous monitoring (every {interval_seconds}s)")
-    
-    while True:
-        try:
-            await orchestrator.run_full_cycle()
-            await asyncio.sleep(interval_seconds)
-        except Exception as e:
-            logger.error(f"❌ Monitoring error: {e}")
-            await asyncio.sleep(interval_seconds)
+    logger.info(f"🚀 Starting continuous monitoring (prices every {price_interval:g}s, sentiment every {sentiment_interval:g}s)")
+    scheduler.add("prices", orchestrator.update_prices, price_interval, jitter=PRICE_JITTER)
+    scheduler.add("sentiment", orchestrator.poll_sentiment, sentiment_interval, jitter=SENTIMENT_JITTER)
+    scheduler.start()
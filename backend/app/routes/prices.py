@@ -1,35 +1,60 @@
 """Price monitoring API routes"""
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from app.agents.price_monitor import PriceMonitor
+from app.agents.price_monitor import FUNDS, PriceMonitor
 from app.models.database import PriceHistory, get_db
+from app.orchestrator import orchestrator
+from app.services.snapshot import Snapshot, snapshot_store
 from datetime import datetime, timedelta
 
 router = APIRouter(prefix="/api/prices", tags=["prices"])
-monitor = PriceMonitor()
+
+
+async def _price_snapshot(refresh: bool) -> Snapshot:
+    """Latest snapshot, fetching live prices only when forced or not yet available"""
+    snapshot = snapshot_store.current()
+    if refresh or not snapshot.prices:
+        snapshot = await orchestrator.refresh_prices()
+    return snapshot
 
 
 @router.get("/current")
-async def get_current_prices():
+async def get_current_prices(refresh: bool = False):
     """Get current prices for all funds"""
-    prices = await monitor.monitor_all_funds()
-    return {"data": prices, "timestamp": datetime.now().isoformat()}
+    snapshot = await _price_snapshot(refresh)
+    return {
+        "data": list(snapshot.prices.values()),
+        "timestamp": snapshot.timestamp or datetime.now().isoformat(),
+        "version": snapshot.version,
+    }
 
 
 @router.get("/fund/{fund_name}")
-async def get_fund_price(fund_name: str):
+async def get_fund_price(fund_name: str, refresh: bool = False):
     """Get price for a specific fund"""
-    price = await monitor.fetch_price(fund_name)
+    snapshot = await _price_snapshot(refresh)
+    price = snapshot.prices.get(fund_name)
     if not price:
         raise HTTPException(status_code=404, detail="Fund not found")
-    return {"data": price}
+    return {"data": price, "version": snapshot.version}
 
 
 @router.get("/opportunities")
-async def get_price_opportunities():
+async def get_price_opportunities(refresh: bool = False):
     """Get detected price opportunities"""
-    opportunities = await monitor.detect_arbitrage()
-    return {"opportunities": opportunities, "count": len(opportunities)}
+    snapshot = await _price_snapshot(refresh)
+    opportunities = PriceMonitor.find_opportunities(list(snapshot.prices.values()))
+    return {"opportunities": opportunities, "count": len(opportunities), "version": snapshot.version}
+
+
+@router.get("/markets")
+async def get_market_status():
+    """Trading calendar state of the market behind each fund, and each fund's current poll interval"""
+    monitor = orchestrator.price_monitor
+    return {
+        "data": {fund_name: monitor.market_status(fund_name) for fund_name in FUNDS},
+        "polling": monitor.polling.get_stats(),
+    }
 
 
 @router.get("/history/{fund_name}")
@@ -1,68 +1,57 @@
 """Recommendation API routes"""
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from app.agents.recommendation_engine import RecommendationEngine
-from app.agents.price_monitor import PriceMonitor
-from app.agents.sentiment_analyzer import SentimentAnalyzer
 from app.models.database import TradeRecommendation, get_db
+from app.orchestrator import orchestrator
+from app.services.snapshot import Snapshot, snapshot_store
 from datetime import datetime
 
 router = APIRouter(prefix="/api/recommendations", tags=["recommendations"])
-rec_engine = RecommendationEngine()
-price_monitor = PriceMonitor()
-sentiment_analyzer = SentimentAnalyzer()
+rec_engine = orchestrator.recommendation_engine
 
 
-@router.get("/all")
-async def get_all_recommendations():
-    """Get recommendations for all funds"""
-    # Fetch current prices and sentiment
-    prices = await price_monitor.monitor_all_funds()
-    sentiments = await sentiment_analyzer.analyze_all_funds()
+async def _recommendation_snapshot(refresh: bool) -> Snapshot:
+    """Latest snapshot, running a full cycle only when forced or not yet available"""
+    snapshot = snapshot_store.current()
+    if refresh or not snapshot.recommendations:
+        snapshot = await orchestrator.refresh_all()
+    return snapshot
 
-    # Convert to dicts for recommendation engine
-    price_dict = {p["fund"]: p for p in prices}
-    sentiment_dict = {s["fund"]: s for s in sentiments}
 
-    # Generate recommendations
-    recommendations = await rec_engine.generate_all_recommendations(
-        price_dict, sentiment_dict
-    )
+@router.get("/all")
+async def get_all_recommendations(refresh: bool = False):
+    """Get recommendations for all funds"""
+    snapshot = await _recommendation_snapshot(refresh)
 
     return {
-        "recommendations": recommendations,
-        "timestamp": datetime.now().isoformat(),
+        "recommendations": list(snapshot.recommendations.values()),
+        "timestamp": snapshot.timestamp or datetime.now().isoformat(),
+        "version": snapshot.version,
     }
 
 
 @router.get("/opportunities")
-async def get_top_opportunities():
+async def get_top_opportunities(refresh: bool = False):
     """Get top trading opportunities"""
-    # Fetch current data
-    prices = await price_monitor.monitor_all_funds()
-    sentiments = await sentiment_analyzer.analyze_all_funds()
-
-    price_dict = {p["fund"]: p for p in prices}
-    sentiment_dict = {s["fund"]: s for s in sentiments}
-
-    recommendations = await rec_engine.generate_all_recommendations(
-        price_dict, sentiment_dict
-    )
+    snapshot = await _recommendation_snapshot(refresh)
 
-    top_3 = rec_engine.get_top_opportunities(recommendations, limit=3)
+    top_3 = rec_engine.get_top_opportunities(list(snapshot.recommendations.values()), limit=3)
 
     return {
         "top_opportunities": top_3,
         "count": len(top_3),
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": snapshot.timestamp or datetime.now().isoformat(),
+        "version": snapshot.version,
     }
 
 
 @router.get("/risk/{fund_name}")
-async def get_risk_assessment(fund_name: str):
+async def get_risk_assessment(fund_name: str, refresh: bool = False):
     """Get risk score for a fund"""
-    prices = await price_monitor.monitor_all_funds()
-    price_data = next((p for p in prices if p["fund"] == fund_name), None)
+    snapshot = snapshot_store.current()
+    if refresh or fund_name not in snapshot.prices:
+        snapshot = await orchestrator.refresh_prices()
+    price_data = snapshot.prices.get(fund_name)
 
     if not price_data:
         return {"error": "Fund not found"}
@@ -75,4 +64,5 @@ async def get_risk_assessment(fund_name: str):
         "risk_score": risk_score,
         "risk_level": "HIGH" if risk_score > 60 else "MEDIUM" if risk_score > 40 else "LOW",
         "volatility": volatility,
+        "version": snapshot.version,
     }
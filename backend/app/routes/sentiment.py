@@ -1,40 +1,95 @@
 """Sentiment analysis API routes"""
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
-from app.agents.sentiment_analyzer import SentimentAnalyzer
-from app.models.database import SentimentRecord, get_db
-from datetime import datetime
+from app.agents.price_monitor import FUNDS
+from app.models.database import SentimentRecord, SentimentRollup, get_db
+from app.orchestrator import orchestrator
+from app.services.rollups import RESOLUTIONS, rollup_to_point
+from app.services.snapshot import Snapshot, snapshot_store
+from app.services.text_scorer import score_batch
+from app.services.trending import TRENDING_TOP_K, trending_engine
+from datetime import datetime, timedelta
 
 router = APIRouter(prefix="/api/sentiment", tags=["sentiment"])
-analyzer = SentimentAnalyzer()
+analyzer = orchestrator.sentiment_analyzer
+
+MAX_BATCH_TEXTS = 10000
+
+
+class BatchAnalyzeRequest(BaseModel):
+    """Texts to score in one request"""
+    texts: List[str] = Field(..., max_length=MAX_BATCH_TEXTS)
+    fund_name: Optional[str] = None
+
+
+async def _sentiment_snapshot(refresh: bool) -> Snapshot:
+    """Latest snapshot, fetching live sentiment only when forced or not yet available"""
+    snapshot = snapshot_store.current()
+    if refresh or not snapshot.sentiments:
+        snapshot = await orchestrator.refresh_sentiment()
+    return snapshot
 
 
 @router.get("/all")
-async def get_all_sentiment():
+async def get_all_sentiment(refresh: bool = False):
     """Get sentiment analysis for all funds"""
-    sentiments = await analyzer.analyze_all_funds()
+    snapshot = await _sentiment_snapshot(refresh)
     return {
-        "data": sentiments,
-        "timestamp": datetime.now().isoformat(),
+        "data": list(snapshot.sentiments.values()),
+        "timestamp": snapshot.timestamp or datetime.now().isoformat(),
+        "version": snapshot.version,
     }
 
 
 @router.get("/fund/{fund_name}")
-async def get_fund_sentiment(fund_name: str):
+async def get_fund_sentiment(fund_name: str, refresh: bool = False):
     """Get sentiment for a specific fund"""
-    sentiment = await analyzer.fetch_sentiment_for_fund(fund_name)
+    snapshot = await _sentiment_snapshot(refresh)
+    sentiment = snapshot.sentiments.get(fund_name)
     if not sentiment:
         raise HTTPException(status_code=404, detail="Fund not found")
-    return {"data": sentiment}
+    return {"data": sentiment, "version": snapshot.version}
+
+
+@router.get("/history/{fund_name}")
+async def get_sentiment_history(
+    fund_name: str, days: int = 7, resolution: str = "hour", db: Session = Depends(get_db)
+):
+    """Get sentiment history for a fund as hourly or daily rollups"""
+    if resolution not in RESOLUTIONS:
+        raise HTTPException(status_code=400, detail=f"resolution must be one of {list(RESOLUTIONS)}")
+    start_date = datetime.utcnow() - timedelta(days=days)
+
+    # Served from pre-aggregated buckets, never from raw SentimentRecord rows
+    rollups = (
+        db.query(SentimentRollup)
+        .filter(
+            SentimentRollup.fund_name == fund_name,
+            SentimentRollup.resolution == resolution,
+            SentimentRollup.bucket_start >= start_date,
+        )
+        .order_by(SentimentRollup.bucket_start)
+        .all()
+    )
+
+    return {
+        "fund": fund_name,
+        "days": days,
+        "resolution": resolution,
+        "data": [rollup_to_point(r) for r in rollups],
+    }
 
 
 @router.get("/trending/{fund_name}")
-async def get_trending_keywords(fund_name: str):
-    """Get trending keywords for a fund"""
-    keywords = await analyzer.get_trending_keywords(fund_name)
+async def get_trending_keywords(fund_name: str, k: int = Query(10, ge=1, le=TRENDING_TOP_K)):
+    """Get trending keywords for a fund (top and rising terms from precomputed state)"""
+    keywords = await analyzer.get_trending_keywords(fund_name, k)
     return {
         "fund": fund_name,
         "trending_keywords": keywords,
+        "terms": trending_engine.snapshot(fund_name, k),
         "timestamp": datetime.now().isoformat(),
     }
 
@@ -42,14 +97,8 @@ async def get_trending_keywords(fund_name: str):
 @router.get("/alerts")
 async def get_sentiment_alerts():
     """Get sentiment-based trading alerts"""
-    funds = [
-        "halan_saving",
-        "az_gold",
-        "az_opportunity",
-        "az_shariah",
-    ]
     alerts = []
-    for fund in funds:
+    for fund in FUNDS:
         alert = analyzer.get_sentiment_alert(fund)
         if alert:
             alerts.append({"fund": fund, "alert": alert})
@@ -62,3 +111,18 @@ async def analyze_text(text: str, fund_name: str):
     """Analyze sentiment of custom text"""
     result = await analyzer.analyze_tweet(text, fund_name)
     return {"data": result}
+
+
+@router.post("/analyze/batch")
+async def analyze_batch(request: BatchAnalyzeRequest):
+    """Score up to MAX_BATCH_TEXTS texts with the precompiled lexicon scorer"""
+    results = await score_batch(request.texts, request.fund_name)
+    counts = {"positive": 0, "neutral": 0, "negative": 0}
+    for result in results:
+        counts[result["sentiment"]] += 1
+    return {
+        "data": results,
+        "count": len(results),
+        "summary": counts,
+        "timestamp": datetime.now().isoformat(),
+    }
@@ -0,0 +1,55 @@
+"""Live stream API routes (Server-Sent Events and WebSocket)"""
+import asyncio
+from fastapi import APIRouter, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from app.services.broadcaster import cycle_broadcaster
+
+router = APIRouter(prefix="/api/stream", tags=["stream"])
+
+KEEPALIVE_SECONDS = 15
+
+
+@router.get("/cycles")
+async def stream_cycles_sse(request: Request):
+    """Stream every orchestrator cycle result as Server-Sent Events"""
+
+    async def event_stream():
+        queue = cycle_broadcaster.subscribe()
+        try:
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle connection
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: cycle\ndata: {message}\n\n"
+        finally:
+            cycle_broadcaster.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def stream_cycles_ws(websocket: WebSocket):
+    """Stream every orchestrator cycle result over a WebSocket"""
+    await websocket.accept()
+    queue = cycle_broadcaster.subscribe()
+    try:
+        while True:
+            message = await queue.get()
+            await websocket.send_text(message)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        cycle_broadcaster.unsubscribe(queue)
+
+
+@router.get("/stats")
+async def stream_stats():
+    """Subscriber and delivery counters"""
+    return cycle_broadcaster.get_stats()
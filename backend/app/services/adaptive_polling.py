@@ -0,0 +1,129 @@
+"""Adaptive Polling Service - Per-fund poll intervals driven by realized volatility"""
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+POLL_MIN_INTERVAL = float(os.getenv("PRICE_POLL_MIN_SECONDS", "10"))
+POLL_MAX_INTERVAL = float(os.getenv("PRICE_POLL_MAX_SECONDS", "300"))
+POLL_BACKOFF = float(os.getenv("PRICE_POLL_BACKOFF", "2"))
+# Poll often enough that the typical move between two polls stays below this fraction
+POLL_TARGET_MOVE = float(os.getenv("PRICE_POLL_TARGET_MOVE", "0.0005"))
+VOLATILITY_WINDOW = 30  # ticks
+
+
+def realized_volatility(prices: np.ndarray, timestamps: np.ndarray) -> Optional[float]:
+    """
+    RMS log return per sqrt(second) over the given ticks. Returns are scaled
+    by the time between ticks, so irregular (adaptive) spacing does not bias
+    the estimate; None until there are two ticks to compare.
+    """
+    prices = np.asarray(prices, dtype=float)
+    timestamps = np.asarray(timestamps, dtype=float)
+    dt = np.diff(timestamps)
+    valid = (dt > 0) & (prices[1:] > 0) & (prices[:-1] > 0)
+    if not valid.any():
+        return None
+    returns = np.log(prices[1:][valid] / prices[:-1][valid])
+    return float(np.sqrt(np.mean(returns ** 2 / dt[valid])))
+
+
+@dataclass
+class PollState:
+    interval: float
+    next_due: float = 0.0
+    last_polled: Optional[float] = None
+    volatility: Optional[float] = None
+    urgent: bool = False
+
+
+class AdaptivePolling:
+    """
+    Decides which funds are due for a price poll.
+
+    After each poll a fund's interval is set from its realized volatility:
+    the interval at which the expected move is ``target_move``. Quiet funds
+    back off gradually (``backoff`` x per poll), volatile ones tighten at
+    once, and funds flagged urgent (near an alert or signal threshold) are
+    polled at ``min_interval``. Intervals stay within [min, max].
+    """
+
+    def __init__(
+        self,
+        min_interval: float = POLL_MIN_INTERVAL,
+        max_interval: float = POLL_MAX_INTERVAL,
+        backoff: float = POLL_BACKOFF,
+        target_move: float = POLL_TARGET_MOVE,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.backoff = backoff
+        self.target_move = target_move
+        self.clock = clock
+        self.states: Dict[str, PollState] = {}
+
+    def is_due(self, fund_name: str, now: Optional[float] = None) -> bool:
+        """Whether a fund should be polled now (unknown funds always are)"""
+        state = self.states.get(fund_name)
+        now = self.clock() if now is None else now
+        # Half a tick of slack so a scheduler tick landing just short of the due time still counts
+        return state is None or now >= state.next_due - self.min_interval / 2
+
+    def observe(
+        self,
+        fund_name: str,
+        prices: np.ndarray,
+        timestamps: np.ndarray,
+        urgent: bool = False,
+        now: Optional[float] = None,
+    ) -> float:
+        """Record a poll of ``fund_name`` with its recent ticks; returns the next interval"""
+        now = self.clock() if now is None else now
+        state = self.states.setdefault(fund_name, PollState(interval=self.min_interval))
+        state.volatility = realized_volatility(prices[-VOLATILITY_WINDOW:], timestamps[-VOLATILITY_WINDOW:])
+        state.urgent = urgent
+
+        if urgent:
+            interval = self.min_interval
+        elif state.volatility is None:
+            interval = state.interval
+        else:
+            # Interval at which the expected move reaches the target: (target / vol)^2
+            target = (self.target_move / state.volatility) ** 2 if state.volatility > 0 else math.inf
+            if target > state.interval:
+                interval = min(state.interval * self.backoff, target)  # quiet: back off step by step
+            else:
+                interval = target  # volatile: tighten immediately
+        state.interval = min(max(interval, self.min_interval), self.max_interval)
+        state.last_polled = now
+        state.next_due = now + state.interval
+        return state.interval
+
+    def expedite(self, fund_name: str):
+        """Flag a fund urgent between polls: its next poll comes within ``min_interval``"""
+        state = self.states.get(fund_name)
+        if state is None or state.urgent:
+            return
+        state.urgent = True
+        state.interval = self.min_interval
+        if state.last_polled is not None:
+            state.next_due = min(state.next_due, state.last_polled + self.min_interval)
+
+    def get_stats(self) -> Dict:
+        now = self.clock()
+        return {
+            fund_name: {
+                "interval_seconds": round(state.interval, 1),
+                "due_in_seconds": round(max(0.0, state.next_due - now), 1),
+                "volatility": state.volatility,
+                "urgent": state.urgent,
+            }
+            for fund_name, state in self.states.items()
+        }
@@ -0,0 +1,410 @@
+"""Backtest Service - Replays stored history through the recommendation and trading rules"""
+import argparse
+import itertools
+import logging
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import select
+
+from app.agents.recommendation_engine import RecommendationEngine
+from app.models.database import PriceHistory, SentimentRecord, SessionLocal
+from app.services.indicators import bollinger, wilder_rsi_series
+from app.services.trading_service import TradingService
+
+logger = logging.getLogger(__name__)
+
+# Signal codes used in the vectorized classification
+STRONG_SELL, SELL, HOLD, BUY, STRONG_BUY = -2, -1, 0, 1, 2
+SIGNAL_NAMES = {STRONG_SELL: "STRONG_SELL", SELL: "SELL", HOLD: "HOLD", BUY: "BUY", STRONG_BUY: "STRONG_BUY"}
+
+STARTING_BALANCE = 500000.0  # TradingService paper balance
+
+
+@dataclass(frozen=True)
+class BacktestParams:
+    """One point in parameter space; defaults mirror the live engine and trading rules"""
+    strong_buy_drop: float = RecommendationEngine.THRESHOLDS["STRONG_BUY"]["price_drop"]
+    strong_buy_sentiment: float = RecommendationEngine.THRESHOLDS["STRONG_BUY"]["sentiment"]
+    buy_drop: float = RecommendationEngine.THRESHOLDS["BUY"]["price_drop"]
+    buy_sentiment: float = RecommendationEngine.THRESHOLDS["BUY"]["sentiment"]
+    strong_sell_rise: float = RecommendationEngine.THRESHOLDS["STRONG_SELL"]["price_rise"]
+    strong_sell_sentiment: float = RecommendationEngine.THRESHOLDS["STRONG_SELL"]["sentiment"]
+    sell_rise: float = RecommendationEngine.THRESHOLDS["SELL"]["price_rise"]
+    sell_sentiment: float = RecommendationEngine.THRESHOLDS["SELL"]["sentiment"]
+    rsi_oversold: float = RecommendationEngine.RSI_OVERSOLD
+    rsi_overbought: float = RecommendationEngine.RSI_OVERBOUGHT
+    min_band_width: float = RecommendationEngine.MIN_BAND_WIDTH
+    auto_trade_confidence: float = TradingService.AUTO_TRADE_CONFIDENCE
+    position_size: float = TradingService.PAPER_POSITION_SIZE
+    trade_size_limit: float = float(os.getenv("TRADE_SIZE_LIMIT", "50000.0"))
+    daily_spend_limit: float = float(os.getenv("DAILY_SPEND_LIMIT", "250000.0"))
+    hit_horizon_seconds: float = 3600.0  # a trade is a hit if price moved its way within this horizon
+
+
+@dataclass
+class FundSeries:
+    """Aligned per-tick arrays for one fund; parameter-independent inputs are precomputed"""
+    fund: str
+    timestamps: np.ndarray  # epoch seconds (UTC), ascending
+    prices: np.ndarray
+    changes: np.ndarray  # daily change %, as the engine sees it
+    sentiment: np.ndarray  # latest sentiment score as of each tick
+    rsi: np.ndarray
+    percent_b: np.ndarray
+    band_width: np.ndarray
+
+    @classmethod
+    def build(
+        cls,
+        fund: str,
+        timestamps: Sequence[float],
+        prices: Sequence[float],
+        changes: Sequence[float],
+        sentiment_timestamps: Sequence[float] = (),
+        sentiment_scores: Sequence[float] = (),
+    ) -> "FundSeries":
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+
+        # As-of join: each tick sees the most recent sentiment record (0 before the first)
+        sentiment_timestamps = np.asarray(sentiment_timestamps, dtype=np.float64)
+        scores = np.concatenate([[0.0], np.asarray(sentiment_scores, dtype=np.float64)])
+        sentiment = scores[np.searchsorted(sentiment_timestamps, timestamps, side="right")]
+
+        middle, upper, lower = bollinger(prices[np.newaxis, :])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            percent_b = ((prices - lower) / (upper - lower))[0]
+            band_width = ((upper - lower) / middle)[0]
+
+        return cls(
+            fund=fund,
+            timestamps=timestamps,
+            prices=prices,
+            changes=np.nan_to_num(np.asarray(changes, dtype=np.float64)),
+            sentiment=sentiment,
+            rsi=wilder_rsi_series(prices, RecommendationEngine.RSI_PERIOD),
+            percent_b=percent_b,
+            band_width=band_width,
+        )
+
+
+def classify(series: FundSeries, params: BacktestParams) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized ``RecommendationEngine.generate_recommendation``: signal code
+    and confidence for every tick, with the same rule order as the engine.
+    """
+    p = params
+    change, sentiment, rsi = series.changes, series.sentiment, series.rsi
+    with np.errstate(invalid="ignore"):
+        bands_usable = np.isfinite(series.percent_b) & (series.band_width >= p.min_band_width)
+        below_band = bands_usable & (series.percent_b < 0)
+        above_band = bands_usable & (series.percent_b > 1)
+    oversold = rsi < p.rsi_oversold
+    overbought = rsi > p.rsi_overbought
+
+    conditions = [
+        (change < p.strong_buy_drop) & (sentiment > p.strong_buy_sentiment),
+        ((change < p.buy_drop) & (sentiment > p.buy_sentiment)) | oversold | below_band,
+        (change > p.strong_sell_rise) & (sentiment < p.strong_sell_sentiment),
+        ((change > p.sell_rise) & (sentiment < p.sell_sentiment)) | overbought | above_band,
+    ]
+    codes = np.select(conditions, [STRONG_BUY, BUY, STRONG_SELL, SELL], HOLD).astype(np.int8)
+    confidence = np.select(
+        conditions,
+        [
+            np.minimum(0.95, 0.6 + np.abs(change) / 10 + sentiment),
+            np.minimum(0.9, 0.5 + sentiment + 0.1 * oversold + 0.05 * below_band),
+            np.minimum(0.95, 0.6 + change / 10 - sentiment),
+            np.minimum(0.9, 0.5 - sentiment + 0.1 * overbought + 0.05 * above_band),
+        ],
+        0.7,
+    )
+    return codes, confidence
+
+
+def signal_changes(codes: np.ndarray, confidence: np.ndarray, prices: np.ndarray, params: BacktestParams) -> np.ndarray:
+    """
+    Ticks the orchestrator would auto-trade: a tradable STRONG signal that
+    differs from the last one traded, or follows a tick that left STRONG.
+    A low-confidence STRONG tick neither trades nor resets the signal.
+    """
+    strong = np.abs(codes) == STRONG_BUY
+    idx = np.flatnonzero(strong & (confidence > params.auto_trade_confidence) & (prices > 0))
+    if not len(idx):
+        return idx
+    last_reset = np.maximum.accumulate(np.where(strong, -1, np.arange(len(codes))))[idx]
+    changed = np.ones(len(idx), dtype=bool)
+    changed[1:] = (codes[idx[1:]] != codes[idx[:-1]]) | (last_reset[1:] > idx[:-1])
+    return idx[changed]
+
+
+def run_backtest(funds: List[FundSeries], params: BacktestParams) -> Dict:
+    """
+    Simulate the orchestrator's auto-trading over the history of all funds.
+
+    Like ``AgentOrchestrator._process_auto_trading`` only STRONG_BUY /
+    STRONG_SELL above the auto-trade confidence are traded, and only when the
+    fund's signal changed since it was last acted on, with a fixed paper
+    position size and the ``TradingService.validate_trade`` limits (trade
+    size, daily BUY spend across all funds). Sells close at most one
+    position's worth of units already held; there is no shorting.
+    """
+    events = []
+    for fund_no, series in enumerate(funds):
+        codes, confidence = classify(series, params)
+        idx = signal_changes(codes, confidence, series.prices, params)
+        if len(idx):
+            events.append(np.column_stack([series.timestamps[idx], np.full(len(idx), fund_no), idx, codes[idx]]))
+    events = np.concatenate(events) if events else np.empty((0, 4))
+    events = events[np.argsort(events[:, 0], kind="stable")]
+
+    # The daily limit is shared across funds, so trades are replayed in time order.
+    # Only signal ticks are visited; everything else stays vectorized.
+    units_held = [0.0] * len(funds)
+    fills: List[List[Tuple[int, float, float]]] = [[] for _ in funds]  # (tick, units, direction)
+    spent_by_day: Dict[int, float] = {}
+    rejected = skipped = 0
+    for timestamp, fund_no, i, code in events.tolist():
+        fund_no, i = int(fund_no), int(i)
+        price = funds[fund_no].prices[i]
+        if price <= 0:
+            continue
+        if code > 0:
+            amount = params.position_size
+            day = int(timestamp // 86400)
+            if amount > params.trade_size_limit or spent_by_day.get(day, 0.0) + amount > params.daily_spend_limit:
+                rejected += 1
+                continue
+            spent_by_day[day] = spent_by_day.get(day, 0.0) + amount
+            units = amount / price
+            units_held[fund_no] += units
+            fills[fund_no].append((i, units, 1.0))
+        else:
+            units = min(units_held[fund_no], params.position_size / price)
+            if units <= 0:
+                skipped += 1
+                continue
+            units_held[fund_no] -= units
+            fills[fund_no].append((i, -units, -1.0))
+
+    timeline = np.unique(np.concatenate([s.timestamps for s in funds])) if funds else np.empty(0)
+    portfolio_pnl = np.zeros(len(timeline))
+    per_fund = {}
+    hits = scored = 0
+    for series, fund_fills in zip(funds, fills):
+        pnl_curve = np.zeros(len(series.prices))
+        fund_hits = fund_scored = 0
+        if fund_fills:
+            ticks, unit_moves, directions = (np.array(column) for column in zip(*fund_fills))
+            ticks = ticks.astype(np.int64)
+            unit_delta = np.zeros(len(series.prices))
+            cash_delta = np.zeros(len(series.prices))
+            np.add.at(unit_delta, ticks, unit_moves)
+            np.add.at(cash_delta, ticks, -unit_moves * series.prices[ticks])
+            pnl_curve = np.cumsum(cash_delta) + np.cumsum(unit_delta) * series.prices
+
+            # Hit rate: did the price move the trade's way within the horizon?
+            horizon = np.searchsorted(series.timestamps, series.timestamps[ticks] + params.hit_horizon_seconds)
+            measurable = horizon < len(series.prices)
+            moves = series.prices[horizon[measurable]] - series.prices[ticks[measurable]]
+            fund_hits = int(np.sum(np.sign(moves) == directions[measurable]))
+            fund_scored = int(np.sum(measurable))
+
+        # Carry each fund's PnL forward onto the shared timeline
+        if len(series.timestamps):
+            position = np.searchsorted(series.timestamps, timeline, side="right") - 1
+            portfolio_pnl += np.where(position >= 0, pnl_curve[np.maximum(position, 0)], 0.0)
+
+        hits += fund_hits
+        scored += fund_scored
+        per_fund[series.fund] = {
+            "pnl": round(float(pnl_curve[-1]) if len(pnl_curve) else 0.0, 2),
+            "trades": len(fund_fills),
+            "hit_rate": round(fund_hits / fund_scored, 4) if fund_scored else None,
+        }
+
+    equity = STARTING_BALANCE + portfolio_pnl
+    peak = np.maximum.accumulate(equity) if len(equity) else equity
+    max_drawdown = float(np.max((peak - equity) / peak)) if len(equity) else 0.0
+    pnl = float(portfolio_pnl[-1]) if len(portfolio_pnl) else 0.0
+    trades = sum(len(f) for f in fills)
+
+    return {
+        "params": asdict(params),
+        "pnl": round(pnl, 2),
+        "return_pct": round(pnl / STARTING_BALANCE * 100, 4),
+        "trades": trades,
+        "buys": sum(1 for f in fills for fill in f if fill[2] > 0),
+        "sells": sum(1 for f in fills for fill in f if fill[2] < 0),
+        "rejected": rejected,
+        "skipped_sells": skipped,
+        "hit_rate": round(hits / scored, 4) if scored else None,
+        "max_drawdown": round(max_drawdown, 6),
+        "funds": per_fund,
+    }
+
+
+def grid_params(space: Dict[str, Sequence], base: Optional[BacktestParams] = None) -> List[BacktestParams]:
+    """Every combination of the given parameter values"""
+    base = base or BacktestParams()
+    names = list(space)
+    return [replace(base, **dict(zip(names, values))) for values in itertools.product(*(space[n] for n in names))]
+
+
+def random_params(
+    space: Dict[str, Tuple[float, float]], samples: int, base: Optional[BacktestParams] = None, seed: Optional[int] = None
+) -> List[BacktestParams]:
+    """``samples`` points drawn uniformly from (low, high) ranges"""
+    base = base or BacktestParams()
+    rng = random.Random(seed)
+    return [
+        replace(base, **{name: rng.uniform(low, high) for name, (low, high) in space.items()})
+        for _ in range(samples)
+    ]
+
+
+# Worker state: the series are shipped once per process, not once per task
+_worker_funds: List[FundSeries] = []
+
+
+def _init_worker(funds: List[FundSeries]):
+    global _worker_funds
+    _worker_funds = funds
+
+
+def _evaluate(params: BacktestParams) -> Dict:
+    return run_backtest(_worker_funds, params)
+
+
+def sweep(funds: List[FundSeries], candidates: List[BacktestParams], workers: Optional[int] = None) -> List[Dict]:
+    """Backtest every candidate across a process pool; results sorted by PnL (best first)"""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(candidates) <= 1:
+        results = [run_backtest(funds, params) for params in candidates]
+    else:
+        chunksize = max(1, len(candidates) // (workers * 4))
+        if multiprocessing.get_start_method() == "fork":
+            # Forked workers inherit the arrays copy-on-write, nothing is pickled
+            _init_worker(funds)
+            pool = ProcessPoolExecutor(max_workers=workers)
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(funds,))
+        with pool:
+            results = list(pool.map(_evaluate, candidates, chunksize=chunksize))
+    return sorted(results, key=lambda r: r["pnl"], reverse=True)
+
+
+def _epoch(timestamp: datetime) -> float:
+    # Stored timestamps are naive UTC
+    return timestamp.replace(tzinfo=timezone.utc).timestamp()
+
+
+def load_history(
+    start: datetime, end: Optional[datetime] = None, funds: Optional[List[str]] = None, session_factory=SessionLocal
+) -> List[FundSeries]:
+    """Load PriceHistory and SentimentRecord rows between ``start`` and ``end`` (naive UTC)"""
+    end = end or datetime.utcnow()
+    db = session_factory()
+    try:
+        price_rows = db.execute(
+            select(PriceHistory.fund_name, PriceHistory.timestamp, PriceHistory.price, PriceHistory.change_percent)
+            .where(PriceHistory.timestamp >= start, PriceHistory.timestamp <= end)
+            .order_by(PriceHistory.fund_name, PriceHistory.timestamp)
+        ).all()
+        sentiment_rows = db.execute(
+            select(SentimentRecord.fund_name, SentimentRecord.timestamp, SentimentRecord.overall_score)
+            .where(SentimentRecord.timestamp >= start, SentimentRecord.timestamp <= end)
+            .order_by(SentimentRecord.fund_name, SentimentRecord.timestamp)
+        ).all()
+    finally:
+        db.close()
+
+    sentiment: Dict[str, Tuple[List[float], List[float]]] = {}
+    for fund_name, timestamp, score in sentiment_rows:
+        ts, scores = sentiment.setdefault(fund_name, ([], []))
+        ts.append(_epoch(timestamp))
+        scores.append(score or 0.0)
+
+    series = []
+    for fund_name, rows in itertools.groupby(price_rows, key=lambda row: row[0]):
+        if funds and fund_name not in funds:
+            continue
+        rows = list(rows)
+        series.append(
+            FundSeries.build(
+                fund_name,
+                [_epoch(row[1]) for row in rows],
+                [row[2] for row in rows],
+                [row[3] or 0.0 for row in rows],
+                *sentiment.get(fund_name, ([], [])),
+            )
+        )
+    return series
+
+
+# Default sweep spaces around the live thresholds
+DEFAULT_GRID = {
+    "strong_buy_drop": [-3.0, -2.0, -1.0],
+    "strong_buy_sentiment": [0.3, 0.5, 0.7],
+    "strong_sell_rise": [1.0, 2.0, 3.0],
+    "strong_sell_sentiment": [-0.7, -0.5, -0.3],
+    "auto_trade_confidence": [0.8, 0.85, 0.9],
+}
+DEFAULT_RANGES = {
+    "strong_buy_drop": (-5.0, 0.0),
+    "strong_buy_sentiment": (0.0, 0.9),
+    "strong_sell_rise": (0.0, 5.0),
+    "strong_sell_sentiment": (-0.9, 0.0),
+    "rsi_oversold": (15.0, 40.0),
+    "rsi_overbought": (60.0, 85.0),
+    "auto_trade_confidence": (0.7, 0.95),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtest recommendation thresholds against stored history")
+    parser.add_argument("--days", type=int, default=365, help="history to replay")
+    parser.add_argument("--mode", choices=["baseline", "grid", "random"], default="baseline")
+    parser.add_argument("--samples", type=int, default=200, help="random sweep size")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    started = time.perf_counter()
+    funds = load_history(datetime.utcnow() - timedelta(days=args.days))
+    ticks = sum(len(s.prices) for s in funds)
+    logger.info(f"📚 Loaded {ticks} ticks for {len(funds)} funds in {time.perf_counter() - started:.1f}s")
+
+    if args.mode == "grid":
+        candidates = grid_params(DEFAULT_GRID)
+    elif args.mode == "random":
+        candidates = random_params(DEFAULT_RANGES, args.samples, seed=args.seed)
+    else:
+        candidates = [BacktestParams()]
+
+    started = time.perf_counter()
+    results = sweep(funds, candidates, args.workers)
+    logger.info(f"✅ Evaluated {len(candidates)} parameter sets in {time.perf_counter() - started:.1f}s")
+
+    for rank, result in enumerate(results[: args.top], start=1):
+        print(
+            f"#{rank} pnl={result['pnl']:.2f} EGP trades={result['trades']} "
+            f"hit_rate={result['hit_rate']} max_dd={result['max_drawdown']:.4f}"
+        )
+        if args.mode != "baseline":
+            changed = {k: v for k, v in result["params"].items() if v != getattr(BacktestParams(), k)}
+            print(f"    {changed}")
+
+
+if __name__ == "__main__":
+    main()
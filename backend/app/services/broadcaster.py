@@ -0,0 +1,63 @@
+"""Broadcaster Service - Pushes orchestrator cycle results to live subscribers"""
+import asyncio
+import json
+import logging
+from typing import Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class CycleBroadcaster:
+    """
+    Fan out each cycle result to every connected SSE/WebSocket client.
+
+    Each subscriber gets a small bounded queue. Publishing never awaits: if a
+    client has not consumed its previous message, the stale one is dropped and
+    replaced by the latest, so a slow client can never block the cycle.
+    """
+
+    def __init__(self, queue_size: int = 1):
+        self.queue_size = queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+        self.last_message: Optional[str] = None
+        self.stats = {"published": 0, "dropped": 0}
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a client; it immediately receives the latest cycle if there is one"""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        if self.last_message is not None:
+            queue.put_nowait(self.last_message)
+        self._subscribers.add(queue)
+        logger.info(f"📡 Stream subscriber connected ({self.subscriber_count} total)")
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Remove a client"""
+        self._subscribers.discard(queue)
+        logger.info(f"📡 Stream subscriber disconnected ({self.subscriber_count} total)")
+
+    def publish(self, result: Dict):
+        """Serialize once and hand the message to every subscriber without blocking"""
+        message = json.dumps(result, default=str)
+        self.last_message = message
+        self.stats["published"] += 1
+
+        for queue in list(self._subscribers):
+            if queue.full():
+                try:
+                    queue.get_nowait()
+                    self.stats["dropped"] += 1
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(message)
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, "subscribers": self.subscriber_count}
+
+
+# Global broadcaster instance
+cycle_broadcaster = CycleBroadcaster()
@@ -0,0 +1,137 @@
+"""Dedup Service - Exact and near-duplicate detection of text items with a TTL"""
+import hashlib
+import re
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+WORD_RE = re.compile(r"\w+")
+# Syndicated headlines carry the outlet as a suffix: "Gold rallies - Reuters"
+PUBLISHER_SUFFIX_RE = re.compile(r"\s+[-–—|]\s+[^-–—|]{1,40}$")
+
+SIMHASH_BITS = 64
+BANDS = 4  # 4 x 16-bit bands: two hashes within 3 bits always share a band
+
+
+def normalize(text: str) -> List[str]:
+    """Lower-cased word tokens without a trailing publisher suffix, punctuation or spacing"""
+    return WORD_RE.findall(PUBLISHER_SUFFIX_RE.sub("", text.strip()).lower())
+
+
+def _hash64(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+
+
+def simhash(tokens: List[str]) -> int:
+    """64-bit SimHash over words and word bigrams"""
+    features = tokens + [" ".join(pair) for pair in zip(tokens, tokens[1:])]
+    if not features:
+        return 0
+    hashes = np.array([_hash64(f) for f in features], dtype=np.uint64)
+    bits = np.unpackbits(hashes.byteswap().view(np.uint8).reshape(-1, 8), axis=1)
+    votes = (2 * bits.astype(np.int32) - 1).sum(axis=0)
+    return int.from_bytes(np.packbits(votes > 0).tobytes(), "big")
+
+
+def _bands(fingerprint: int) -> List[Tuple[int, int]]:
+    width = SIMHASH_BITS // BANDS
+    mask = (1 << width) - 1
+    return [(band, (fingerprint >> (band * width)) & mask) for band in range(BANDS)]
+
+
+class FingerprintStore:
+    """
+    Remembers recently seen texts so each story is processed once.
+
+    ``add`` returns True only for unseen content. A text is a duplicate if
+    its normalized form hashes to a known digest (exact), or if its SimHash
+    is within ``max_distance`` bits of a known one (near duplicate, e.g. the
+    same headline syndicated with a different suffix). Candidates are found
+    through banded buckets, so lookups do not scan the whole store.
+    Fingerprints expire ``ttl`` seconds after they were last seen exactly.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 86400.0,
+        max_distance: int = 3,
+        max_items: int = 50000,
+        min_tokens: int = 4,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.ttl = ttl
+        self.max_distance = max_distance
+        self.max_items = max_items
+        self.min_tokens = min_tokens  # shorter texts only match exactly
+        self.clock = clock
+
+        self._exact: Dict[str, Tuple[float, Optional[int]]] = {}  # digest -> (expires, simhash)
+        self._expiry: Deque[Tuple[float, str]] = deque()
+        self._buckets: Dict[Tuple[int, int], Dict[int, int]] = {}  # band -> {simhash: refcount}
+        self.stats = {"unique": 0, "exact_duplicates": 0, "near_duplicates": 0, "expired": 0}
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def add(self, text: str) -> bool:
+        """Record ``text``; True if it was not seen (exactly or nearly) before"""
+        now = self.clock()
+        self._purge(now)
+
+        tokens = normalize(text)
+        digest = hashlib.sha1(" ".join(tokens).encode()).hexdigest()
+        known = self._exact.get(digest)
+        if known is not None:
+            # Still in the feed: keep it alive (refreshed at most every half TTL
+            # so re-sightings every cycle do not grow the expiry queue)
+            if known[0] - now < self.ttl / 2:
+                self._remember(digest, known[1], now)
+            self.stats["exact_duplicates"] += 1
+            return False
+
+        fingerprint = simhash(tokens) if len(tokens) >= self.min_tokens else None
+        if fingerprint is not None and self._has_near_duplicate(fingerprint):
+            self.stats["near_duplicates"] += 1
+            return False
+
+        self._remember(digest, fingerprint, now)
+        if fingerprint is not None:
+            for band in _bands(fingerprint):
+                bucket = self._buckets.setdefault(band, {})
+                bucket[fingerprint] = bucket.get(fingerprint, 0) + 1
+        self.stats["unique"] += 1
+        return True
+
+    def _has_near_duplicate(self, fingerprint: int) -> bool:
+        for band in _bands(fingerprint):
+            for candidate in self._buckets.get(band, ()):
+                if bin(candidate ^ fingerprint).count("1") <= self.max_distance:
+                    return True
+        return False
+
+    def _remember(self, digest: str, fingerprint: Optional[int], now: float):
+        expires = now + self.ttl
+        self._exact[digest] = (expires, fingerprint)
+        self._expiry.append((expires, digest))
+
+    def _purge(self, now: float):
+        while self._expiry and (self._expiry[0][0] <= now or len(self._exact) > self.max_items):
+            expires, digest = self._expiry.popleft()
+            entry = self._exact.get(digest)
+            if entry is None or entry[0] != expires:
+                continue  # refreshed later; a newer expiry entry exists
+            del self._exact[digest]
+            self.stats["expired"] += 1
+            if entry[1] is not None:
+                for band in _bands(entry[1]):
+                    bucket = self._buckets.get(band)
+                    bucket[entry[1]] -= 1
+                    if not bucket[entry[1]]:
+                        del bucket[entry[1]]
+                    if not bucket:
+                        del self._buckets[band]
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, "size": len(self._exact)}
@@ -0,0 +1,97 @@
+"""Dependency Graph Service - Per-fund dirty tracking with fingerprinted node outputs"""
+import hashlib
+import json
+from typing import Dict, Hashable, Iterable, List, Mapping, Sequence, Set, Tuple
+
+# Orchestrator pipeline: node -> nodes computed from it
+PIPELINE = {
+    "price": ("indicators", "recommendation", "alerts", "auto_trade"),
+    "sentiment": ("recommendation", "alerts"),
+    "indicators": ("recommendation",),
+    "recommendation": ("alerts", "auto_trade"),
+    "alerts": (),
+    "auto_trade": (),
+}
+
+
+def fingerprint(value) -> str:
+    """Stable short digest of a JSON-like value"""
+    encoded = json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(encoded.encode(), digest_size=8).hexdigest()
+
+
+class DependencyGraph:
+    """
+    Tracks, per fund, which nodes of a fixed graph need recomputing.
+
+    ``set`` records a node's latest value by fingerprint; when it differs
+    from the previous one the node's dependents become dirty for that fund.
+    A recomputed node whose output is unchanged therefore stops the
+    propagation (early cutoff). ``take`` hands out the funds a node must be
+    recomputed for, so work per cycle follows the changes, not the number of
+    funds. Nodes whose value changed are collected into a change set.
+    """
+
+    def __init__(self, dependents: Mapping[str, Sequence[str]] = PIPELINE):
+        self.dependents = {node: tuple(deps) for node, deps in dependents.items()}
+        self.order = self._topological_order()
+        self._fingerprints: Dict[Tuple[Hashable, str], str] = {}
+        self._dirty: Dict[str, Set[Hashable]] = {node: set() for node in self.order}
+        self._changed: Dict[str, Set[Hashable]] = {node: set() for node in self.order}
+
+    def _topological_order(self) -> List[str]:
+        nodes = set(self.dependents) | {d for deps in self.dependents.values() for d in deps}
+        indegree = {node: 0 for node in nodes}
+        for deps in self.dependents.values():
+            for dep in deps:
+                indegree[dep] += 1
+        ready = sorted(node for node, degree in indegree.items() if degree == 0)
+        order = []
+        while ready:
+            node = ready.pop(0)
+            order.append(node)
+            for dep in self.dependents.get(node, ()):
+                indegree[dep] -= 1
+                if not indegree[dep]:
+                    ready.append(dep)
+        if len(order) != len(nodes):
+            raise ValueError("Dependency graph has a cycle")
+        return order
+
+    def set(self, fund: Hashable, node: str, value) -> bool:
+        """Record a node's value for a fund; True (and dependents marked dirty) if it changed"""
+        digest = fingerprint(value)
+        key = (fund, node)
+        if self._fingerprints.get(key) == digest:
+            return False
+        self._fingerprints[key] = digest
+        self._changed[node].add(fund)
+        for dep in self.dependents.get(node, ()):
+            self._dirty[dep].add(fund)
+        return True
+
+    def mark(self, fund: Hashable, node: str):
+        """Force a node dirty for a fund (e.g. after an external reset)"""
+        self._dirty[node].add(fund)
+
+    def take(self, node: str) -> Set[Hashable]:
+        """Funds whose ``node`` must be recomputed; they are no longer dirty afterwards"""
+        funds = self._dirty[node]
+        self._dirty[node] = set()
+        return funds
+
+    def has_pending(self) -> bool:
+        return any(self._dirty.values())
+
+    def forget(self, funds: Iterable[Hashable]):
+        """Drop all state for funds that left the universe"""
+        funds = set(funds)
+        self._fingerprints = {k: v for k, v in self._fingerprints.items() if k[0] not in funds}
+        for node in self.order:
+            self._dirty[node] -= funds
+
+    def drain_changes(self) -> Dict[str, List[Hashable]]:
+        """Funds whose value changed per node since the last drain"""
+        changes = {node: sorted(funds) for node, funds in self._changed.items() if funds}
+        self._changed = {node: set() for node in self.order}
+        return changes
@@ -0,0 +1,190 @@
+"""Executor Service - Bounded thread pools for blocking I/O with a stuck-task watchdog"""
+import asyncio
+import itertools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when an executor's queue is full and new work is rejected"""
+    pass
+
+
+class BoundedExecutor:
+    """
+    Named thread pool for one class of blocking I/O (market data, RSS, ...).
+
+    Unlike ``asyncio.to_thread`` it does not share the loop's default executor,
+    and it caps queued + running work: a thread that keeps running after its
+    caller timed out still occupies a slot, so a slow upstream cannot pile up
+    unbounded threads. Excess work is rejected with ``ExecutorSaturatedError``.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int, stuck_after: float = 30.0):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.stuck_after = stuck_after
+
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._pending = 0  # queued + running
+        self._running: Dict[int, Dict] = {}
+        self._reported_stuck = set()
+        self._stats = {
+            "submitted": 0,
+            "rejected": 0,
+            "completed": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "total_run_time": 0.0,
+            "max_run_time": 0.0,
+            "total_queue_wait": 0.0,
+        }
+
+    async def run(self, fn: Callable, *args, timeout: Optional[float] = None):
+        """Run ``fn(*args)`` on this pool, optionally bounded by ``timeout`` seconds"""
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._stats["rejected"] += 1
+                raise ExecutorSaturatedError(
+                    f"Executor '{self.name}' saturated ({self._pending} tasks queued or running)"
+                )
+            self._pending += 1
+            self._stats["submitted"] += 1
+            task_id = next(self._ids)
+
+        submitted_at = time.monotonic()
+        future = self._pool.submit(self._invoke, task_id, submitted_at, fn, *args)
+        future.add_done_callback(self._on_done)
+
+        try:
+            if timeout is None:
+                return await asyncio.wrap_future(future)
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._stats["timeouts"] += 1
+            raise
+
+    def _invoke(self, task_id: int, submitted_at: float, fn: Callable, *args):
+        """Runs inside a worker thread; tracks start time for the watchdog"""
+        started_at = time.monotonic()
+        with self._lock:
+            self._running[task_id] = {
+                "task": getattr(fn, "__qualname__", repr(fn)),
+                "started_at": started_at,
+            }
+            self._stats["total_queue_wait"] += started_at - submitted_at
+
+        succeeded = False
+        try:
+            result = fn(*args)
+            succeeded = True
+            return result
+        finally:
+            elapsed = time.monotonic() - started_at
+            with self._lock:
+                self._running.pop(task_id, None)
+                self._reported_stuck.discard(task_id)
+                self._stats["completed" if succeeded else "failed"] += 1
+                self._stats["total_run_time"] += elapsed
+                self._stats["max_run_time"] = max(self._stats["max_run_time"], elapsed)
+
+    def _on_done(self, _future):
+        # Fires on completion and on cancellation of work that never started
+        with self._lock:
+            self._pending -= 1
+
+    def check_stuck(self) -> List[Dict]:
+        """Return tasks running longer than ``stuck_after``, logging each one once"""
+        now = time.monotonic()
+        stuck = []
+        with self._lock:
+            for task_id, info in self._running.items():
+                running_for = now - info["started_at"]
+                if running_for < self.stuck_after:
+                    continue
+                stuck.append({"id": task_id, "task": info["task"], "running_seconds": round(running_for, 1)})
+                if task_id not in self._reported_stuck:
+                    self._reported_stuck.add(task_id)
+                    logger.warning(
+                        f"⏳ Executor '{self.name}': task {info['task']} stuck for {running_for:.1f}s"
+                    )
+        return stuck
+
+    def get_stats(self) -> Dict:
+        """Queue depth and run-time metrics"""
+        with self._lock:
+            stats = dict(self._stats)
+            running = len(self._running)
+            pending = self._pending
+        finished = stats["completed"] + stats["failed"]
+        started = finished + running
+        return {
+            "name": self.name,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "running": running,
+            "queue_depth": max(0, pending - running),
+            "submitted": stats["submitted"],
+            "rejected": stats["rejected"],
+            "completed": stats["completed"],
+            "failed": stats["failed"],
+            "timeouts": stats["timeouts"],
+            "stuck": len(self.check_stuck()),
+            "avg_run_time": round(stats["total_run_time"] / finished, 4) if finished else 0.0,
+            "max_run_time": round(stats["max_run_time"], 4),
+            "avg_queue_wait": round(stats["total_queue_wait"] / started, 4) if started else 0.0,
+        }
+
+    def shutdown(self):
+        """Stop accepting work; running threads are not waited on"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Global executors, one per I/O class
+market_data_executor = BoundedExecutor(
+    "market-data",
+    max_workers=int(os.getenv("MARKET_DATA_WORKERS", "4")),
+    max_queue=int(os.getenv("MARKET_DATA_QUEUE", "8")),
+    stuck_after=30.0,
+)
+rss_executor = BoundedExecutor(
+    "rss",
+    max_workers=int(os.getenv("RSS_WORKERS", "8")),
+    max_queue=int(os.getenv("RSS_QUEUE", "32")),
+    stuck_after=15.0,
+)
+db_executor = BoundedExecutor(
+    "database",
+    max_workers=int(os.getenv("DB_WORKERS", "2")),
+    max_queue=int(os.getenv("DB_QUEUE", "16")),
+    stuck_after=30.0,
+)
+
+EXECUTORS = [market_data_executor, rss_executor, db_executor]
+
+
+def get_executor_stats() -> Dict[str, Dict]:
+    """Metrics for every registered executor"""
+    return {executor.name: executor.get_stats() for executor in EXECUTORS}
+
+
+async def run_watchdog(interval_seconds: float = 10.0):
+    """Periodically report stuck tasks on every registered executor"""
+    logger.info(f"🐕 Starting executor watchdog (every {interval_seconds}s)")
+    while True:
+        try:
+            for executor in EXECUTORS:
+                executor.check_stuck()
+        except Exception as e:
+            logger.error(f"❌ Executor watchdog error: {e}")
+        await asyncio.sleep(interval_seconds)
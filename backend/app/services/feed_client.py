@@ -0,0 +1,139 @@
+"""Feed Client Service - Async RSS fetching with conditional GET caching"""
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import feedparser
+
+from app.services.executors import BoundedExecutor, rss_executor
+from app.services.http_client import HttpClient, http_client
+
+logger = logging.getLogger(__name__)
+
+
+# How long a parsed feed is served without revalidating (one monitoring cycle)
+FEED_CACHE_TTL = float(os.getenv("FEED_CACHE_TTL", "30"))
+
+
+@dataclass
+class FeedIndex:
+    """Entries of a feed with their title + summary lower-cased once, for local filtering"""
+    entries: List = field(default_factory=list)
+    texts: List[str] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, feed: feedparser.FeedParserDict) -> "FeedIndex":
+        entries = list(feed.entries)
+        texts = [
+            f"{entry.get('title', '')} {entry.get('summary', entry.get('description', ''))}".lower()
+            for entry in entries
+        ]
+        return cls(entries, texts)
+
+    def __iter__(self) -> Iterator[Tuple[Dict, str]]:
+        return zip(self.entries, self.texts)
+
+
+@dataclass
+class CachedFeed:
+    """Parsed feed plus the validators the server sent with it"""
+    feed: feedparser.FeedParserDict
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    index: Optional[FeedIndex] = None
+
+
+class FeedClient:
+    """
+    RSS/Atom client on top of the shared HTTP pool.
+
+    For every URL it remembers the ETag / Last-Modified validators and the
+    parsed feed. Later polls send If-None-Match / If-Modified-Since, and a
+    304 returns the stored feed without downloading or re-parsing it. Only
+    changed feeds are parsed, on the RSS executor. At most ``max_feeds``
+    URLs are remembered (least recently used are forgotten first).
+
+    ``fetch_index`` adds a TTL layer for fixed feeds that are filtered
+    locally: within ``ttl`` seconds every query shares one download and one
+    lower-cased index, and concurrent callers share a single request.
+    """
+
+    def __init__(
+        self,
+        http: Optional[HttpClient] = None,
+        executor: Optional[BoundedExecutor] = None,
+        max_feeds: int = 256,
+    ):
+        self.http = http or http_client
+        self.executor = executor or rss_executor
+        self.max_feeds = max_feeds
+        self._feeds: "OrderedDict[str, CachedFeed]" = OrderedDict()
+        self._fresh_until: Dict[str, float] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.stats = {"requests": 0, "not_modified": 0, "parsed": 0, "bytes": 0, "index_hits": 0}
+
+    async def fetch(self, url: str, timeout: float = 5.0) -> feedparser.FeedParserDict:
+        """Return the parsed feed at ``url``, revalidating any stored copy"""
+        cached = self._feeds.get(url)
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        self.stats["requests"] += 1
+        response = await self.http.get_response(url, timeout=timeout, headers=headers or None)
+        self.stats["bytes"] += len(response.body)
+
+        if response.status == 304 and cached is not None:
+            self.stats["not_modified"] += 1
+            self._feeds.move_to_end(url)
+            return cached.feed
+
+        feed = await self.executor.run(feedparser.parse, response.body, timeout=timeout)
+        self.stats["parsed"] += 1
+        self._store(url, CachedFeed(feed, response.headers.get("ETag"), response.headers.get("Last-Modified")))
+        return feed
+
+    async def fetch_index(self, url: str, ttl: float = FEED_CACHE_TTL, timeout: float = 5.0) -> FeedIndex:
+        """Lower-cased entry index of a feed, refreshed at most once per ``ttl`` seconds"""
+        cached = self._feeds.get(url)
+        if cached is not None and cached.index is not None and time.monotonic() < self._fresh_until.get(url, 0):
+            self.stats["index_hits"] += 1
+            return cached.index
+
+        task = self._inflight.get(url)
+        if task is None or task.done():
+            task = asyncio.create_task(self._refresh_index(url, ttl, timeout))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        # Shield so one caller giving up does not cancel the shared download
+        return await asyncio.shield(task)
+
+    async def _refresh_index(self, url: str, ttl: float, timeout: float) -> FeedIndex:
+        feed = await self.fetch(url, timeout=timeout)
+        cached = self._feeds[url]
+        if cached.index is None or cached.feed is not feed:
+            cached.index = FeedIndex.build(feed)
+        # A 304 keeps the existing index: nothing is re-parsed or re-lowered
+        self._fresh_until[url] = time.monotonic() + ttl
+        return cached.index
+
+    def _store(self, url: str, entry: CachedFeed):
+        self._feeds[url] = entry
+        self._feeds.move_to_end(url)
+        while len(self._feeds) > self.max_feeds:
+            evicted, _ = self._feeds.popitem(last=False)
+            self._fresh_until.pop(evicted, None)
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, "feeds": len(self._feeds)}
+
+
+# Global feed client shared by all RSS sources
+feed_client = FeedClient()
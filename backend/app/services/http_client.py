@@ -0,0 +1,127 @@
+"""HTTP Client Service - One pooled aiohttp session shared for the app's lifetime"""
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+
+@dataclass
+class HttpResponse:
+    """Status, headers and body of a completed request"""
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+
+
+class HttpClient:
+    """
+    Process-wide HTTP connection pool.
+
+    Connections are kept alive between cycles and DNS answers are cached, so
+    repeated requests to the same hosts skip the DNS/TCP/TLS handshakes.
+    ``limit_per_host`` caps parallel connections to any single upstream.
+    The session is opened at startup and closed at shutdown; code running
+    outside the app (scripts, tests) gets one created on first use.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 8,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+        timeout: float = 10.0,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats = {"requests": 0, "errors": 0, "sessions_created": 0}
+
+    async def start(self):
+        """Open the shared session"""
+        self._get_session()
+        logger.info(f"🌐 HTTP pool ready (limit={self.limit}, per_host={self.limit_per_host})")
+
+    async def close(self):
+        """Close the shared session and its connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        return self._get_session()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            # A session is tied to its event loop; recreate it if the loop changed
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=DEFAULT_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._loop = loop
+            self.stats["sessions_created"] += 1
+        return self._session
+
+    async def get_json(self, url: str, timeout: Optional[float] = None, headers: Optional[Dict] = None):
+        """GET ``url`` and decode JSON; raises on non-2xx responses"""
+        return await self._get(url, timeout, headers, lambda resp: resp.json(content_type=None))
+
+    async def get_bytes(self, url: str, timeout: Optional[float] = None, headers: Optional[Dict] = None) -> bytes:
+        """GET ``url`` and return the raw body; raises on non-2xx responses"""
+        return await self._get(url, timeout, headers, lambda resp: resp.read())
+
+    async def get_response(self, url: str, timeout: Optional[float] = None, headers: Optional[Dict] = None) -> HttpResponse:
+        """GET ``url`` keeping status and headers (e.g. for conditional requests); raises on 4xx/5xx"""
+        async def read(resp):
+            return HttpResponse(resp.status, resp.headers.copy(), await resp.read())
+        return await self._get(url, timeout, headers, read)
+
+    async def _get(self, url: str, timeout: Optional[float], headers: Optional[Dict], read):
+        self.stats["requests"] += 1
+        # Without an explicit timeout the session default applies
+        options = {"timeout": aiohttp.ClientTimeout(total=timeout)} if timeout else {}
+        try:
+            async with self.session.get(url, headers=headers, **options) as resp:
+                resp.raise_for_status()
+                return await read(resp)
+        except Exception:
+            self.stats["errors"] += 1
+            raise
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            "open": bool(self._session and not self._session.closed),
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+        }
+
+
+# Global HTTP client shared by all sources
+http_client = HttpClient(
+    limit=int(os.getenv("HTTP_POOL_LIMIT", "100")),
+    limit_per_host=int(os.getenv("HTTP_POOL_PER_HOST", "8")),
+    dns_cache_ttl=int(os.getenv("HTTP_DNS_CACHE_TTL", "300")),
+)
@@ -0,0 +1,233 @@
+"""Indicators Service - Technical indicators for the recommendation engine"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from app.services.ring_buffer import PriceRingBuffer
+
+
+class WilderRSI:
+    """
+    Incremental Relative Strength Index with Wilder smoothing.
+
+    The first ``period`` changes seed simple averages of gains and losses;
+    after that each tick updates them in O(1):
+        avg = (avg * (period - 1) + current) / period
+    Ticks whose timestamp is not newer than the last one are ignored, so the
+    same tick can safely be offered more than once.
+    """
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.changes_seen = 0
+        self.last_price: Optional[float] = None
+        self.last_timestamp: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.changes_seen >= self.period
+
+    @property
+    def value(self) -> float:
+        """Current RSI (50.0 until ``period`` changes have been seen)"""
+        if not self.ready:
+            return 50.0
+        if self.avg_loss == 0:
+            # Only gains -> 100; no movement at all -> neutral
+            return 100.0 if self.avg_gain > 0 else 50.0
+        rs = self.avg_gain / self.avg_loss
+        return round(100 - (100 / (1 + rs)), 2)
+
+    def update(self, price: float, timestamp: Optional[float] = None) -> float:
+        """Feed one tick and return the updated RSI"""
+        if timestamp is not None:
+            if self.last_timestamp is not None and timestamp <= self.last_timestamp:
+                return self.value
+            self.last_timestamp = timestamp
+
+        price = float(price)
+        if self.last_price is None:
+            self.last_price = price
+            return self.value
+
+        change = price - self.last_price
+        self.last_price = price
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+
+        self.changes_seen += 1
+        if self.changes_seen <= self.period:
+            # Seed phase: accumulate a simple average over the first period
+            self.avg_gain += gain / self.period
+            self.avg_loss += loss / self.period
+        else:
+            self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+            self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+
+        return self.value
+
+    def backfill(self, prices: Iterable[float], timestamps: Optional[Iterable[float]] = None) -> "WilderRSI":
+        """Replay a price series (e.g. persisted history) into the state"""
+        if timestamps is None:
+            for price in prices:
+                self.update(price)
+        else:
+            for price, timestamp in zip(prices, timestamps):
+                self.update(price, float(timestamp))
+        return self
+
+
+def wilder_rsi(prices, period: int = 14) -> float:
+    """RSI of a whole price series (reference implementation of ``WilderRSI``)"""
+    return WilderRSI(period).backfill(np.asarray(prices, dtype=np.float64)).value
+
+
+def wilder_rsi_series(prices, period: int = 14) -> np.ndarray:
+    """RSI after every tick of a series, with the same smoothing as ``WilderRSI``"""
+    prices = np.asarray(prices, dtype=np.float64)
+    out = np.full(len(prices), 50.0)
+    if len(prices) <= period:
+        return out
+
+    delta = np.diff(prices)
+    gains = np.clip(delta, 0, None)
+    losses = np.clip(-delta, 0, None)
+    avg_gain = np.empty(len(delta) - period + 1)
+    avg_loss = np.empty_like(avg_gain)
+    g, l = float(gains[:period].mean()), float(losses[:period].mean())
+    avg_gain[0], avg_loss[0] = g, l
+    # The smoothing is recursive, so walk it once on plain floats
+    for k, (gain, loss) in enumerate(zip(gains[period:].tolist(), losses[period:].tolist()), start=1):
+        g = (g * (period - 1) + gain) / period
+        l = (l * (period - 1) + loss) / period
+        avg_gain[k], avg_loss[k] = g, l
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+    flat = avg_loss == 0
+    rsi[flat] = np.where(avg_gain[flat] > 0, 100.0, 50.0)
+    out[period:] = rsi
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Vectorized indicators over a funds x time matrix.
+# Rows are funds, columns are ticks (oldest first). Funds with a shorter
+# history are left-padded with NaN; every function tolerates that padding.
+# ---------------------------------------------------------------------------
+
+def build_price_matrix(histories: Dict[str, PriceRingBuffer], window: int) -> Tuple[List[str], np.ndarray]:
+    """Align the last ``window`` ticks of every fund into one NaN-padded matrix"""
+    funds = list(histories)
+    matrix = np.full((len(funds), window), np.nan)
+    for row, fund_name in enumerate(funds):
+        prices = histories[fund_name].prices(window)
+        if len(prices):
+            matrix[row, window - len(prices):] = prices
+    return funds, matrix
+
+
+def ema(matrix: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average along time, seeded at each row's first value"""
+    alpha = 2.0 / (span + 1)
+    out = np.empty_like(matrix, dtype=np.float64)
+    prev = matrix[:, 0].astype(np.float64)
+    out[:, 0] = prev
+    for t in range(1, matrix.shape[1]):
+        x = matrix[:, t]
+        blended = alpha * x + (1 - alpha) * prev
+        prev = np.where(np.isnan(prev), x, np.where(np.isnan(x), prev, blended))
+        out[:, t] = prev
+    return out
+
+
+def macd(matrix: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line and histogram (NaN until a row has ``slow`` ticks)"""
+    macd_line = ema(matrix, fast) - ema(matrix, slow)
+    ticks_seen = np.cumsum(~np.isnan(matrix), axis=1)
+    macd_line[ticks_seen < slow] = np.nan
+    signal_line = ema(macd_line, signal)
+    signal_line[ticks_seen < slow + signal - 1] = np.nan
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def _rolling(matrix: np.ndarray, window: int, reducer) -> np.ndarray:
+    """
+    Apply a reducer over a trailing window. Any window that touches NaN
+    padding yields NaN, so values only appear once a row has a full window.
+    """
+    out = np.full(matrix.shape, np.nan)
+    if matrix.shape[1] < window:
+        return out
+    windows = sliding_window_view(matrix, window, axis=1)
+    out[:, window - 1:] = reducer(windows, axis=-1)
+    return out
+
+
+def bollinger(matrix: np.ndarray, window: int = 20, num_std: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bollinger bands: (middle, upper, lower)"""
+    middle = _rolling(matrix, window, np.mean)
+    std = _rolling(matrix, window, np.std)
+    return middle, middle + num_std * std, middle - num_std * std
+
+
+def returns(matrix: np.ndarray) -> np.ndarray:
+    """Simple tick-to-tick returns (first column NaN)"""
+    out = np.full(matrix.shape, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[:, 1:] = np.diff(matrix, axis=1) / matrix[:, :-1]
+    return out
+
+
+def rolling_volatility(matrix: np.ndarray, window: int = 20) -> np.ndarray:
+    """Standard deviation of tick returns over a trailing window"""
+    return _rolling(returns(matrix), window, np.std)
+
+
+def average_range(matrix: np.ndarray, window: int = 14) -> np.ndarray:
+    """ATR-style average absolute tick-to-tick move (we only have closes, no high/low)"""
+    moves = np.full(matrix.shape, np.nan)
+    moves[:, 1:] = np.abs(np.diff(matrix, axis=1))
+    return _rolling(moves, window, np.mean)
+
+
+def _last(values: np.ndarray) -> List[Optional[float]]:
+    return [None if np.isnan(v) else round(float(v), 6) for v in values[:, -1]]
+
+
+def compute_signals(histories: Dict[str, PriceRingBuffer], window: int = 200) -> Dict[str, Dict]:
+    """
+    Latest indicator values for every fund, computed in one vectorized pass.
+    Values are None until a fund has enough history for that indicator.
+    """
+    if not histories:
+        return {}
+
+    funds, matrix = build_price_matrix(histories, window)
+    macd_line, signal_line, histogram = macd(matrix)
+    middle, upper, lower = bollinger(matrix)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent_b = (matrix - lower) / (upper - lower)
+        band_width = (upper - lower) / middle
+
+    columns = {
+        "ema_12": _last(ema(matrix, 12)),
+        "ema_26": _last(ema(matrix, 26)),
+        "macd": _last(macd_line),
+        "macd_signal": _last(signal_line),
+        "macd_hist": _last(histogram),
+        "bb_middle": _last(middle),
+        "bb_upper": _last(upper),
+        "bb_lower": _last(lower),
+        "bb_percent_b": _last(np.where(np.isfinite(percent_b), percent_b, np.nan)),
+        "bb_width": _last(np.where(np.isfinite(band_width), band_width, np.nan)),
+        "volatility": _last(rolling_volatility(matrix)),
+        "avg_range": _last(average_range(matrix)),
+    }
+    return {
+        fund_name: {name: values[row] for name, values in columns.items()}
+        for row, fund_name in enumerate(funds)
+    }
@@ -0,0 +1,98 @@
+"""Keyword Matcher Service - Word-boundary matching against many lexicons in a single pass"""
+import re
+from collections import defaultdict
+from typing import Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Set
+
+_WORD_CHAR = re.compile(r"\w")
+
+
+class KeywordMatcher:
+    """
+    Matches every keyword of every lexicon with one precompiled regex.
+
+    All keywords are merged into a single alternation, longest first, inside a
+    lookahead, so one ``finditer`` over the text reports the longest keyword
+    starting at every word boundary. Shorter keywords starting at the same
+    spot are its precomputed prefixes, and each keyword maps to the
+    (group, labels) that own it, so one scan fills the counts for every
+    lexicon.
+
+    Lexicons are grouped (by default each lexicon is its own group). Within a
+    group matches do not overlap and the longest wins, so "non-compliant"
+    hides "compliant". Across groups they do: a keyword of one group never
+    hides an overlapping keyword of another ("safe haven" for gold still
+    leaves "safe" for savings). Matches must start and end on a word
+    boundary: "up" does not match "support" and "risk" does not match "brisk".
+    """
+
+    def __init__(
+        self,
+        lexicons: Mapping[Hashable, Iterable[str]],
+        group_of: Optional[Callable[[Hashable], Hashable]] = None,
+    ):
+        group_of = group_of or (lambda label: label)
+        # keyword -> group -> labels
+        owners: Dict[str, Dict[Hashable, List[Hashable]]] = defaultdict(lambda: defaultdict(list))
+        for label, keywords in lexicons.items():
+            for keyword in {k.strip().lower() for k in keywords if k.strip()}:
+                owners[keyword][group_of(label)].append(label)
+        self.labels = list(lexicons)
+        self._owners = {keyword: dict(groups) for keyword, groups in owners.items()}
+
+        # Keywords that also match wherever ``keyword`` does, longest first
+        self._prefixes: Dict[str, List[str]] = {
+            keyword: [
+                keyword[:i]
+                for i in range(len(keyword) - 1, 0, -1)
+                if keyword[:i] in self._owners and not _WORD_CHAR.match(keyword[i])
+            ]
+            for keyword in self._owners
+        }
+
+        alternation = "|".join(re.escape(k) for k in sorted(self._owners, key=len, reverse=True))
+        self._pattern = re.compile(rf"(?<!\w)(?=((?:{alternation})(?!\w)))", re.IGNORECASE) if alternation else None
+
+    @classmethod
+    def from_fund_lexicons(cls, fund_lexicons: Mapping[str, Mapping[str, Iterable[str]]]) -> "KeywordMatcher":
+        """Build from {fund: {"positive": [...], "negative": [...]}}; labels are (fund, polarity), one group per fund"""
+        return cls(
+            {
+                (fund, polarity): keywords
+                for fund, polarities in fund_lexicons.items()
+                for polarity, keywords in polarities.items()
+            },
+            group_of=lambda label: label[0],
+        )
+
+    def _scan(self, text: str) -> Dict[Hashable, Set[str]]:
+        """Distinct keywords found per group, from one pass over ``text``"""
+        found: Dict[Hashable, Set[str]] = defaultdict(set)
+        if self._pattern is None:
+            return found
+        group_end: Dict[Hashable, int] = {}
+        for match in self._pattern.finditer(text):
+            start, longest = match.start(), match.group(1).lower()
+            if longest not in self._owners:  # case folding changed the text
+                continue
+            taken = set()
+            for keyword in [longest, *self._prefixes[longest]]:
+                for group in self._owners[keyword]:
+                    if group in taken or group_end.get(group, 0) > start:
+                        continue
+                    taken.add(group)
+                    group_end[group] = start + len(keyword)
+                    found[group].add(keyword)
+        return found
+
+    def find(self, text: str) -> Set[str]:
+        """Distinct keywords present in ``text``"""
+        return {keyword for keywords in self._scan(text).values() for keyword in keywords}
+
+    def count(self, text: str) -> Dict[Hashable, int]:
+        """Number of distinct keywords from each lexicon found in ``text``"""
+        counts: Dict[Hashable, int] = dict.fromkeys(self.labels, 0)
+        for group, keywords in self._scan(text).items():
+            for keyword in keywords:
+                for label in self._owners[keyword][group]:
+                    counts[label] += 1
+        return counts
@@ -0,0 +1,141 @@
+"""Market Calendar Service - Exchange sessions, weekends and holidays per proxy symbol"""
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_PATH = os.getenv(
+    "MARKET_CALENDAR_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "market_calendar.json"),
+)
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+SEARCH_DAYS = 10  # longest closure (weekend + holidays) a lookup will bridge
+
+
+def _minutes(hhmm: str) -> int:
+    hours, minutes = hhmm.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+@dataclass(frozen=True)
+class Market:
+    """Weekly sessions of one market in its local time zone, minus full-day holidays"""
+    name: str
+    tz: ZoneInfo
+    sessions: Dict[int, Tuple[Tuple[int, int], ...]]  # weekday -> ((start, end) minutes, ...)
+    holidays: FrozenSet[date]
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict) -> "Market":
+        sessions = {
+            WEEKDAYS.index(day): tuple((_minutes(start), _minutes(end)) for start, end in ranges)
+            for day, ranges in data.get("sessions", {}).items()
+        }
+        holidays = frozenset(date.fromisoformat(day) for day in data.get("holidays", []))
+        return cls(name=name, tz=ZoneInfo(data["timezone"]), sessions=sessions, holidays=holidays)
+
+    def _intervals(self, around: date) -> List[Tuple[datetime, datetime]]:
+        """Sessions from SEARCH_DAYS before to SEARCH_DAYS after ``around``, back-to-back ones merged"""
+        intervals: List[Tuple[datetime, datetime]] = []
+        for offset in range(-SEARCH_DAYS, SEARCH_DAYS + 1):
+            day = around + timedelta(days=offset)
+            if day in self.holidays:
+                continue
+            midnight = datetime.combine(day, time(0), tzinfo=self.tz)
+            for start, end in self.sessions.get(day.weekday(), ()):
+                opens, closes = midnight + timedelta(minutes=start), midnight + timedelta(minutes=end)
+                if intervals and intervals[-1][1] == opens:  # e.g. Sunday 18:00-24:00 then Monday 00:00-17:00
+                    intervals[-1] = (intervals[-1][0], closes)
+                else:
+                    intervals.append((opens, closes))
+        return intervals
+
+    def is_open(self, at: datetime) -> bool:
+        local = at.astimezone(self.tz)
+        return any(opens <= local < closes for opens, closes in self._intervals(local.date()))
+
+    def next_open(self, at: datetime) -> Optional[datetime]:
+        """Start of the next session after ``at`` (None if none within the search window)"""
+        local = at.astimezone(self.tz)
+        return next((opens for opens, _ in self._intervals(local.date()) if opens > local), None)
+
+    def last_close(self, at: datetime) -> Optional[datetime]:
+        """End of the latest session that closed at or before ``at``"""
+        local = at.astimezone(self.tz)
+        closed = [closes for _, closes in self._intervals(local.date()) if closes <= local]
+        return closed[-1] if closed else None
+
+
+class MarketCalendar:
+    """
+    Trading calendar for the proxy symbols behind fund prices.
+
+    Markets (sessions, time zone, holidays) and the symbol -> market mapping
+    come from a local JSON file, so closures are known without asking an
+    upstream. Symbols without a market are treated as always open.
+    """
+
+    def __init__(self, markets: Optional[Dict[str, Market]] = None, symbols: Optional[Dict[str, str]] = None):
+        self.markets = markets or {}
+        self.symbols = symbols or {}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "MarketCalendar":
+        markets = {name: Market.from_dict(name, spec) for name, spec in data.get("markets", {}).items()}
+        symbols = {symbol: market for symbol, market in data.get("symbols", {}).items() if market in markets}
+        return cls(markets, symbols)
+
+    @classmethod
+    def load(cls, path: str = CALENDAR_PATH) -> "MarketCalendar":
+        """Load the calendar file; without one every market counts as open"""
+        try:
+            with open(path) as f:
+                calendar = cls.from_dict(json.load(f))
+        except Exception as e:
+            logger.error(f"❌ Could not load market calendar from {path}, assuming markets are always open: {e}")
+            return cls()
+        logger.info(f"📅 Market calendar loaded: {', '.join(calendar.markets) or 'no markets'}")
+        return calendar
+
+    def market_for(self, symbol: str) -> Optional[Market]:
+        name = self.symbols.get(symbol)
+        return self.markets.get(name) if name else None
+
+    def is_open(self, symbol: str, at: Optional[datetime] = None) -> bool:
+        market = self.market_for(symbol)
+        return market is None or market.is_open(at or datetime.now(timezone.utc))
+
+    def last_close(self, symbol: str, at: Optional[datetime] = None) -> Optional[datetime]:
+        market = self.market_for(symbol)
+        return market.last_close(at or datetime.now(timezone.utc)) if market else None
+
+    def next_open(self, symbol: str, at: Optional[datetime] = None) -> Optional[datetime]:
+        market = self.market_for(symbol)
+        return market.next_open(at or datetime.now(timezone.utc)) if market else None
+
+    def status(self, symbol: str, at: Optional[datetime] = None) -> Dict:
+        """Open/closed state of a symbol's market with its last close and next open"""
+        at = at or datetime.now(timezone.utc)
+        market = self.market_for(symbol)
+        if market is None:
+            return {"symbol": symbol, "market": None, "open": True, "last_close": None, "next_open": None}
+        is_open = market.is_open(at)
+        last_close = market.last_close(at)
+        next_open = None if is_open else market.next_open(at)
+        return {
+            "symbol": symbol,
+            "market": market.name,
+            "open": is_open,
+            "last_close": last_close.isoformat() if last_close else None,
+            "next_open": next_open.isoformat() if next_open else None,
+        }
+
+
+# Global calendar loaded from app/data/market_calendar.json
+market_calendar = MarketCalendar.load()
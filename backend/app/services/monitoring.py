@@ -7,6 +7,12 @@ from datetime import datetime
 from typing import Dict
 from sqlalchemy.sql import text
 from app.models.database import SessionLocal
+from app.services.executors import get_executor_stats
+from app.services.feed_client import feed_client
+from app.services.http_client import http_client
+from app.services.quote_cache import quote_cache
+from app.services.scheduler import scheduler
+from app.services.write_behind import get_writer_stats
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +31,12 @@ class SystemMonitor:
             "environment": self._get_environment_info(),
             "resources": self._get_resource_usage(),
             "database": self._check_database_health(),
+            "quote_cache": quote_cache.get_stats(),
+            "executors": get_executor_stats(),
+            "writers": get_writer_stats(),
+            "http": http_client.get_stats(),
+            "feeds": feed_client.get_stats(),
+            "scheduler": scheduler.get_status(),
             "uptime_seconds": (datetime.now() - self.start_time).total_seconds()
         }
 
@@ -0,0 +1,117 @@
+"""Phase Executor Service - Runs a small DAG of async phases with per-phase deadlines"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Phase:
+    """
+    One step of a cycle. ``deadline`` is its latency budget in seconds from
+    when it starts; on a miss or an error ``fallback`` supplies the value to
+    continue with (typically the last known good data).
+    """
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+    deadline: Optional[float] = None
+    fallback: Optional[Callable[[], Any]] = None
+
+
+@dataclass
+class PhaseResult:
+    name: str
+    status: str  # "ok", "timeout" or "error"
+    value: Any
+    duration: float
+    error: Optional[str] = None
+
+    @property
+    def stale(self) -> bool:
+        """The value is a fallback rather than this run's output"""
+        return self.status != "ok"
+
+    def to_dict(self) -> Dict:
+        return {
+            "status": self.status,
+            "stale": self.stale,
+            "duration_seconds": round(self.duration, 3),
+            "error": self.error,
+        }
+
+
+class PhaseExecutor:
+    """
+    Runs phases as soon as their dependencies finish, so independent phases
+    overlap and a cycle takes as long as its critical path. A phase that
+    misses its deadline is cancelled and its fallback used instead; its
+    dependents still run, on that fallback, rather than the cycle stalling.
+    """
+
+    def __init__(self, phases: Iterable[Phase]):
+        self.phases = {phase.name: phase for phase in phases}
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        order: List[str] = []
+        visiting = set()
+
+        def visit(name: str):
+            if name in order:
+                return
+            if name in visiting:
+                raise ValueError(f"Phase dependency cycle through {name}")
+            if name not in self.phases:
+                raise ValueError(f"Unknown phase dependency: {name}")
+            visiting.add(name)
+            for dep in self.phases[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            order.append(name)
+
+        for name in self.phases:
+            visit(name)
+        return order
+
+    async def run(self) -> Dict[str, PhaseResult]:
+        """Run every phase; results by phase name (never raises for a failed phase)"""
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_after_dependencies(phase: Phase) -> PhaseResult:
+            if phase.depends_on:
+                await asyncio.gather(*(tasks[dep] for dep in phase.depends_on))
+            return await self._run_phase(phase)
+
+        # Topological order guarantees dependency tasks exist before their dependents
+        for name in self.order:
+            tasks[name] = asyncio.create_task(run_after_dependencies(self.phases[name]))
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        return {name: tasks[name].result() for name in self.order}
+
+    async def _run_phase(self, phase: Phase) -> PhaseResult:
+        started = time.monotonic()
+        status, value, error = "ok", None, None
+        try:
+            if phase.deadline is None:
+                value = await phase.func()
+            else:
+                value = await asyncio.wait_for(phase.func(), timeout=phase.deadline)
+        except asyncio.TimeoutError:
+            status, error = "timeout", f"missed its {phase.deadline:g}s deadline"
+            logger.warning(f"⏱️ Phase {phase.name} {error}, continuing with last known good data")
+        except Exception as e:
+            status, error = "error", str(e)
+            logger.error(f"❌ Phase {phase.name} failed, continuing with last known good data: {e}")
+
+        if status != "ok" and phase.fallback is not None:
+            value = phase.fallback()
+        return PhaseResult(phase.name, status, value, time.monotonic() - started, error)
@@ -3,8 +3,11 @@ import abc
 import logging
 import random
 import asyncio
+import time
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+from app.services.executors import market_data_executor
+from app.services.quote_cache import QuoteCache, quote_cache
 
 logger = logging.getLogger(__name__)
 
@@ -16,11 +19,25 @@ class BasePriceFetcher(abc.ABC):
         """Fetch price for a specific fund"""
         pass
 
+    def proxy_symbols(self, fund_name: str) -> List[str]:
+        """Market symbols a fund's price is derived from (none: not tied to a market)"""
+        return []
+
+    async def fetch_prices(self, funds: Dict[str, Dict]) -> Dict[str, Optional[Dict]]:
+        """Fetch prices for several funds (default: one fetch_price per fund)"""
+        results = await asyncio.gather(
+            *[self.fetch_price(fund_name, fund_data) for fund_name, fund_data in funds.items()]
+        )
+        return dict(zip(funds.keys(), results))
+
 
 class RealPriceFetcher(BasePriceFetcher):
     """Fetches real market data using yfinance proxies"""
+
+    FETCH_TIMEOUT = 20.0  # seconds before the caller gives up on a yfinance call
     
-    def __init__(self):
+    def __init__(self, cache: QuoteCache = None):
+        self.cache = cache or quote_cache
         try:
             import yfinance as yf
             self.yf = yf
@@ -34,92 +51,177 @@ class RealPriceFetcher(BasePriceFetcher):
             return None
             
         try:
-            # Run blocking yfinance calls in a separate thread to avoid blocking asyncio loop
-            return await asyncio.to_thread(self._fetch_sync, fund_name, fund_data)
+            # Run blocking yfinance calls on the bounded market-data pool to avoid blocking asyncio loop
+            return await market_data_executor.run(
+                self._fetch_sync, fund_name, fund_data, timeout=self.FETCH_TIMEOUT
+            )
         except Exception as e:
             logger.error(f"Real fetch failed for {fund_name}: {e}")
             return None
-            
+
+    async def fetch_prices(self, funds: Dict[str, Dict]) -> Dict[str, Optional[Dict]]:
+        """Fetch every fund from one bulk download of their unique proxy symbols"""
+        if not self.yf:
+            logger.error("RealPriceFetcher called but yfinance is missing.")
+            return {fund_name: None for fund_name in funds}
+
+        try:
+            return await market_data_executor.run(
+                self._fetch_many_sync, funds, timeout=self.FETCH_TIMEOUT
+            )
+        except Exception as e:
+            logger.error(f"Batch fetch failed for {list(funds)}: {e}")
+            return {fund_name: None for fund_name in funds}
+
+    def proxy_symbols(self, fund_name: str) -> List[str]:
+        """Yahoo symbols a fund's price is derived from"""
+        if "gold" in fund_name.lower():
+            return ["GC=F", "EGP=X"] # Gold Futures (USD) + USD/EGP for conversion
+        elif "saving" in fund_name.lower():
+            return [] # Savings is simulated 20% APY
+        else:
+            return ["^CASE30"] # EGX 30 Index (EGP)
+
     def _fetch_sync(self, fund_name: str, fund_data: Dict) -> Optional[Dict]:
         """Synchronous part of fetching to be run in thread"""
         try:
-            # 1. Get USD/EGP Rate (needed for Gold conversion)
-            egp_ticker = self.yf.Ticker("EGP=X")
-            egp_hist = egp_ticker.history(period="1d")
-            # Note: EGP=X is Quote is usually USD in EGP or EGP in USD. 
-            # Usually XXXYYY=X is how many YYY for 1 XXX.
-            # EGP=X on Yahoo often means USD/EGP. Let's assume ~50.
-            usd_egp = egp_hist['Close'].iloc[-1] if not egp_hist.empty else 50.0
-            
-            # 2. Determine Proxy Ticker
-            proxy_ticker_name = None
-            if "gold" in fund_name.lower():
-                proxy_ticker_name = "GC=F" # Gold Futures (USD)
-            elif "saving" in fund_name.lower():
-                # Savings is simulated 20% APY
-                return self._simulate_saving_growth(fund_name, fund_data)
-            else:
-                proxy_ticker_name = "^CASE30" # EGX 30 Index (EGP)
-            
-            # 3. Fetch Data
-            ticker = self.yf.Ticker(proxy_ticker_name)
-            hist = ticker.history(period="1d")
-            
-            if hist.empty:
-                logger.warning(f"No data for {proxy_ticker_name}")
-                return None
-                
-            current_val = hist['Close'].iloc[-1]
-            prev_close = hist['Open'].iloc[-1] # Close enough to Open for 1d view
-            
-            # 4. Calculate Derived Fund Price (EGP)
-            derived_price = 0.0
-            context_label = ""
-            
-            if "gold" in fund_name.lower():
-                # Gold USD/oz -> EGP/gram
-                # 1 oz = 31.1035 g
-                price_per_gram_usd = current_val / 31.1035
-                price_per_gram_egp = price_per_gram_usd * usd_egp
-                
-                # Azimut Gold is approx 26-30 EGP range (unit price).
-                derived_price = price_per_gram_egp / 130 # Approximation factor to match historical ~26
-                context_label = "Live Global Gold Futures (USD converted)"
-                
-            elif "opportunity" in fund_name.lower():
-                # EGX30 ~30,000. Fund ~60 EGP.
-                derived_price = current_val / 500
-                context_label = "Tracking EGX30 Index Performance"
-                
-            elif "shariah" in fund_name.lower():
-                # Shariah fund often behaves slightly differently.
-                derived_price = current_val / 530
-                context_label = "Tracking EGX30 Index Performance (Shariah Adjusted)"
-                
-            # Base change from the proxy index
-            raw_change = ((current_val - prev_close) / prev_close) * 100
-            
-            # Apply "Beta" (Volatilitiy) adjustments
-            if "shariah" in fund_name.lower():
-                change_pct = raw_change * 0.92 
-            else:
-                change_pct = raw_change
-
-            return {
-                "fund": fund_name,
-                "ticker": fund_data["ticker"],
-                "price": round(derived_price, 2),
-                "change": round(change_pct, 2),
-                "timestamp": datetime.now().isoformat(),
-                "volume": int(hist['Volume'].iloc[-1]) if 'Volume' in hist else 0,
-                "source": f"yfinance ({proxy_ticker_name})",
-                "context_label": context_label
-            }
-            
+            # Quotes are shared across funds through the quote cache
+            quotes = {symbol: self._get_quote(symbol) for symbol in self.proxy_symbols(fund_name)}
+            return self._derive_price(fund_name, fund_data, quotes)
         except Exception as e:
             logger.error(f"Error in _fetch_sync for {fund_name}: {e}")
             raise e
 
+    def _fetch_many_sync(self, funds: Dict[str, Dict]) -> Dict[str, Optional[Dict]]:
+        """Resolve the unique symbol set for all funds, fetch it once, then derive each fund"""
+        symbols = list(dict.fromkeys(
+            symbol for fund_name in funds for symbol in self.proxy_symbols(fund_name)
+        ))
+        quotes = self.cache.get_or_fetch_many(symbols, self._download_quotes) if symbols else {}
+
+        results = {}
+        for fund_name, fund_data in funds.items():
+            try:
+                results[fund_name] = self._derive_price(fund_name, fund_data, quotes)
+            except Exception as e:
+                logger.error(f"Error deriving price for {fund_name}: {e}")
+                results[fund_name] = None
+        return results
+
+    def _derive_price(self, fund_name: str, fund_data: Dict, quotes: Dict[str, Optional[Dict]]) -> Optional[Dict]:
+        """Turn raw proxy quotes into the fund's derived EGP price"""
+        if "saving" in fund_name.lower():
+            return self._simulate_saving_growth(fund_name, fund_data)
+
+        # 1. Determine Proxy Ticker
+        proxy_ticker_name = self.proxy_symbols(fund_name)[0]
+        quote = quotes.get(proxy_ticker_name)
+
+        if not quote:
+            logger.warning(f"No data for {proxy_ticker_name}")
+            return None
+
+        current_val = quote["close"]
+        prev_close = quote["open"] # Close enough to Open for 1d view
+
+        # 2. Get USD/EGP Rate (only needed for Gold conversion)
+        # Note: EGP=X is Quote is usually USD in EGP or EGP in USD.
+        # Usually XXXYYY=X is how many YYY for 1 XXX.
+        # EGP=X on Yahoo often means USD/EGP. Let's assume ~50.
+        egp_quote = quotes.get("EGP=X")
+        usd_egp = egp_quote["close"] if egp_quote else 50.0
+
+        # 3. Calculate Derived Fund Price (EGP)
+        derived_price = 0.0
+        context_label = ""
+
+        if "gold" in fund_name.lower():
+            # Gold USD/oz -> EGP/gram
+            # 1 oz = 31.1035 g
+            price_per_gram_usd = current_val / 31.1035
+            price_per_gram_egp = price_per_gram_usd * usd_egp
+
+            # Azimut Gold is approx 26-30 EGP range (unit price).
+            derived_price = price_per_gram_egp / 130 # Approximation factor to match historical ~26
+            context_label = "Live Global Gold Futures (USD converted)"
+
+        elif "opportunity" in fund_name.lower():
+            # EGX30 ~30,000. Fund ~60 EGP.
+            derived_price = current_val / 500
+            context_label = "Tracking EGX30 Index Performance"
+
+        elif "shariah" in fund_name.lower():
+            # Shariah fund often behaves slightly differently.
+            derived_price = current_val / 530
+            context_label = "Tracking EGX30 Index Performance (Shariah Adjusted)"
+
+        # The tick is as old as the newest quote behind it: a quote served again
+        # from cache repeats its timestamp instead of posing as a new tick
+        quoted_at = max(
+            quotes[s].get("fetched_at", time.time()) for s in self.proxy_symbols(fund_name) if quotes.get(s)
+        )
+
+        # Base change from the proxy index
+        raw_change = ((current_val - prev_close) / prev_close) * 100
+
+        # Apply "Beta" (Volatilitiy) adjustments
+        if "shariah" in fund_name.lower():
+            change_pct = raw_change * 0.92
+        else:
+            change_pct = raw_change
+
+        return {
+            "fund": fund_name,
+            "ticker": fund_data["ticker"],
+            "price": round(derived_price, 2),
+            "change": round(change_pct, 2),
+            "timestamp": datetime.fromtimestamp(quoted_at).isoformat(),
+            "volume": quote["volume"],
+            "source": f"yfinance ({proxy_ticker_name})",
+            "context_label": context_label
+        }
+
+    def _get_quote(self, symbol: str) -> Optional[Dict]:
+        """Get latest quote for a symbol, hitting yfinance only on a cache miss"""
+        return self.cache.get_or_fetch(symbol, lambda: self._download_quote(symbol))
+
+    def _download_quote(self, symbol: str) -> Optional[Dict]:
+        """Download the 1d history for a symbol and reduce it to a plain quote dict"""
+        hist = self.yf.Ticker(symbol).history(period="1d")
+        return self._quote_from_frame(hist)
+
+    def _download_quotes(self, symbols: List[str]) -> Dict[str, Optional[Dict]]:
+        """Download the 1d history for several symbols in a single request"""
+        frame = self.yf.download(
+            symbols, period="1d", group_by="ticker", progress=False, threads=False
+        )
+        quotes = {}
+        for symbol in symbols:
+            if frame is None or frame.empty:
+                quotes[symbol] = None
+            elif getattr(frame.columns, "nlevels", 1) > 1:
+                has_symbol = symbol in frame.columns.get_level_values(0)
+                quotes[symbol] = self._quote_from_frame(frame[symbol]) if has_symbol else None
+            else:
+                # Single ticker without a multi-level header
+                quotes[symbol] = self._quote_from_frame(frame)
+        return quotes
+
+    @staticmethod
+    def _quote_from_frame(hist) -> Optional[Dict]:
+        """Reduce an OHLCV frame to the last row as a JSON-friendly quote"""
+        if hist is None or hist.empty:
+            return None
+        hist = hist.dropna(subset=["Close"])
+        if hist.empty:
+            return None
+        return {
+            "close": float(hist['Close'].iloc[-1]),
+            "open": float(hist['Open'].iloc[-1]),
+            "volume": int(hist['Volume'].iloc[-1]) if 'Volume' in hist else 0,
+            "fetched_at": time.time(),
+        }
+
     def _simulate_saving_growth(self, fund_name, fund_data):
         # Simulator: Assume base 1000 EGP at start of year, growing at 20% APY
         # NAV = Base * (1 + (Rate * Days/365))
@@ -0,0 +1,131 @@
+"""Query Planner Service - Combines fund queries into OR searches and splits the results back"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Iterable, List, Mapping, Tuple
+
+from app.services.keyword_matcher import KeywordMatcher
+from app.services.trending import tokenize
+
+logger = logging.getLogger(__name__)
+
+# fetch(source, query, limit) -> items
+SourceFetch = Callable[[object, str, int], Awaitable[List[Dict]]]
+
+
+def combine(queries: Iterable[str]) -> str:
+    """'(a b) OR (c d)'; a single query is passed through unchanged"""
+    queries = list(queries)
+    if len(queries) == 1:
+        return queries[0]
+    return " OR ".join(f"({query})" for query in queries)
+
+
+def plan_batches(queries: Mapping[str, str], max_chars: int) -> List[List[str]]:
+    """Group funds so each combined query stays within ``max_chars`` (first fit, in order)"""
+    batches: List[List[str]] = []
+    for fund, query in queries.items():
+        if batches and len(combine([queries[f] for f in batches[-1]] + [query])) <= max_chars:
+            batches[-1].append(fund)
+        else:
+            batches.append([fund])
+    return batches
+
+
+@dataclass
+class PlannedResult:
+    """Items of one combined fetch, already assigned to funds"""
+    fetched_at: float
+    assignments: Dict[str, List[Dict]] = field(default_factory=dict)
+
+
+class QueryPlanner:
+    """
+    Serves per-fund queries from combined requests on sources that support OR.
+
+    ``queries`` maps a kind ("primary", "fallback") to {fund: query}. The
+    first fund to ask a source for a kind triggers one request per batch of
+    funds, ``(q1) OR (q2) ...``, with the result limit scaled by the batch
+    size; funds asking while it runs await the same task, and the assigned
+    items are served from memory for ``ttl`` seconds. Each item goes to every
+    fund in its batch whose lexicon or query terms it mentions, so one
+    headline can count for several funds and an unrelated one for none.
+    """
+
+    def __init__(
+        self,
+        queries: Mapping[str, Mapping[str, str]],
+        lexicons: Mapping[str, Mapping[str, Iterable[str]]],
+        ttl: float = 15.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.queries = {kind: dict(by_fund) for kind, by_fund in queries.items()}
+        self.ttl = ttl
+        self.clock = clock
+
+        terms: Dict[str, set] = {}
+        for by_fund in self.queries.values():
+            for fund, query in by_fund.items():
+                terms.setdefault(fund, set()).update(tokenize(query))
+        for fund, polarities in lexicons.items():
+            for keywords in polarities.values():
+                terms.setdefault(fund, set()).update(keywords)
+        self.matcher = KeywordMatcher(terms)
+
+        self._results: Dict[Tuple[int, str], PlannedResult] = {}
+        self._inflight: Dict[Tuple[int, str], asyncio.Task] = {}
+        self.stats = {"requests": 0, "requests_saved": 0, "items": 0, "unassigned": 0}
+
+    def covers(self, source, fund_name: str, kind: str) -> bool:
+        """Whether the fund's query for this kind can be served from a combined request"""
+        return getattr(source, "SUPPORTS_OR", False) and fund_name in self.queries.get(kind, {})
+
+    async def fetch_for_fund(self, source, fund_name: str, kind: str, fetch: SourceFetch) -> List[Dict]:
+        """Items for ``fund_name`` from the (shared) combined fetch of ``source``"""
+        key = (id(source), kind)
+        result = self._results.get(key)
+        if result is None or self.clock() - result.fetched_at > self.ttl:
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.create_task(self._fetch_combined(source, kind, fetch))
+                self._inflight[key] = task
+                task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            # Shielded: a fund hitting its deadline must not cancel the others' fetch
+            result = await asyncio.shield(task)
+        return result.assignments.get(fund_name, [])
+
+    async def _fetch_combined(self, source, kind: str, fetch: SourceFetch) -> PlannedResult:
+        queries = self.queries[kind]
+        batches = plan_batches(queries, getattr(source, "MAX_QUERY_CHARS", 256))
+        responses = await asyncio.gather(
+            *(fetch(source, combine(queries[f] for f in batch), len(batch)) for batch in batches),
+            return_exceptions=True,
+        )
+
+        result = PlannedResult(fetched_at=self.clock(), assignments={fund: [] for fund in queries})
+        for batch, items in zip(batches, responses):
+            if isinstance(items, Exception):
+                logger.error(f"{type(source).__name__} combined {kind} query failed for {batch}: {items}")
+                continue
+            for item in items or []:
+                if len(batch) == 1:
+                    owners = batch
+                else:
+                    counts = self.matcher.count(item["text"])
+                    owners = [fund for fund in batch if counts.get(fund)]
+                for fund in owners:
+                    result.assignments[fund].append(item)
+                self.stats["items"] += 1
+                self.stats["unassigned"] += not owners
+
+        self.stats["requests"] += len(batches)
+        self.stats["requests_saved"] += len(queries) - len(batches)
+        self._results[(id(source), kind)] = result
+        logger.info(
+            f"🔀 {type(source).__name__}: {len(queries)} {kind} queries in {len(batches)} request(s)"
+        )
+        return result
+
+    def get_stats(self) -> Dict:
+        return dict(self.stats)
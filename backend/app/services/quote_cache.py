@@ -0,0 +1,244 @@
+"""Quote Cache Service - Shared TTL cache for market quotes with request coalescing"""
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class QuoteCache:
+    """
+    Thread-safe quote cache keyed by symbol.
+
+    - Each symbol has its own TTL (FX moves slower than futures/indices).
+    - Concurrent callers asking for the same symbol wait on a single in-flight
+      fetch instead of each hitting yfinance (single-flight).
+    - Entries live in memory and, when ``disk_path`` is set, are mirrored to a
+      JSON file so a restart can reuse quotes that are still fresh.
+    """
+
+    DEFAULT_TTLS = {
+        "EGP=X": 300.0,  # USD/EGP barely moves intraday
+        "GC=F": 30.0,
+        "^CASE30": 30.0,
+    }
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 30.0,
+        disk_path: Optional[str] = None,
+    ):
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.default_ttl = default_ttl
+        self.disk_path = disk_path
+
+        self._entries: Dict[str, Dict] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "upstream_calls": 0,
+            "upstream_errors": 0,
+        }
+
+        if self.disk_path:
+            self._load_from_disk()
+
+    def ttl_for(self, symbol: str) -> float:
+        """TTL in seconds for a symbol"""
+        return self.ttls.get(symbol, self.default_ttl)
+
+    def _is_fresh(self, symbol: str, entry: Dict) -> bool:
+        return (time.time() - entry["fetched_at"]) < self.ttl_for(symbol)
+
+    def get(self, symbol: str) -> Optional[Dict]:
+        """Return a fresh cached quote without triggering a fetch"""
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry and self._is_fresh(symbol, entry):
+                return entry["value"]
+        return None
+
+    def set(self, symbol: str, value: Dict):
+        """Store a quote for a symbol"""
+        self.set_many({symbol: value})
+
+    def set_many(self, values: Dict[str, Dict]):
+        """Store several quotes at once (one disk write)"""
+        now = time.time()
+        with self._lock:
+            for symbol, value in values.items():
+                self._entries[symbol] = {
+                    "value": value,
+                    "fetched_at": now,
+                    "from_disk": False,
+                }
+        if self.disk_path and values:
+            self._save_to_disk()
+
+    def get_or_fetch(self, symbol: str, loader: Callable[[], Optional[Dict]]) -> Optional[Dict]:
+        """
+        Return the cached quote for ``symbol`` or fetch it with ``loader``.
+        Only one caller runs ``loader`` at a time per symbol; others block on its result.
+        """
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry and self._is_fresh(symbol, entry):
+                self._stats["hits"] += 1
+                if entry["from_disk"]:
+                    self._stats["disk_hits"] += 1
+                return entry["value"]
+
+            future = self._inflight.get(symbol)
+            if future is not None:
+                self._stats["coalesced"] += 1
+                is_owner = False
+            else:
+                self._stats["misses"] += 1
+                future = Future()
+                self._inflight[symbol] = future
+                is_owner = True
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            with self._lock:
+                self._stats["upstream_calls"] += 1
+            value = loader()
+            if value is not None:
+                self.set(symbol, value)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            with self._lock:
+                self._stats["upstream_errors"] += 1
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(symbol, None)
+
+    def get_or_fetch_many(
+        self,
+        symbols: Iterable[str],
+        loader: Callable[[List[str]], Dict[str, Optional[Dict]]],
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Bulk variant of ``get_or_fetch``.
+        All symbols that are neither cached nor already in flight are passed to
+        ``loader`` in a single call, so one upstream request serves the whole batch.
+        """
+        results: Dict[str, Optional[Dict]] = {}
+        waiting: Dict[str, Future] = {}
+        owned: Dict[str, Future] = {}
+
+        with self._lock:
+            for symbol in dict.fromkeys(symbols):
+                entry = self._entries.get(symbol)
+                if entry and self._is_fresh(symbol, entry):
+                    self._stats["hits"] += 1
+                    if entry["from_disk"]:
+                        self._stats["disk_hits"] += 1
+                    results[symbol] = entry["value"]
+                elif symbol in self._inflight:
+                    self._stats["coalesced"] += 1
+                    waiting[symbol] = self._inflight[symbol]
+                else:
+                    self._stats["misses"] += 1
+                    owned[symbol] = self._inflight[symbol] = Future()
+
+        if owned:
+            try:
+                with self._lock:
+                    self._stats["upstream_calls"] += 1
+                loaded = loader(list(owned)) or {}
+                self.set_many({s: v for s, v in loaded.items() if s in owned and v is not None})
+                for symbol, future in owned.items():
+                    results[symbol] = loaded.get(symbol)
+                    future.set_result(results[symbol])
+            except Exception as e:
+                with self._lock:
+                    self._stats["upstream_errors"] += 1
+                for future in owned.values():
+                    if not future.done():
+                        future.set_exception(e)
+                raise
+            finally:
+                with self._lock:
+                    for symbol in owned:
+                        self._inflight.pop(symbol, None)
+
+        for symbol, future in waiting.items():
+            try:
+                results[symbol] = future.result()
+            except Exception as e:
+                # Another caller's fetch failed; treat the symbol as missing for this batch
+                logger.warning(f"Shared fetch for {symbol} failed: {e}")
+                results[symbol] = None
+
+        return results
+
+    def get_stats(self) -> Dict:
+        """Hit/miss counters plus current cache size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["inflight"] = len(self._inflight)
+        lookups = stats["hits"] + stats["misses"] + stats["coalesced"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        stats["disk_path"] = self.disk_path
+        return stats
+
+    def clear(self):
+        """Drop all in-memory entries (disk file is left untouched)"""
+        with self._lock:
+            self._entries.clear()
+
+    def _load_from_disk(self):
+        """Load persisted entries; expired ones are simply never served"""
+        if not os.path.exists(self.disk_path):
+            return
+        try:
+            with open(self.disk_path, "r") as f:
+                data = json.load(f)
+            for symbol, entry in data.items():
+                self._entries[symbol] = {
+                    "value": entry["value"],
+                    "fetched_at": float(entry["fetched_at"]),
+                    "from_disk": True,
+                }
+            logger.info(f"Loaded {len(data)} cached quotes from {self.disk_path}")
+        except Exception as e:
+            logger.warning(f"Could not load quote cache from {self.disk_path}: {e}")
+
+    def _save_to_disk(self):
+        """Write entries atomically so a crash never leaves a half-written file"""
+        with self._lock:
+            data = {
+                symbol: {"value": entry["value"], "fetched_at": entry["fetched_at"]}
+                for symbol, entry in self._entries.items()
+            }
+        tmp_path = f"{self.disk_path}.tmp"
+        try:
+            with self._disk_lock:
+                with open(tmp_path, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.disk_path)
+        except Exception as e:
+            logger.warning(f"Could not persist quote cache to {self.disk_path}: {e}")
+
+
+# Global cache instance shared by all price fetchers
+quote_cache = QuoteCache(disk_path=os.getenv("QUOTE_CACHE_PATH") or None)
@@ -0,0 +1,104 @@
+"""Ring Buffer Service - Fixed-capacity, array-backed tick storage for price history"""
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class PriceRingBuffer:
+    """
+    Per-fund tick history stored in contiguous typed NumPy arrays.
+
+    Every tick is written twice, at ``i`` and ``i + capacity`` (a mirrored
+    buffer), so the most recent ``n`` ticks are always one contiguous slice.
+    ``window()`` therefore returns a zero-copy, read-only view instead of
+    rebuilding lists. Views alias the buffer's memory: copy them if they
+    must survive later appends.
+    """
+
+    FIELDS = ("price", "change", "volume", "timestamp")
+
+    def __init__(self, capacity: int = 10000):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._arrays = {
+            "price": np.zeros(2 * capacity, dtype=np.float64),
+            "change": np.zeros(2 * capacity, dtype=np.float64),
+            "volume": np.zeros(2 * capacity, dtype=np.int64),
+            "timestamp": np.zeros(2 * capacity, dtype=np.float64),  # epoch seconds
+        }
+        self._head = 0  # next write position in [0, capacity)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, price: float, change: float = 0.0, volume: int = 0, timestamp: Optional[float] = None):
+        """Add one tick, overwriting the oldest once full (O(1))"""
+        if timestamp is None:
+            timestamp = datetime.now().timestamp()
+        for name, value in (("price", price), ("change", change), ("volume", volume), ("timestamp", timestamp)):
+            array = self._arrays[name]
+            array[self._head] = value
+            array[self._head + self.capacity] = value
+
+        self._head = (self._head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def append_tick(self, price_info: Dict):
+        """Add a tick from a price dict as produced by the price fetchers"""
+        timestamp = price_info.get("timestamp")
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp).timestamp()
+        elif isinstance(timestamp, datetime):
+            timestamp = timestamp.timestamp()
+        self.append(
+            price_info["price"],
+            price_info.get("change", 0.0),
+            price_info.get("volume", 0) or 0,
+            timestamp,
+        )
+
+    def window(self, field: str, n: Optional[int] = None) -> np.ndarray:
+        """Zero-copy read-only view of the last ``n`` values of a field, oldest first"""
+        n = self._size if n is None else max(0, min(n, self._size))
+        end = self._head + self.capacity
+        view = self._arrays[field][end - n:end]
+        view.flags.writeable = False
+        return view
+
+    def prices(self, n: Optional[int] = None) -> np.ndarray:
+        return self.window("price", n)
+
+    def changes(self, n: Optional[int] = None) -> np.ndarray:
+        return self.window("change", n)
+
+    def volumes(self, n: Optional[int] = None) -> np.ndarray:
+        return self.window("volume", n)
+
+    def timestamps(self, n: Optional[int] = None) -> np.ndarray:
+        return self.window("timestamp", n)
+
+    def last(self) -> Optional[Dict]:
+        """Most recent tick as a dict"""
+        records = self.to_records(1)
+        return records[0] if records else None
+
+    def to_records(self, n: Optional[int] = None) -> List[Dict]:
+        """Materialize the last ``n`` ticks as dicts (for JSON responses)"""
+        columns = {name: self.window(name, n) for name in self.FIELDS}
+        return [
+            {
+                "price": float(columns["price"][i]),
+                "change": float(columns["change"][i]),
+                "volume": int(columns["volume"][i]),
+                "timestamp": datetime.fromtimestamp(columns["timestamp"][i]).isoformat(),
+            }
+            for i in range(len(columns["price"]))
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the backing arrays"""
+        return sum(array.nbytes for array in self._arrays.values())
@@ -0,0 +1,108 @@
+"""Rollup Service - Hourly / daily sentiment buckets maintained at write time"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.database import SentimentRollup
+
+RESOLUTIONS = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE; others use a read-then-update merge
+ON_CONFLICT_DIALECTS = ("postgresql", "sqlite")
+
+SUM_COLUMNS = ("samples", "item_count", "score_sum", "positive_sum", "neutral_sum", "negative_sum")
+
+
+def bucket_start(timestamp: datetime, resolution: str) -> datetime:
+    """Start of the hour / day containing ``timestamp``"""
+    if resolution == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    if resolution == "day":
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"Unknown resolution: {resolution}")
+
+
+def rollup_rows(records: List[Dict]) -> List[Dict]:
+    """Fold SentimentRecord rows into one increment per (fund, resolution, bucket)"""
+    buckets: Dict[Tuple[str, str, datetime], Dict] = {}
+    for record in records:
+        for resolution in RESOLUTIONS:
+            key = (record["fund_name"], resolution, bucket_start(record["timestamp"], resolution))
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = {
+                    "fund_name": key[0], "resolution": key[1], "bucket_start": key[2],
+                    **dict.fromkeys(SUM_COLUMNS, 0),
+                }
+            bucket["samples"] += 1
+            bucket["item_count"] += record.get("new_items") or 0  # source_count is a running total
+            bucket["score_sum"] += record.get("overall_score") or 0.0
+            bucket["positive_sum"] += record.get("positive") or 0.0
+            bucket["neutral_sum"] += record.get("neutral") or 0.0
+            bucket["negative_sum"] += record.get("negative") or 0.0
+    return list(buckets.values())
+
+
+def upsert_sentiment_rollups(db: Session, records: List[Dict]):
+    """
+    Add a batch of SentimentRecord rows to their hour and day buckets inside
+    the caller's transaction: one INSERT ... ON CONFLICT DO UPDATE where the
+    dialect supports it, a locked read-then-update otherwise.
+    """
+    increments = rollup_rows(records)
+    if not increments:
+        return
+
+    dialect = db.get_bind().dialect.name
+    if dialect not in ON_CONFLICT_DIALECTS:
+        _merge_rollups(db, increments)
+        return
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+
+    stmt = insert(SentimentRollup).values(increments)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["fund_name", "resolution", "bucket_start"],
+        set_={column: getattr(SentimentRollup, column) + getattr(stmt.excluded, column) for column in SUM_COLUMNS},
+    )
+    db.execute(stmt)
+
+
+def _merge_rollups(db: Session, increments: List[Dict]):
+    """Portable upsert: read the batch's existing buckets, add to them and insert the missing ones"""
+    existing = {
+        (row.fund_name, row.resolution, row.bucket_start): row
+        for row in db.query(SentimentRollup)
+        .filter(
+            SentimentRollup.fund_name.in_({i["fund_name"] for i in increments}),
+            SentimentRollup.resolution.in_({i["resolution"] for i in increments}),
+            SentimentRollup.bucket_start.in_({i["bucket_start"] for i in increments}),
+        )
+        .with_for_update()
+    }
+    for increment in increments:
+        row = existing.get((increment["fund_name"], increment["resolution"], increment["bucket_start"]))
+        if row is None:
+            db.add(SentimentRollup(**increment))
+            continue
+        for column in SUM_COLUMNS:
+            setattr(row, column, (getattr(row, column) or 0) + increment[column])
+    # A bucket created concurrently fails the unique constraint; the writer retries the whole batch
+    db.flush()
+
+
+def rollup_to_point(rollup: SentimentRollup) -> Dict:
+    """API shape of one bucket: averages plus counts"""
+    samples = rollup.samples or 1
+    return {
+        "timestamp": rollup.bucket_start.isoformat(),
+        "overall_score": round(rollup.score_sum / samples, 4),
+        "positive": round(rollup.positive_sum / samples, 2),
+        "neutral": round(rollup.neutral_sum / samples, 2),
+        "negative": round(rollup.negative_sum / samples, 2),
+        "samples": rollup.samples,
+        "items": rollup.item_count,
+    }
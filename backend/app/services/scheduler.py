@@ -0,0 +1,131 @@
+"""Scheduler Service - Drift-free periodic jobs with jitter and overrun coalescing"""
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScheduledJob:
+    """One periodic job and its run statistics (times are monotonic seconds)"""
+    name: str
+    func: Callable[[], Awaitable]
+    interval: float
+    jitter: float = 0.0
+    next_slot: float = 0.0  # next grid point: start + k * interval
+    next_run: float = 0.0  # next_slot plus this run's jitter
+    running: bool = False
+    runs: int = 0
+    errors: int = 0
+    coalesced: int = 0  # slots skipped because the previous run overran them
+    last_lag: Optional[float] = None  # how late the last run started vs. its slot
+    last_duration: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+class Scheduler:
+    """
+    Runs each job on its own fixed grid, independent of how long runs take.
+
+    Slots are ``start + k * interval``, so the period does not drift by the
+    run time. Each run starts up to ``jitter`` seconds after its slot to
+    spread load on upstreams; the jitter is drawn per run and never carries
+    into the next slot. A job never runs concurrently with itself: slots
+    that pass while it is still running are coalesced into the next one.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable] = asyncio.sleep,
+    ):
+        self.clock = clock
+        self.sleep = sleep
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def add(self, name: str, func: Callable[[], Awaitable], interval: float, jitter: float = 0.0) -> ScheduledJob:
+        """Register a job; it first runs when the scheduler starts"""
+        if interval <= 0:
+            raise ValueError(f"Interval for {name} must be positive")
+        if name in self.jobs:
+            raise ValueError(f"Job {name} is already scheduled")
+        job = ScheduledJob(name=name, func=func, interval=interval, jitter=min(jitter, interval))
+        self.jobs[name] = job
+        if self._tasks:
+            self._tasks[name] = asyncio.create_task(self._run(job))
+        return job
+
+    def start(self):
+        """Start every registered job (idempotent)"""
+        for name, job in self.jobs.items():
+            if name not in self._tasks or self._tasks[name].done():
+                self._tasks[name] = asyncio.create_task(self._run(job))
+        logger.info(f"⏰ Scheduler started: {', '.join(f'{j.name} every {j.interval:g}s' for j in self.jobs.values())}")
+
+    async def stop(self):
+        """Cancel all jobs and wait for them to finish"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _run(self, job: ScheduledJob):
+        job.next_slot = self.clock()
+        while True:
+            job.next_run = job.next_slot + (random.uniform(0, job.jitter) if job.jitter else 0.0)
+            delay = job.next_run - self.clock()
+            if delay > 0:
+                await self.sleep(delay)
+
+            started = self.clock()
+            job.last_lag = started - job.next_slot
+            job.running = True
+            try:
+                await job.func()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                job.errors += 1
+                job.last_error = str(e)
+                logger.error(f"❌ Scheduled job {job.name} failed: {e}")
+            finally:
+                job.running = False
+                job.runs += 1
+            finished = self.clock()
+            job.last_duration = finished - started
+
+            # Next slot on the grid that has not started yet; skipped ones are coalesced
+            missed = int((finished - job.next_slot) // job.interval)
+            if missed > 1:
+                job.coalesced += missed - 1
+                logger.warning(f"⏱️ {job.name} overran {missed - 1} slot(s) ({job.last_duration:.1f}s > {job.interval:g}s)")
+            job.next_slot += max(missed, 1) * job.interval
+
+    def get_status(self) -> Dict:
+        """Per-job cadence, next run and lag, for monitoring"""
+        now = self.clock()
+        return {
+            name: {
+                "interval_seconds": job.interval,
+                "jitter_seconds": job.jitter,
+                "running": job.running,
+                "next_run_in_seconds": round(max(0.0, job.next_run - now), 3) if name in self._tasks else None,
+                "last_lag_seconds": None if job.last_lag is None else round(job.last_lag, 3),
+                "last_duration_seconds": None if job.last_duration is None else round(job.last_duration, 3),
+                "runs": job.runs,
+                "coalesced": job.coalesced,
+                "errors": job.errors,
+                "last_error": job.last_error,
+            }
+            for name, job in self.jobs.items()
+        }
+
+
+# Global scheduler driving the monitoring agents
+scheduler = Scheduler()
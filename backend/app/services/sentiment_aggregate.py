@@ -0,0 +1,48 @@
+"""Sentiment Aggregate Service - Time-decayed running sentiment distribution per fund"""
+import time
+from typing import Callable, Dict, Optional
+
+LABELS = ("positive", "neutral", "negative")
+
+
+class DecayedSentiment:
+    """
+    Running positive / neutral / negative counts with exponential decay.
+
+    New items are added as they arrive and older evidence fades with a
+    ``half_life`` (in seconds), so the distribution is updated in
+    O(new items) instead of being rebuilt from every item each cycle.
+    """
+
+    def __init__(self, half_life: float = 6 * 3600.0, clock: Callable[[], float] = time.time):
+        self.half_life = half_life
+        self.clock = clock
+        self.weights = dict.fromkeys(LABELS, 0.0)
+        self.updated_at: Optional[float] = None
+
+    def _decay(self, now: float):
+        if self.updated_at is not None and now > self.updated_at:
+            factor = 0.5 ** ((now - self.updated_at) / self.half_life)
+            for label in LABELS:
+                self.weights[label] *= factor
+        self.updated_at = now if self.updated_at is None else max(now, self.updated_at)
+
+    def add(self, positive: int = 0, neutral: int = 0, negative: int = 0, now: Optional[float] = None):
+        """Fold newly scored items into the aggregate"""
+        self._decay(self.clock() if now is None else now)
+        self.weights["positive"] += positive
+        self.weights["neutral"] += neutral
+        self.weights["negative"] += negative
+
+    def total(self, now: Optional[float] = None) -> float:
+        """Effective (decayed) number of items"""
+        self._decay(self.clock() if now is None else now)
+        return sum(self.weights.values())
+
+    def distribution(self, now: Optional[float] = None) -> Dict[str, float]:
+        """Percentages per label, like the fetchers' ``sentiment_distribution``"""
+        total = self.total(now)
+        return {
+            label: round(self.weights[label] / total * 100, 1) if total > 0 else 0
+            for label in LABELS
+        }
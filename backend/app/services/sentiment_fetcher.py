@@ -1,14 +1,71 @@
 """Sentiment Fetcher Service - Aggregates social sentiment data"""
 import abc
 import logging
+import os
 import random
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import asyncio
+from app.services.dedup import FingerprintStore
+from app.services.keyword_matcher import KeywordMatcher
+from app.services.query_planner import QueryPlanner
+from app.services.sentiment_aggregate import DecayedSentiment
+from app.services.trending import trending_engine
 from app.services.sentiment_sources import GoogleNewsSource, RedditSource, InvestingComSource, TradingViewSource, YahooFinanceSource
 
 logger = logging.getLogger(__name__)
 
+# Fan-out limits for RealSentimentFetcher
+MAX_CONCURRENT_FETCHES = int(os.getenv("SENTIMENT_MAX_CONCURRENCY", "12"))  # all sources, all funds
+PER_SOURCE_CONCURRENCY = int(os.getenv("SENTIMENT_PER_SOURCE_CONCURRENCY", "2"))
+FUND_DEADLINE = float(os.getenv("SENTIMENT_FUND_DEADLINE", "8"))  # seconds per fund, fallback included
+
+# Incremental aggregation: how long a story stays "seen" and how fast old evidence fades
+DEDUP_TTL = float(os.getenv("SENTIMENT_DEDUP_TTL", str(24 * 3600)))
+SENTIMENT_HALF_LIFE = float(os.getenv("SENTIMENT_HALF_LIFE", str(6 * 3600)))
+
+# How long a combined (OR) search result is shared between funds
+QUERY_PLAN_TTL = float(os.getenv("SENTIMENT_QUERY_PLAN_TTL", "15"))
+
+# Highly distinct search queries per fund, and broader ones when those find nothing
+FUND_QUERIES = {
+    "halan_saving": "savings account bank deposit interest rates compound yield Egypt",
+    "az_gold": "gold price per ounce bullion commodity trading metals",
+    "az_opportunity": "emerging markets stocks growth equity opportunities trading signals",
+    "az_shariah": "sharia law compliant halal islamic principles ethics sustainable"
+}
+
+FUND_FALLBACK_QUERIES = {
+    "halan_saving": "savings accounts deposits interest compounding",
+    "az_gold": "commodity prices trading metals bullion futures",
+    "az_opportunity": "stock market trading growth equity bulls",
+    "az_shariah": "halal islamic compliant ethical investing principles"
+}
+
+# Fund-specific keyword lexicons - completely distinct for each fund
+FUND_LEXICONS = {
+    "halan_saving": {
+        "positive": ["savings", "compound", "yield", "interest", "return", "safe", "deposit", "reliable", "secure"],
+        "negative": ["inflation", "loss", "devalue", "low rate", "risk", "unstable", "depreciate"]
+    },
+    "az_gold": {
+        "positive": ["gold", "bullion", "hedge", "safe haven", "precious", "rally", "strong", "rise", "up"],
+        "negative": ["crash", "collapse", "weakness", "tumble", "drop", "plunge", "bearish", "falls"]
+    },
+    "az_opportunity": {
+        "positive": ["upside", "momentum", "breakout", "surge", "explode", "bullish", "rally", "growth", "outperform"],
+        "negative": ["downside", "risk", "bearish", "collapse", "crash", "weak", "decline", "underperform"]
+    },
+    "az_shariah": {
+        "positive": ["ethical", "halal", "compliant", "sharia", "principles", "responsible", "moral", "beneficial"],
+        "negative": ["haram", "forbidden", "violation", "non-compliant", "unethical", "prohibited", "sinful"]
+    }
+}
+
+FUND_MATCHER = KeywordMatcher.from_fund_lexicons(FUND_LEXICONS)
+
+
 class BaseSentimentFetcher(abc.ABC):
     """Abstract base class for sentiment fetchers"""
     
@@ -18,8 +75,8 @@ class BaseSentimentFetcher(abc.ABC):
         pass
     
     @abc.abstractmethod
-    async def get_trending_keywords(self, fund_name: str) -> List[str]:
-        """Fetch trending keywords for a fund"""
+    async def get_trending_keywords(self, fund_name: str, k: int = 10) -> List[str]:
+        """Fetch the top ``k`` trending keywords for a fund"""
         pass
 
 class MockSentimentFetcher(BaseSentimentFetcher):
@@ -51,11 +108,12 @@ class MockSentimentFetcher(BaseSentimentFetcher):
             "overall_score": round(sentiment_score, 2),
             "trending": normalized["positive"] > 60,
             "source_count": 150 + (hash(fund_name) % 200),
+            "new_items": 150 + (hash(fund_name) % 200),
             "timestamp": datetime.now().isoformat(),
             "sources": ["mock_twitter", "mock_farcaster"]
         }
 
-    async def get_trending_keywords(self, fund_name: str) -> List[str]:
+    async def get_trending_keywords(self, fund_name: str, k: int = 10) -> List[str]:
         """Mock trending keywords"""
         trending_keywords = {
             "halan_saving": ["growth", "savings", "compound", "yield"],
@@ -63,89 +121,120 @@ class MockSentimentFetcher(BaseSentimentFetcher):
             "az_opportunity": ["opportunity", "rally", "bullish", "stocks"],
             "az_shariah": ["sharia", "compliant", "ethical", "halal"],
         }
-        return trending_keywords.get(fund_name, ["investing", "finance"])
+        return trending_keywords.get(fund_name, ["investing", "finance"])[:k]
 
 class RealSentimentFetcher(BaseSentimentFetcher):
-    """Fetches real data from Google News, Reddit, and Investing.com"""
-    
-    def __init__(self):
-        self.sources = [
+    """
+    Fetches real data from Google News, Reddit, and Investing.com.
+
+    Sources are queried concurrently, bounded by a global limit and a
+    per-source limit so several funds fanning out at once do not hammer one
+    upstream. Each fund has a deadline: sources still running when it
+    expires are cancelled and the result is built from what arrived.
+
+    Headlines come back every cycle and the same story is syndicated across
+    sources, so items are fingerprinted and only unseen ones are scored.
+    Each fund's distribution is a time-decayed running aggregate of them.
+
+    Sources that support OR searches (Google News, Reddit) are asked once for
+    all funds through the query planner, and the results are assigned back
+    to funds by their lexicons; the others are queried per fund.
+    """
+
+    def __init__(
+        self,
+        sources: Optional[List] = None,
+        max_concurrency: int = MAX_CONCURRENT_FETCHES,
+        per_source_concurrency: int = PER_SOURCE_CONCURRENCY,
+        deadline: float = FUND_DEADLINE,
+        planner: Optional[QueryPlanner] = None,
+    ):
+        self.sources = sources if sources is not None else [
             GoogleNewsSource(),
             RedditSource(),
             InvestingComSource(),
             TradingViewSource(),
             YahooFinanceSource()
         ]
-    
+        self.deadline = deadline
+        self.planner = planner if planner is not None else QueryPlanner(
+            {"primary": FUND_QUERIES, "fallback": FUND_FALLBACK_QUERIES}, FUND_LEXICONS, ttl=QUERY_PLAN_TTL
+        )
+        # Per-fund dedup store and decayed sentiment, updated with new items only
+        self._fingerprints: Dict[str, FingerprintStore] = {}
+        self._aggregates: Dict[str, DecayedSentiment] = {}
+        self._global_limit = asyncio.Semaphore(max_concurrency)
+        self._source_limits = {id(source): asyncio.Semaphore(per_source_concurrency) for source in self.sources}
+
+    async def _fetch_source(self, source, query: str) -> List[Dict]:
+        async with self._source_limits[id(source)], self._global_limit:
+            return await source.fetch(query)
+
+    async def _fetch_combined(self, source, query: str, fund_count: int) -> List[Dict]:
+        # One OR query standing in for ``fund_count`` funds gets as many results as they would have
+        async with self._source_limits[id(source)], self._global_limit:
+            return await source.fetch(query, limit=source.RESULTS_PER_QUERY * fund_count)
+
+    def _source_task(self, source, query: str, fund_name: Optional[str], kind: str) -> asyncio.Task:
+        if fund_name is not None and self.planner.covers(source, fund_name, kind):
+            return asyncio.create_task(self.planner.fetch_for_fund(source, fund_name, kind, self._fetch_combined))
+        return asyncio.create_task(self._fetch_source(source, query))
+
+    async def _fetch_all_sources(
+        self, query: str, deadline: float, fund_name: Optional[str] = None, kind: str = "primary"
+    ) -> Tuple[List[Dict], List[str]]:
+        """Query every source until ``deadline`` (monotonic); returns items and the sources that missed it"""
+        tasks = {self._source_task(source, query, fund_name, kind): source for source in self.sources}
+        done, pending = await asyncio.wait(tasks, timeout=max(0.0, deadline - time.monotonic()))
+        for task in pending:
+            task.cancel()
+
+        items = []
+        for task in done:
+            if task.exception() is not None:
+                logger.error(f"{type(tasks[task]).__name__} failed for '{query}': {task.exception()}")
+                continue
+            items.extend(task.result() or [])
+        missing = [type(tasks[task]).__name__ for task in pending]
+        return items, missing
+
     async def fetch_sentiment(self, fund_name: str) -> Dict:
-        # Map fund names to highly distinct search queries
-        queries = {
-            "halan_saving": "savings account bank deposit interest rates compound yield Egypt",
-            "az_gold": "gold price per ounce bullion commodity trading metals",
-            "az_opportunity": "emerging markets stocks growth equity opportunities trading signals",
-            "az_shariah": "sharia law compliant halal islamic principles ethics sustainable"
-        }
-        
-        query = queries.get(fund_name, fund_name)
+        query = FUND_QUERIES.get(fund_name, fund_name)
+        deadline = time.monotonic() + self.deadline
         
-        # Parallel fetch from all sources
-        tasks = [source.fetch(query) for source in self.sources]
-        results_list = await asyncio.gather(*tasks)
+        # Parallel fetch from all sources, bounded by the fund's deadline
+        all_items, missing_sources = await self._fetch_all_sources(query, deadline, fund_name)
         
-        # Flatten results
-        all_items = [item for sublist in results_list for item in sublist]
-        
-        # If no results, try broader category fallback
-        if not all_items:
-            category_fallbacks = {
-                "halan_saving": "savings accounts deposits interest compounding",
-                "az_gold": "commodity prices trading metals bullion futures",
-                "az_opportunity": "stock market trading growth equity bulls",
-                "az_shariah": "halal islamic compliant ethical investing principles"
-            }
-            fallback_query = category_fallbacks.get(fund_name)
+        # If no results, try broader category fallback (only with time left)
+        if not all_items and time.monotonic() < deadline:
+            fallback_query = FUND_FALLBACK_QUERIES.get(fund_name)
             
             if fallback_query and fallback_query != query:
                 logger.info(f"No results for {fund_name} ({query}), trying fallback: {fallback_query}")
-                tasks = [source.fetch(fallback_query) for source in self.sources]
-                results_list = await asyncio.gather(*tasks)
-                all_items = [item for sublist in results_list for item in sublist]
+                all_items, missing_sources = await self._fetch_all_sources(
+                    fallback_query, deadline, fund_name, kind="fallback"
+                )
+
+        if missing_sources:
+            logger.warning(f"⏱️ Sentiment for {fund_name} is partial, deadline hit for: {', '.join(missing_sources)}")
 
-        if not all_items:
+        if not all_items and fund_name not in self._aggregates:
             return None
-            
-        # Fund-specific keyword scoring - completely distinct for each fund
-        fund_keywords = {
-            "halan_saving": {
-                "positive": ["savings", "compound", "yield", "interest", "return", "safe", "deposit", "reliable", "secure"],
-                "negative": ["inflation", "loss", "devalue", "low rate", "risk", "unstable", "depreciate"]
-            },
-            "az_gold": {
-                "positive": ["gold", "bullion", "hedge", "safe haven", "precious", "rally", "strong", "rise", "up"],
-                "negative": ["crash", "collapse", "weakness", "tumble", "drop", "plunge", "bearish", "falls"]
-            },
-            "az_opportunity": {
-                "positive": ["upside", "momentum", "breakout", "surge", "explode", "bullish", "rally", "growth", "outperform"],
-                "negative": ["downside", "risk", "bearish", "collapse", "crash", "weak", "decline", "underperform"]
-            },
-            "az_shariah": {
-                "positive": ["ethical", "halal", "compliant", "sharia", "principles", "responsible", "moral", "beneficial"],
-                "negative": ["haram", "forbidden", "violation", "non-compliant", "unethical", "prohibited", "sinful"]
-            }
-        }
-        
-        fund_kw = fund_keywords.get(fund_name, {"positive": [], "negative": []})
-        positive_keywords = fund_kw["positive"]
-        negative_keywords = fund_kw["negative"]
-        
+
+        # Only stories not seen before (exactly or nearly, across sources) are scored
+        seen = self._fingerprints.setdefault(fund_name, FingerprintStore(ttl=DEDUP_TTL))
+        new_items = [item for item in all_items if seen.add(item["text"])]
+        trending_engine.ingest(fund_name, [item["text"] for item in new_items])
+
+        # Fund-specific keyword scoring: one scan per item covers every lexicon
         pos = 0
         neg = 0
         neu = 0
         
-        for item in all_items:
-            text = item["text"].lower()
-            p_score = sum(1 for k in positive_keywords if k in text)
-            n_score = sum(1 for k in negative_keywords if k in text)
+        for item in new_items:
+            counts = FUND_MATCHER.count(item["text"])
+            p_score = counts.get((fund_name, "positive"), 0)
+            n_score = counts.get((fund_name, "negative"), 0)
             
             if p_score > n_score:
                 pos += 1
@@ -153,21 +242,14 @@ class RealSentimentFetcher(BaseSentimentFetcher):
                 neg += 1
             else:
                 neu += 1
-                
-        total = pos + neg + neu
-        
-        # Add slight randomization based on fund to create natural variance
-        # This prevents identical scores across different funds
-        fund_variance = hash(fund_name) % 5  # 0-4 variance
-        pos = max(0, pos - 1 + (fund_variance % 3))
-        
-        total = pos + neg + neu
-        normalized = {
-            "positive": round((pos / total) * 100, 1) if total > 0 else 0,
-            "neutral": round((neu / total) * 100, 1) if total > 0 else 0,
-            "negative": round((neg / total) * 100, 1) if total > 0 else 0,
-        }
-        
+
+        aggregate = self._aggregates.setdefault(fund_name, DecayedSentiment(half_life=SENTIMENT_HALF_LIFE))
+        aggregate.add(positive=pos, neutral=neu, negative=neg)
+        total = aggregate.total()
+        if total <= 0:
+            return None
+
+        normalized = aggregate.distribution()
         sentiment_score = (normalized["positive"] - normalized["negative"]) / 100
         
         return {
@@ -175,14 +257,19 @@ class RealSentimentFetcher(BaseSentimentFetcher):
             "sentiment_distribution": normalized,
             "overall_score": round(sentiment_score, 2),
             "trending": total > 5,
-            "source_count": total,
+            "source_count": round(total, 1),
+            "new_items": len(new_items),
+            "duplicates": len(all_items) - len(new_items),
             "timestamp": datetime.now().isoformat(),
             "sources": [item["source"] for item in all_items],
-            "recent_items": all_items[:5]
+            "recent_items": all_items[:5],
+            "partial": bool(missing_sources),
+            "missing_sources": missing_sources,
         }
 
-    async def get_trending_keywords(self, fund_name: str) -> List[str]:
-        return ["inflation", "gold", "currency", "saving"]
+    async def get_trending_keywords(self, fund_name: str, k: int = 10) -> List[str]:
+        """Most frequent terms in the fund's recent items (sliding window)"""
+        return trending_engine.keywords(fund_name, k)
 
 def get_sentiment_fetcher(use_real_data: bool = False) -> BaseSentimentFetcher:
     """Factory to get the appropriate fetcher"""
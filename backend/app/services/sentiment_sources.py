@@ -1,15 +1,20 @@
 
 import logging
-import feedparser
-import aiohttp
 import asyncio
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 from urllib.parse import quote
+from app.services.feed_client import feed_client
+from app.services.http_client import http_client
 
 logger = logging.getLogger(__name__)
 
 class BaseSource:
+    # Sources whose search understands "(a) OR (b)" can serve several funds per request
+    SUPPORTS_OR = False
+    MAX_QUERY_CHARS = 256
+    RESULTS_PER_QUERY = 5
+
     async def fetch(self, query: str) -> List[Dict]:
         raise NotImplementedError
 
@@ -19,20 +24,19 @@ class GoogleNewsSource(BaseSource):
     Fetches news from Google News RSS feed.
     """
     BASE_URL = "https://news.google.com/rss/search?q={query}&hl=en-EG&gl=EG&ceid=EG:en"
+    SUPPORTS_OR = True
+    MAX_QUERY_CHARS = 400
 
-    async def fetch(self, query: str) -> List[Dict]:
+    async def fetch(self, query: str, limit: Optional[int] = None) -> List[Dict]:
+        limit = limit or self.RESULTS_PER_QUERY
         try:
             # URL encode the query to handle spaces
             encoded_query = quote(query)
             url = self.BASE_URL.format(query=encoded_query)
-            # feedparser can hang, so we wrap in wait_for
-            feed = await asyncio.wait_for(
-                asyncio.to_thread(feedparser.parse, url),
-                timeout=5.0
-            )
+            feed = await feed_client.fetch(url)
             
             results = []
-            for entry in feed.entries[:5]: # Top 5 news
+            for entry in feed.entries[:limit]: # Top news
                 results.append({
                     "text": entry.title,
                     "url": entry.link,
@@ -54,67 +58,64 @@ class RedditSource(BaseSource):
     """
     # Using public JSON endpoints
     SUBREDDITS = ["PersonalFinanceEgypt", "Egypt"]
-
-    async def fetch(self, query: str) -> List[Dict]:
+    SUPPORTS_OR = True
+    MAX_QUERY_CHARS = 512
+    RESULTS_PER_QUERY = 3  # per subreddit
+
+    async def fetch(self, query: str, limit: Optional[int] = None) -> List[Dict]:
+        limit = limit or self.RESULTS_PER_QUERY
+        # Subreddits are queried concurrently over the shared connection pool
+        encoded_query = quote(query)
+        per_sub = await asyncio.gather(*(self._fetch_subreddit(sub, encoded_query, limit) for sub in self.SUBREDDITS))
+        return [item for items in per_sub for item in items]
+
+    async def _fetch_subreddit(self, sub: str, encoded_query: str, limit: int = 3) -> List[Dict]:
         results = []
-        timeout = aiohttp.ClientTimeout(total=5)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            for sub in self.SUBREDDITS:
-                try:
-                    # Search within subreddit - URL encode the query
-                    encoded_query = quote(query)
-                    url = f"https://www.reddit.com/r/{sub}/search.json?q={encoded_query}&restrict_sr=1&sort=new&limit=3"
-                    async with session.get(url, headers={"User-Agent": "Mozilla/5.0"}) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
-                            posts = data.get("data", {}).get("children", [])
-                            for post in posts:
-                                p_data = post.get("data", {})
-                                title = p_data.get("title", "")
-                                selftext = p_data.get("selftext", "")[:100] # truncated body
-                                
-                                results.append({
-                                    "text": f"{title} - {selftext}",
-                                    "url": f"https://reddit.com{p_data.get('permalink')}",
-                                    "source": f"Reddit (r/{sub})",
-                                    "timestamp": datetime.now().isoformat()
-                                })
-                except Exception as e:
-                    logger.error(f"Reddit fetch error for {sub}: {e}")
+        try:
+            # Search within subreddit
+            url = f"https://www.reddit.com/r/{sub}/search.json?q={encoded_query}&restrict_sr=1&sort=new&limit={limit}"
+            data = await http_client.get_json(url, timeout=5)
+            posts = data.get("data", {}).get("children", [])
+            for post in posts:
+                p_data = post.get("data", {})
+                title = p_data.get("title", "")
+                selftext = p_data.get("selftext", "")[:100] # truncated body
+                
+                results.append({
+                    "text": f"{title} - {selftext}",
+                    "url": f"https://reddit.com{p_data.get('permalink')}",
+                    "source": f"Reddit (r/{sub})",
+                    "timestamp": datetime.now().isoformat()
+                })
+        except Exception as e:
+            logger.error(f"Reddit fetch error for {sub}: {e}")
         return results
 
 class InvestingComSource(BaseSource):
     """
     Fetches news from Investing.com RSS (General Market News).
+    The feed is the same for every query, so it is downloaded and indexed
+    once per cache TTL and each query only filters the shared index.
     """
     # Investing.com RSS feeds (General Market)
     RSS_URL = "https://www.investing.com/rss/news_25.rss" # Commodities/Futures often relevant
 
+    # Relaxed matching: a specific query (e.g. "Azimut") rarely appears in
+    # general news, so broad market terms also count as a match
+    GENERAL_TERMS = ["market", "economy", "stock", "rate", "price", "invest", "dow", "nasdaq", "egx"]
+
     async def fetch(self, query: str) -> List[Dict]:
         try:
-             # This is a general feed, so we filter by query locally
-            feed = await asyncio.wait_for(
-                asyncio.to_thread(feedparser.parse, self.RSS_URL),
-                timeout=5.0
-            )
+            # This is a general feed, so we filter by query locally
+            index = await feed_client.fetch_index(self.RSS_URL)
             results = []
             
             query_lower = query.lower()
             
-            for entry in feed.entries:
-                title = entry.get("title", "")
-                summary = entry.get("summary", entry.get("description", ""))
-                text_content = f"{title} {summary}".lower()
-                
-                # Relaxed matching: match query OR general market terms
-                # If query is very specific (e.g. "Azimut"), it might not match general news.
-                # So we always return some general market news if specific fail?
-                # For now, just broaden "market", "economy", "stock", "rates"
-                general_terms = ["market", "economy", "stock", "rate", "price", "invest", "dow", "nasdaq", "egx"]
-                
+            for entry, text_content in index:
                 is_match = query_lower in text_content
                 if not is_match:
-                     is_match = any(term in text_content for term in general_terms)
+                     is_match = any(term in text_content for term in self.GENERAL_TERMS)
 
                 if is_match: 
                      results.append({
@@ -169,10 +170,7 @@ class YahooFinanceSource(BaseSource):
             encoded_query = quote(query)
             url = self.BASE_URL.format(query=encoded_query)
             
-            feed = await asyncio.wait_for(
-                asyncio.to_thread(feedparser.parse, url),
-                timeout=5.0
-            )
+            feed = await feed_client.fetch(url)
             
             results = []
             for entry in feed.entries[:5]:  # Top 5 articles
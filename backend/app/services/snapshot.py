@@ -0,0 +1,69 @@
+"""Snapshot Service - Immutable, versioned view of the latest orchestrator results"""
+import logging
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EMPTY = MappingProxyType({})
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    Read-only results of the latest cycle, indexed by fund.
+    A snapshot is never mutated; publishing swaps in a new one (copy-on-write),
+    so a reader that grabbed a snapshot always sees one consistent version.
+    """
+    version: int = 0
+    timestamp: Optional[str] = None
+    prices: Mapping[str, Dict] = field(default_factory=lambda: EMPTY)
+    sentiments: Mapping[str, Dict] = field(default_factory=lambda: EMPTY)
+    recommendations: Mapping[str, Dict] = field(default_factory=lambda: EMPTY)
+    alerts: Tuple[Dict, ...] = ()
+    summary: Mapping[str, int] = field(default_factory=lambda: EMPTY)
+
+
+class SnapshotStore:
+    """Holds the current snapshot and publishes new versions"""
+
+    SECTIONS = ("prices", "sentiments", "recommendations", "alerts", "summary")
+
+    def __init__(self):
+        self._current = Snapshot()
+
+    def current(self) -> Snapshot:
+        """Latest snapshot (O(1), no copying)"""
+        return self._current
+
+    def publish(self, **sections) -> Snapshot:
+        """
+        Publish a new version. Sections that are not passed are carried over
+        from the previous snapshot unchanged.
+        """
+        unknown = set(sections) - set(self.SECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown snapshot sections: {sorted(unknown)}")
+
+        frozen = {}
+        for name, value in sections.items():
+            if value is None:
+                continue
+            frozen[name] = tuple(value) if name == "alerts" else MappingProxyType(dict(value))
+
+        snapshot = replace(
+            self._current,
+            version=self._current.version + 1,
+            timestamp=datetime.now().isoformat(),
+            **frozen,
+        )
+        # Single reference swap: readers see either the old or the new snapshot
+        self._current = snapshot
+        logger.debug(f"Published snapshot v{snapshot.version} ({', '.join(frozen) or 'no changes'})")
+        return snapshot
+
+
+# Global snapshot store shared by the orchestrator and read routes
+snapshot_store = SnapshotStore()
@@ -0,0 +1,208 @@
+"""Text Scorer Service - Batch lexicon sentiment scoring with NumPy"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:['’-][a-z0-9]+)*")
+NEGATIONS = ("no", "not", "n't", "never", "cannot")
+
+# Batches at least this large are split across the scoring process pool
+PROCESS_POOL_THRESHOLD = int(os.getenv("SCORER_PROCESS_THRESHOLD", "2000"))
+PROCESS_POOL_WORKERS = int(os.getenv("SCORER_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+
+class LexiconScorer:
+    """
+    Polarity scorer over a word lexicon loaded once.
+
+    Uses TextBlob's English lexicon (the same word polarities as
+    ``SentimentAnalyzer.analyze_tweet``) when TextBlob is installed and the
+    bullish / bearish keyword lists otherwise. A batch is tokenized once,
+    mapped to lexicon ids, and scored with array operations: adverb
+    intensifiers ("very good") scale the next word, a preceding negation
+    ("not good") flips it by -0.5 as in TextBlob, and each text's polarity
+    is the mean of its assessments.
+    """
+
+    def __init__(self, lexicon: Optional[Dict[str, Dict]] = None):
+        self._vocab: Dict[str, int] = {}
+        self._polarity = np.zeros(0)
+        self._intensity = np.zeros(0)
+        self._modifier = np.zeros(0, dtype=bool)
+        self._negation = np.zeros(0, dtype=bool)
+        self.source = None
+        if lexicon is not None:
+            self._build(lexicon, "custom")
+
+    @property
+    def loaded(self) -> bool:
+        return self.source is not None
+
+    def load(self) -> "LexiconScorer":
+        """Load the lexicon (idempotent)"""
+        if self.loaded:
+            return self
+        try:
+            from textblob.en import sentiment as pattern_lexicon
+            lexicon = {
+                word: {"polarity": senses[None][0], "intensity": senses[None][2], "modifier": "RB" in senses}
+                for word, senses in pattern_lexicon.items()
+                if None in senses
+            }
+            self._build(lexicon, "textblob")
+        except ImportError:
+            from app.agents.sentiment_analyzer import BEARISH_KEYWORDS, BULLISH_KEYWORDS
+            lexicon = {word: {"polarity": 0.5} for word in BULLISH_KEYWORDS}
+            lexicon.update({word: {"polarity": -0.5} for word in BEARISH_KEYWORDS})
+            self._build(lexicon, "keywords")
+        logger.info(f"📖 Lexicon scorer loaded {len(self._vocab)} words ({self.source})")
+        return self
+
+    def _build(self, lexicon: Dict[str, Dict], source: str):
+        words = list(lexicon) + [n for n in NEGATIONS if n not in lexicon]
+        self._vocab = {word: i for i, word in enumerate(words)}
+        self._polarity = np.array([lexicon.get(w, {}).get("polarity", 0.0) for w in words])
+        self._intensity = np.array([lexicon.get(w, {}).get("intensity", 1.0) for w in words])
+        self._modifier = np.array([lexicon.get(w, {}).get("modifier", False) for w in words])
+        self._negation = np.array([w in NEGATIONS for w in words])
+        self.source = source
+
+    def polarities(self, texts: Sequence[str]) -> np.ndarray:
+        """Polarity in [-1, 1] for every text"""
+        if not self.loaded:
+            self.load()
+        vocab = self._vocab
+        ids: List[int] = []
+        owners: List[int] = []
+        for row, text in enumerate(texts):
+            for token in TOKEN_RE.findall(text.lower().replace("n't", " n't")):
+                ids.append(vocab.get(token, -1))
+                owners.append(row)
+
+        result = np.zeros(len(texts))
+        if not ids:
+            return result
+        ids = np.array(ids)
+        owners = np.array(owners)
+
+        known = ids >= 0
+        safe_ids = np.where(known, ids, 0)
+        negation = known & self._negation[safe_ids]
+        modifier = known & self._modifier[safe_ids]
+        assessed = known & ~negation
+
+        # Previous token within the same text
+        same_text = np.zeros(len(ids), dtype=bool)
+        same_text[1:] = owners[1:] == owners[:-1]
+        prev_modifier = np.zeros(len(ids), dtype=bool)
+        prev_modifier[1:] = modifier[:-1] & same_text[1:]
+        prev_negation = np.zeros(len(ids), dtype=bool)
+        prev_negation[1:] = negation[:-1] & same_text[1:]
+
+        values = self._polarity[safe_ids].copy()
+        # "very good": the modifier scales the next word and is not assessed itself
+        boosted = assessed & prev_modifier
+        values[boosted] *= self._intensity[safe_ids[np.flatnonzero(boosted) - 1]]
+        merged = np.zeros(len(ids), dtype=bool)
+        merged[:-1] = boosted[1:]
+        assessed &= ~merged
+
+        # "not good" / "not very good": negation flips by -0.5
+        negated = prev_negation.copy()
+        negated[1:] |= boosted[1:] & prev_negation[:-1]
+        values[negated] *= -0.5
+
+        totals = np.bincount(owners[assessed], weights=values[assessed], minlength=len(texts))
+        counts = np.bincount(owners[assessed], minlength=len(texts))
+        np.divide(totals, counts, out=result, where=counts > 0)
+        return np.clip(result, -1.0, 1.0)
+
+    def score_texts(self, texts: Sequence[str], fund_name: Optional[str] = None) -> List[Dict]:
+        """Results shaped like ``SentimentAnalyzer.analyze_tweet``"""
+        polarity = self.polarities(texts)
+        results = []
+        for text, value in zip(texts, polarity.tolist()):
+            if value > 0.1:
+                sentiment, score = "positive", value
+            elif value < -0.1:
+                sentiment, score = "negative", abs(value)
+            else:
+                sentiment, score = "neutral", 0.5
+            results.append({
+                "text": text[:100],
+                "fund": fund_name,
+                "sentiment": sentiment,
+                "score": round(score, 4),
+                "polarity": round(value, 4),
+            })
+        return results
+
+
+# Global scorer, loaded at startup
+text_scorer = LexiconScorer()
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _init_worker():
+    # Runs once per worker process: load the lexicon before the first chunk
+    text_scorer.load()
+
+
+def _score_chunk(texts: List[str], fund_name: Optional[str]) -> List[Dict]:
+    # Runs in a worker process
+    return text_scorer.score_texts(texts, fund_name)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # Spawned, not forked: the server process holds live executor threads and
+        # network handles that a forked child would inherit in an unknown state
+        _pool = ProcessPoolExecutor(
+            max_workers=PROCESS_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+    return _pool
+
+
+async def score_batch(texts: Sequence[str], fund_name: Optional[str] = None) -> List[Dict]:
+    """
+    Score a batch without blocking the event loop for long: small batches run
+    inline, large ones are split across the scoring process pool. If the pool
+    breaks the batch is scored in-process and a new pool is started next time.
+    """
+    texts = list(texts)
+    if len(texts) < PROCESS_POOL_THRESHOLD or PROCESS_POOL_WORKERS <= 1:
+        return text_scorer.score_texts(texts, fund_name)
+
+    loop = asyncio.get_running_loop()
+    pool = _get_pool()
+    size = -(-len(texts) // PROCESS_POOL_WORKERS)
+    chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+    try:
+        parts = await asyncio.gather(*(loop.run_in_executor(pool, _score_chunk, chunk, fund_name) for chunk in chunks))
+    except BrokenProcessPool as e:
+        # A crashed worker breaks the whole pool: replace it for later batches, score this one here
+        logger.error(f"Scoring process pool broke, scoring {len(texts)} texts in-process: {e}")
+        shutdown_pool()
+        return text_scorer.score_texts(texts, fund_name)
+    return [result for part in parts for result in part]
+
+
+def shutdown_pool():
+    """Stop the scoring process pool"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
@@ -12,6 +12,9 @@ class TradingService:
     """
     Manages trade execution, supports both Paper Trading and Live Trading (future).
     """
+
+    PAPER_POSITION_SIZE = 1000.0  # EGP per paper trade
+    AUTO_TRADE_CONFIDENCE = 0.85  # minimum confidence for the orchestrator to auto-trade
     
     def __init__(self, db: Session = None):
         self.db = db or SessionLocal()
@@ -66,7 +69,7 @@ class TradingService:
         """
         try:
             # Simple logic: Fixed position size for now
-            position_size = 1000.0  # $1000 per trade
+            position_size = self.PAPER_POSITION_SIZE
             quantity = position_size / price
             
             # Validation (Apply same rules to paper trading to test them)
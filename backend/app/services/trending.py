@@ -0,0 +1,222 @@
+"""Trending Service - Streaming heavy-hitter keywords per fund over a sliding window"""
+import heapq
+import logging
+import os
+import re
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"[a-z][a-z'-]{2,}")
+STOPWORDS = frozenset(
+    """
+    the and for are but not you all any can had her was one our out has have been from this that with
+    they will would there their what when where which who why how its into than then them these those
+    about after again also more most other over some such very just only own same said says say new
+    amid could should may might while per via yet upon under until off near his him she out get got
+    """.split()
+)
+
+TRENDING_WINDOW = float(os.getenv("TRENDING_WINDOW_SECONDS", str(6 * 3600)))
+TRENDING_BUCKETS = int(os.getenv("TRENDING_BUCKETS", "12"))
+TRENDING_TOP_K = int(os.getenv("TRENDING_TOP_K", "20"))  # terms precomputed per window
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased words of 3+ letters, stopwords removed, each counted once per text"""
+    return list(dict.fromkeys(t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS))
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy hitters with ``capacity`` counters.
+    Counts are over-estimates by at most ``error``; any term whose true
+    frequency exceeds total / capacity is guaranteed to be tracked.
+    """
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self._heap: List[Tuple[int, str]] = []  # lazy min-heap of (count, term)
+
+    def add(self, term: str, count: int = 1):
+        if term in self.counts:
+            self.counts[term] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[term] = count
+            self.errors[term] = 0
+        else:
+            floor, victim = self._pop_min()
+            del self.counts[victim]
+            del self.errors[victim]
+            self.counts[term] = floor + count
+            self.errors[term] = floor
+        heapq.heappush(self._heap, (self.counts[term], term))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, t) for t, c in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Tuple[int, str]:
+        while True:
+            count, term = heapq.heappop(self._heap)
+            if self.counts.get(term) == count:  # skip entries made stale by later increments
+                return count, term
+
+
+class CountMinSketch:
+    """Fixed-size frequency sketch with exponential decay (the long-run baseline)"""
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width))
+        self.total = 0.0
+        self._rows = np.arange(depth)
+
+    def _cells(self, term: str) -> Tuple[np.ndarray, List[int]]:
+        # hash() is salted per process, which is fine for an in-memory sketch
+        return self._rows, [hash((row, term)) % self.width for row in range(self.depth)]
+
+    def add(self, term: str, count: float = 1.0):
+        rows, cols = self._cells(term)
+        self.table[rows, cols] += count
+        self.total += count
+
+    def estimate(self, term: str) -> float:
+        rows, cols = self._cells(term)
+        return float(self.table[rows, cols].min())
+
+    def decay(self, factor: float):
+        self.table *= factor
+        self.total *= factor
+
+
+class TrendingTracker:
+    """
+    Trending terms for one fund.
+
+    The window is a ring of ``buckets`` time slices, each with its own
+    Space-Saving summary; expired slices are dropped whole, so the window
+    slides without per-term bookkeeping. A decayed Count-Min Sketch keeps the
+    long-run baseline used for "rising" scores. Memory is fixed by
+    ``buckets * capacity`` counters plus the sketch, however many items are
+    ingested. Top-k lists are recomputed on ingest, so reads are O(k).
+    """
+
+    def __init__(
+        self,
+        window: float = TRENDING_WINDOW,
+        buckets: int = TRENDING_BUCKETS,
+        capacity: int = 256,
+        top_k: int = TRENDING_TOP_K,
+        baseline_half_life: float = 7 * 86400.0,
+        min_count: int = 2,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.bucket_seconds = window / buckets
+        self.buckets = buckets
+        self.capacity = capacity
+        self.top_k = top_k
+        self.baseline_half_life = baseline_half_life
+        self.min_count = min_count
+        self.clock = clock
+
+        self._window: Deque[Tuple[int, SpaceSaving, int]] = deque()  # (slice id, summary, tokens)
+        self.baseline = CountMinSketch()
+        self._baseline_at: Optional[float] = None
+        self._top: List[Dict] = []
+        self._rising: List[Dict] = []
+
+    def ingest(self, texts: Iterable[str], now: Optional[float] = None):
+        """Tokenize texts into the current slice and the baseline"""
+        now = self.clock() if now is None else now
+        self._decay_baseline(now)
+        slice_id = int(now // self.bucket_seconds)
+        if not self._window or self._window[-1][0] != slice_id:
+            self._window.append((slice_id, SpaceSaving(self.capacity), 0))
+        current_id, summary, tokens = self._window[-1]
+
+        for text in texts:
+            for term in tokenize(text):
+                summary.add(term)
+                self.baseline.add(term)
+                tokens += 1
+        self._window[-1] = (current_id, summary, tokens)
+        self._recompute(slice_id)
+
+    def _decay_baseline(self, now: float):
+        if self._baseline_at is not None and now > self._baseline_at:
+            self.baseline.decay(0.5 ** ((now - self._baseline_at) / self.baseline_half_life))
+        self._baseline_at = now if self._baseline_at is None else max(now, self._baseline_at)
+
+    def _expire(self, slice_id: int):
+        while self._window and self._window[0][0] <= slice_id - self.buckets:
+            self._window.popleft()
+
+    def _recompute(self, slice_id: int):
+        self._expire(slice_id)
+        merged: Dict[str, int] = {}
+        window_tokens = 0
+        for _, summary, tokens in self._window:
+            window_tokens += tokens
+            for term, count in summary.counts.items():
+                merged[term] = merged.get(term, 0) + count
+
+        candidates = [(term, count) for term, count in merged.items() if count >= self.min_count]
+        scored = []
+        for term, count in candidates:
+            # Smoothed ratio of the term's share in the window vs. its long-run share
+            window_share = (count + 1) / (window_tokens + 1)
+            baseline_share = (self.baseline.estimate(term) + 1) / (self.baseline.total + 1)
+            scored.append({"term": term, "count": count, "rising": round(window_share / baseline_share, 3)})
+
+        self._top = heapq.nlargest(self.top_k, scored, key=lambda s: s["count"])
+        self._rising = heapq.nlargest(self.top_k, scored, key=lambda s: s["rising"])
+
+    def _refresh_if_expired(self):
+        slice_id = int(self.clock() // self.bucket_seconds)
+        if self._window and self._window[0][0] <= slice_id - self.buckets:
+            self._recompute(slice_id)
+
+    def top(self, k: Optional[int] = None) -> List[Dict]:
+        """Most frequent terms in the window"""
+        self._refresh_if_expired()
+        return self._top[: k or self.top_k]
+
+    def rising(self, k: Optional[int] = None) -> List[Dict]:
+        """Terms most over-represented in the window compared with the baseline"""
+        self._refresh_if_expired()
+        return self._rising[: k or self.top_k]
+
+
+class TrendingEngine:
+    """One tracker per fund"""
+
+    def __init__(self, **tracker_options):
+        self.tracker_options = tracker_options
+        self.trackers: Dict[str, TrendingTracker] = {}
+
+    def ingest(self, fund_name: str, texts: Iterable[str], now: Optional[float] = None):
+        tracker = self.trackers.get(fund_name)
+        if tracker is None:
+            tracker = self.trackers[fund_name] = TrendingTracker(**self.tracker_options)
+        tracker.ingest(texts, now)
+
+    def keywords(self, fund_name: str, k: int = 10) -> List[str]:
+        tracker = self.trackers.get(fund_name)
+        return [entry["term"] for entry in tracker.top(k)] if tracker else []
+
+    def snapshot(self, fund_name: str, k: int = 10) -> Dict[str, List[Dict]]:
+        tracker = self.trackers.get(fund_name)
+        if tracker is None:
+            return {"top": [], "rising": []}
+        return {"top": tracker.top(k), "rising": tracker.rising(k)}
+
+
+# Global trending engine fed by the sentiment fetcher
+trending_engine = TrendingEngine()
@@ -0,0 +1,246 @@
+"""Write-Behind Service - Buffers rows in memory and bulk-inserts them in the background"""
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from app.models.database import PriceHistory, SentimentRecord, SessionLocal
+from app.services.executors import BoundedExecutor, db_executor
+from app.services.rollups import upsert_sentiment_rollups
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()  # queue sentinel used to wake the flush loop on shutdown
+
+
+class WriteBehindWriter:
+    """
+    Asynchronous write-behind pipeline for one table.
+
+    Producers call ``submit`` (never blocks, drops the oldest row when the
+    queue is full) or ``await put`` (waits for room: real backpressure).
+    A background task drains the queue and writes a batch whenever
+    ``batch_size`` rows are waiting or ``flush_interval`` seconds have passed,
+    using one bulk INSERT and one transaction per batch. Failed batches are
+    retried with exponential backoff before being dropped. An optional
+    ``on_batch(session, rows)`` hook runs in the same transaction (e.g. to
+    maintain rollups).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        model,
+        to_row: Callable[[Dict], Dict],
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
+        max_queue: int = 10000,
+        max_retries: int = 5,
+        retry_delay: float = 0.5,
+        session_factory: Callable = SessionLocal,
+        executor: Optional[BoundedExecutor] = None,
+        on_batch: Optional[Callable] = None,
+    ):
+        self.name = name
+        self.model = model
+        self.to_row = to_row
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.session_factory = session_factory
+        self.executor = executor or db_executor
+        self.on_batch = on_batch
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.stats = {
+            "queued": 0,
+            "written": 0,
+            "batches": 0,
+            "dropped": 0,
+            "retries": 0,
+            "failed": 0,
+        }
+
+    def submit(self, item: Dict) -> bool:
+        """Queue an item without waiting; evicts the oldest row if the queue is full"""
+        try:
+            row = self.to_row(item)
+        except Exception as e:
+            logger.error(f"Write-behind '{self.name}': could not map item to row: {e}")
+            return False
+
+        if self._queue.full():
+            try:
+                self._queue.get_nowait()
+                self.stats["dropped"] += 1
+            except asyncio.QueueEmpty:
+                pass
+        self._queue.put_nowait(row)
+        self.stats["queued"] += 1
+        return True
+
+    async def put(self, item: Dict):
+        """Queue an item, waiting for room when the writer is behind"""
+        await self._queue.put(self.to_row(item))
+        self.stats["queued"] += 1
+
+    async def start(self):
+        """Start the background flush loop"""
+        if self._task is None or self._task.done():
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"💾 Write-behind '{self.name}' started (batch={self.batch_size}, every {self.flush_interval}s)")
+
+    async def stop(self, timeout: float = 30.0):
+        """Flush what is queued, then stop the background loop"""
+        if self._task is None:
+            return
+        self._stopping = True
+        try:
+            # Wake the loop if it is idle; a full queue wakes it anyway
+            self._queue.put_nowait(_STOP)
+        except asyncio.QueueFull:
+            pass
+        try:
+            await asyncio.wait_for(self._task, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Write-behind '{self.name}' did not flush within {timeout}s, {self._queue.qsize()} rows lost")
+        self._task = None
+
+    async def _run(self):
+        while not (self._stopping and self._queue.empty()):
+            batch = await self._next_batch()
+            if batch:
+                await self._write_with_retry(batch)
+
+    async def _next_batch(self) -> List[Dict]:
+        """Wait for the first row, then collect until the batch is full or the interval ends"""
+        first = await self._queue.get()
+        batch = [] if first is _STOP else [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size and not self._stopping:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                row = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            if row is not _STOP:
+                batch.append(row)
+        batch.extend(self._drain(self.batch_size - len(batch)))
+        return batch
+
+    def _drain(self, limit: int) -> List[Dict]:
+        rows = []
+        while len(rows) < limit and not self._queue.empty():
+            row = self._queue.get_nowait()
+            if row is not _STOP:
+                rows.append(row)
+        return rows
+
+    async def _write_with_retry(self, rows: List[Dict]):
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self.executor.run(self._write_batch, rows)
+                self.stats["written"] += len(rows)
+                self.stats["batches"] += 1
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self.stats["failed"] += len(rows)
+                    logger.error(f"❌ Write-behind '{self.name}': dropping {len(rows)} rows after {attempt + 1} attempts: {e}")
+                    return
+                self.stats["retries"] += 1
+                delay = self.retry_delay * (2 ** attempt)
+                logger.warning(f"Write-behind '{self.name}' failed ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    def _write_batch(self, rows: List[Dict]):
+        """One bulk INSERT in one transaction (runs on the database executor)"""
+        db = self.session_factory()
+        try:
+            db.execute(insert(self.model), rows)
+            if self.on_batch is not None:
+                self.on_batch(db, rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, "queue_depth": self._queue.qsize(), "running": bool(self._task and not self._task.done())}
+
+
+def _to_utc(timestamp) -> datetime:
+    """Local ISO timestamps from the fetchers -> naive UTC, matching the table defaults"""
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    if timestamp is None:
+        return datetime.utcnow()
+    return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def price_tick_to_row(price_info: Dict) -> Dict:
+    """Map a PriceMonitor tick to a PriceHistory row"""
+    return {
+        "fund_name": price_info["fund"],
+        "ticker": price_info.get("ticker"),
+        "price": price_info["price"],
+        "change_percent": price_info.get("change", 0.0),
+        "volume": int(price_info.get("volume") or 0),
+        "timestamp": _to_utc(price_info.get("timestamp")),
+    }
+
+
+def sentiment_to_row(sentiment: Dict) -> Dict:
+    """Map a fund sentiment result to a SentimentRecord row"""
+    distribution = sentiment.get("sentiment_distribution", {})
+    return {
+        "fund_name": sentiment["fund"],
+        "positive": distribution.get("positive", 0.0),
+        "neutral": distribution.get("neutral", 0.0),
+        "negative": distribution.get("negative", 0.0),
+        "overall_score": sentiment.get("overall_score", 0.0),
+        "source_count": int(round(sentiment.get("source_count") or 0)),
+        "new_items": int(sentiment.get("new_items") or 0),
+        "timestamp": _to_utc(sentiment.get("timestamp")),
+    }
+
+
+# Global writers
+price_history_writer = WriteBehindWriter(
+    "price_history",
+    PriceHistory,
+    price_tick_to_row,
+    batch_size=int(os.getenv("PRICE_WRITE_BATCH", "500")),
+    flush_interval=float(os.getenv("PRICE_WRITE_INTERVAL", "5")),
+    max_queue=int(os.getenv("PRICE_WRITE_QUEUE", "10000")),
+)
+
+sentiment_record_writer = WriteBehindWriter(
+    "sentiment_records",
+    SentimentRecord,
+    sentiment_to_row,
+    batch_size=int(os.getenv("SENTIMENT_WRITE_BATCH", "100")),
+    flush_interval=float(os.getenv("SENTIMENT_WRITE_INTERVAL", "10")),
+    max_queue=int(os.getenv("SENTIMENT_WRITE_QUEUE", "5000")),
+    on_batch=upsert_sentiment_rollups,
+)
+
+WRITERS = [price_history_writer, sentiment_record_writer]
+
+
+def get_writer_stats() -> Dict[str, Dict]:
+    """Metrics for every registered writer"""
+    return {writer.name: writer.get_stats() for writer in WRITERS}
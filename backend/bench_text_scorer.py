@@ -0,0 +1,52 @@
+"""Benchmark: batch LexiconScorer vs. the per-text TextBlob path of SentimentAnalyzer.analyze_tweet"""
+import asyncio
+import random
+import time
+
+from app.agents.sentiment_analyzer import SentimentAnalyzer
+from app.services.text_scorer import LexiconScorer, score_batch, shutdown_pool, text_scorer
+
+WORDS = (
+    "gold rally strong weak market stocks crash surge inflation not very good bad "
+    "investors expect growth egypt pound bonds yields fall rise sharply safe haven risk"
+).split()
+
+
+def make_texts(n, seed=7):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 25))) for _ in range(n)]
+
+
+async def main(n=5000):
+    texts = make_texts(n)
+    analyzer = SentimentAnalyzer()
+
+    started = time.perf_counter()
+    baseline = [await analyzer.analyze_tweet(text, "az_gold") for text in texts]
+    per_text = time.perf_counter() - started
+
+    started = time.perf_counter()
+    LexiconScorer().load()
+    load_time = time.perf_counter() - started
+
+    text_scorer.load()
+    started = time.perf_counter()
+    batch = text_scorer.score_texts(texts, "az_gold")
+    inline = time.perf_counter() - started
+
+    started = time.perf_counter()
+    pooled = await score_batch(texts, "az_gold")
+    pooled_time = time.perf_counter() - started
+    shutdown_pool()
+
+    agree = sum(a["sentiment"] == b["sentiment"] for a, b in zip(baseline, batch)) / n
+    print(f"texts:                 {n}")
+    print(f"TextBlob per text:     {per_text:.3f}s ({n / per_text:,.0f} texts/s)")
+    print(f"lexicon load (once):   {load_time:.3f}s")
+    print(f"LexiconScorer batch:   {inline:.3f}s ({n / inline:,.0f} texts/s, {per_text / inline:.1f}x)")
+    print(f"score_batch (pooled):  {pooled_time:.3f}s ({len(pooled)} results)")
+    print(f"label agreement:       {agree:.1%}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
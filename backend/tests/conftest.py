@@ -0,0 +1,71 @@
+import asyncio
+import heapq
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+
+class FakeClock:
+    """
+    Manually advanced stand-in for ``time.time`` / ``time.monotonic``.
+    ``sleep`` waits on virtual time, which only ``advance`` moves forward.
+    """
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self._sleepers = []  # heap of (wake time, seq, future)
+        self._seq = 0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float):
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._sleepers, (self.now + max(delay, 0.0), self._seq, future))
+        self._seq += 1
+        await future
+
+    async def advance(self, seconds: float):
+        """Move time forward, waking sleepers in order and letting them run at their wake time"""
+        end = self.now + seconds
+        await self._settle()
+        while self._sleepers and self._sleepers[0][0] <= end:
+            wake, _, future = heapq.heappop(self._sleepers)
+            self.now = max(self.now, wake)
+            if not future.done():
+                future.set_result(None)
+            await self._settle()
+        self.now = end
+
+    @staticmethod
+    async def _settle():
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest_asyncio.fixture
+async def local_server():
+    """Serve ``{path: handler}`` routes on a free local port; returns the base URL"""
+    runners = []
+
+    async def serve(routes):
+        app = web.Application()
+        for path, handler in routes.items():
+            app.router.add_get(path, handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        runners.append(runner)
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    yield serve
+    for runner in runners:
+        await runner.cleanup()
@@ -0,0 +1,53 @@
+import numpy as np
+
+from app.agents.recommendation_engine import RecommendationEngine
+from app.services.adaptive_polling import AdaptivePolling, realized_volatility
+
+
+def ticks(prices, spacing=10.0):
+    return np.asarray(prices, dtype=float), np.arange(len(prices)) * spacing
+
+
+def test_realized_volatility_is_scaled_by_tick_spacing():
+    prices, timestamps = ticks([100, 101, 100, 101, 100])
+    dense = realized_volatility(prices, timestamps)
+    sparse = realized_volatility(prices, timestamps * 4)
+    assert dense > 0
+    assert np.isclose(dense, 2 * sparse)
+    assert realized_volatility(*ticks([100])) is None
+
+
+def test_quiet_fund_backs_off_and_volatile_fund_tightens():
+    polling = AdaptivePolling(min_interval=10, max_interval=300, backoff=2, target_move=0.0005)
+
+    flat = ticks([1000.0 + 0.001 * i for i in range(30)])
+    intervals = [polling.observe("halan_saving", *flat, now=t) for t in range(0, 1000, 100)]
+    assert intervals[:4] == [20, 40, 80, 160]
+    assert intervals[-1] == 300
+
+    swings = ticks([100.0 + (i % 2) for i in range(30)])
+    assert polling.observe("az_gold", *swings, now=0) == 10
+
+    # Urgent funds are polled at the fastest rate, even if quiet
+    assert polling.observe("halan_saving", *flat, urgent=True, now=1000) == 10
+    assert not polling.is_due("halan_saving", now=1004)
+    assert polling.is_due("halan_saving", now=1006)
+
+
+def test_expedite_pulls_the_next_poll_forward():
+    polling = AdaptivePolling(min_interval=10, max_interval=300)
+    flat = ticks([50.0] * 30)
+    for t in range(0, 600, 60):
+        polling.observe("az_opportunity", *flat, now=t)
+    assert not polling.is_due("az_opportunity", now=560)
+
+    polling.expedite("az_opportunity")
+    assert polling.is_due("az_opportunity", now=560)
+
+
+def test_near_strong_signal():
+    engine = RecommendationEngine()
+    assert engine.near_strong_signal(-1.6, 0.4)  # 80% of the way to STRONG_BUY
+    assert engine.near_strong_signal(2.5, -0.6)  # past STRONG_SELL
+    assert not engine.near_strong_signal(-1.6, 0.1)
+    assert not engine.near_strong_signal(0.2, 0.9)
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from app.agents.recommendation_engine import RecommendationEngine
+from app.services.backtest import (
+    SIGNAL_NAMES,
+    STRONG_BUY,
+    BacktestParams,
+    FundSeries,
+    classify,
+    grid_params,
+    run_backtest,
+    sweep,
+)
+from app.services.indicators import wilder_rsi, wilder_rsi_series
+
+
+def make_series(n=2000, seed=1, fund="az_gold"):
+    rng = np.random.default_rng(seed)
+    timestamps = np.arange(n) * 60.0
+    prices = 100 + np.cumsum(rng.normal(0, 0.5, n))
+    changes = rng.normal(0, 2.0, n)
+    sentiment_ts = timestamps[::50]
+    sentiment = rng.uniform(-1, 1, len(sentiment_ts))
+    return FundSeries.build(fund, timestamps, prices, changes, sentiment_ts, sentiment)
+
+
+def test_rsi_series_matches_incremental_rsi():
+    prices = make_series(300).prices
+    series = wilder_rsi_series(prices)
+    assert series[:14].tolist() == [50.0] * 14
+    assert series[-1] == pytest.approx(wilder_rsi(prices), abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_classification_matches_engine():
+    series = make_series(500)
+    codes, confidence = classify(series, BacktestParams())
+    engine = RecommendationEngine()
+
+    for i in range(30, 500, 37):
+        engine.rsi_state.clear()
+        rec = await engine.generate_recommendation(
+            "az_gold",
+            {"price": series.prices[i], "change": series.changes[i]},
+            {"overall_score": series.sentiment[i]},
+            [{"price": p} for p in series.prices[: i + 1]],
+            {"bb_percent_b": series.percent_b[i], "bb_width": series.band_width[i]},
+        )
+        assert rec["recommendation"] == SIGNAL_NAMES[codes[i]]
+        assert rec["confidence"] == pytest.approx(confidence[i])
+
+
+def test_daily_spend_limit_caps_buys():
+    series = make_series(3000)
+    series.changes[::2] = -5.0
+    series.changes[1::2] = 0.0
+    series.sentiment[:] = 0.9  # STRONG_BUY every other tick, each one a new signal
+    params = BacktestParams(position_size=1000.0, daily_spend_limit=5000.0)
+
+    codes, _ = classify(series, params)
+    assert (codes[::2] == STRONG_BUY).all()
+    assert (codes[1::2] != STRONG_BUY).all()
+
+    result = run_backtest([series], params)
+    days = len(np.unique(series.timestamps // 86400))
+    assert result["buys"] == 5 * days
+    assert result["rejected"] == len(series.prices[::2]) - 5 * days
+
+
+def test_trades_only_when_signal_changes():
+    series = make_series(3000)
+    series.changes[:] = -5.0
+    series.sentiment[:] = 0.9  # every tick is the same STRONG_BUY
+    params = BacktestParams()
+
+    assert run_backtest([series], params)["buys"] == 1
+
+    series.changes[1000:1010] = 0.0  # leaving STRONG re-arms the signal
+    assert run_backtest([series], params)["buys"] == 2
+
+
+def test_grid_sweep_evaluates_every_combination():
+    funds = [make_series(1000, seed=1), make_series(1000, seed=2, fund="az_opportunity")]
+    candidates = grid_params({"strong_buy_drop": [-3.0, -1.0], "auto_trade_confidence": [0.8, 0.9]})
+
+    results = sweep(funds, candidates, workers=2)
+
+    assert len(results) == 4
+    assert [r["pnl"] for r in results] == sorted((r["pnl"] for r in results), reverse=True)
+    assert set(results[0]["funds"]) == {"az_gold", "az_opportunity"}
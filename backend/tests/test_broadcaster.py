@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from app.services.broadcaster import CycleBroadcaster
+
+
+@pytest.mark.asyncio
+async def test_publish_reaches_every_subscriber():
+    broadcaster = CycleBroadcaster()
+    first, second = broadcaster.subscribe(), broadcaster.subscribe()
+
+    broadcaster.publish({"status": "success", "prices": []})
+
+    assert json.loads(await first.get())["status"] == "success"
+    assert json.loads(await second.get())["status"] == "success"
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_only_keeps_latest_cycle():
+    broadcaster = CycleBroadcaster(queue_size=1)
+    slow = broadcaster.subscribe()
+
+    for i in range(5):
+        broadcaster.publish({"cycle": i})
+
+    assert json.loads(await slow.get()) == {"cycle": 4}
+    assert broadcaster.stats["dropped"] == 4
+
+
+@pytest.mark.asyncio
+async def test_new_subscriber_receives_last_cycle():
+    broadcaster = CycleBroadcaster()
+    broadcaster.publish({"cycle": 1})
+
+    late = broadcaster.subscribe()
+    assert json.loads(await late.get()) == {"cycle": 1}
+
+    broadcaster.unsubscribe(late)
+    assert broadcaster.subscriber_count == 0
@@ -0,0 +1,53 @@
+import pytest
+
+from app.services.dedup import FingerprintStore
+from app.services.sentiment_aggregate import DecayedSentiment
+from app.services.sentiment_fetcher import RealSentimentFetcher
+
+
+def test_exact_and_near_duplicates_are_rejected():
+    store = FingerprintStore()
+    assert store.add("Gold prices hit record high as investors seek safety")
+    assert not store.add("GOLD prices hit record high, as investors seek safety!")
+    assert not store.add("Gold prices hit record high as investors seek safety - Reuters")
+    assert store.add("Gold prices fall as dollar strengthens")
+    assert store.get_stats()["unique"] == 2
+
+
+def test_fingerprints_expire_after_ttl(clock):
+    store = FingerprintStore(ttl=60, clock=clock)
+    assert store.add("Central bank holds rates steady this quarter")
+    clock.now += 61
+    assert store.add("Central bank holds rates steady this quarter")
+    assert len(store) == 1
+
+
+def test_aggregate_decays_by_half_life(clock):
+    aggregate = DecayedSentiment(half_life=100, clock=clock)
+    aggregate.add(positive=4)
+    clock.now += 100
+    aggregate.add(negative=2)
+
+    assert aggregate.total() == pytest.approx(4.0)
+    assert aggregate.distribution() == {"positive": 50.0, "neutral": 0.0, "negative": 50.0}
+
+
+class StaticSource:
+    def __init__(self, items):
+        self.items = items
+
+    async def fetch(self, query):
+        return [{"text": text, "source": "static"} for text in self.items]
+
+
+@pytest.mark.asyncio
+async def test_fetcher_scores_only_unseen_items():
+    source = StaticSource(["Gold rally lifts bullion to a record", "Gold rally lifts bullion to a record - Yahoo"])
+    fetcher = RealSentimentFetcher(sources=[source])
+
+    first = await fetcher.fetch_sentiment("az_gold")
+    second = await fetcher.fetch_sentiment("az_gold")
+
+    assert (first["new_items"], first["duplicates"]) == (1, 1)
+    assert (second["new_items"], second["duplicates"]) == (0, 2)
+    assert second["sentiment_distribution"] == first["sentiment_distribution"]
@@ -0,0 +1,126 @@
+import pytest
+
+from app import orchestrator as orchestrator_module
+from app.orchestrator import AgentOrchestrator
+from app.services.dependency_graph import PIPELINE, DependencyGraph
+from app.services.ring_buffer import PriceRingBuffer
+
+
+def test_changes_propagate_with_early_cutoff():
+    graph = DependencyGraph(PIPELINE)
+    assert graph.order.index("price") < graph.order.index("indicators") < graph.order.index("recommendation")
+
+    assert graph.set("az_gold", "price", [26.1, 0.4])
+    assert not graph.set("az_gold", "price", [26.1, 0.4])  # same fingerprint
+    assert graph.set("az_shariah", "sentiment", [0.3, {"positive": 60}, True])
+
+    assert graph.take("indicators") == {"az_gold"}
+    assert graph.take("recommendation") == {"az_gold", "az_shariah"}
+
+    graph.set("az_gold", "recommendation", ["BUY", 0.8])
+    assert graph.take("alerts") == {"az_gold", "az_shariah"}  # alerts also read price and sentiment
+    # Recomputed with the same output: alerts are not dirtied again
+    graph.set("az_gold", "recommendation", ["BUY", 0.8])
+    assert graph.take("alerts") == set()
+    assert graph.drain_changes() == {
+        "price": ["az_gold"], "sentiment": ["az_shariah"], "recommendation": ["az_gold"],
+    }
+    assert graph.drain_changes() == {}
+
+
+def test_cycle_graph_is_rejected():
+    with pytest.raises(ValueError):
+        DependencyGraph({"a": ("b",), "b": ("a",)})
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_recomputes_only_changed_funds(monkeypatch):
+    orchestrator = AgentOrchestrator()
+    engine = orchestrator.recommendation_engine
+    generated = []
+    original = engine.generate_recommendation
+
+    async def counting(fund_name, *args, **kwargs):
+        generated.append(fund_name)
+        return await original(fund_name, *args, **kwargs)
+
+    monkeypatch.setattr(engine, "generate_recommendation", counting)
+
+    funds = [f"fund_{i}" for i in range(50)]
+    orchestrator.last_prices = {f: {"fund": f, "price": 10.0, "change": 0.1} for f in funds}
+    orchestrator._track_prices(funds)
+    first = await orchestrator.recompute_recommendations("prices")
+    assert len(generated) == 50
+    assert first["changes"]["recommendation"] == sorted(funds)
+    assert first["summary"]["funds_monitored"] == 50
+
+    # One fund moves: one recommendation, and the unchanged ones are reused
+    generated.clear()
+    orchestrator.last_prices["fund_7"] = {"fund": "fund_7", "price": 10.0, "change": 6.0}
+    orchestrator._track_prices(funds)
+    second = await orchestrator.recompute_recommendations("prices")
+    assert generated == ["fund_7"]
+    assert second["changes"]["price"] == ["fund_7"]
+    assert second["changes"]["alerts"] == ["fund_7"]
+    assert [a["type"] for a in second["alerts"]] == ["HIGH_VOLATILITY"]
+    assert [(o["fund"], o["action"]) for o in second["opportunities"]] == [("fund_7", "SELL")]
+    assert len(second["recommendations"]) == 50
+
+    # Nothing changed: nothing recomputed and no new snapshot
+    generated.clear()
+    orchestrator._track_prices(funds)
+    third = await orchestrator.recompute_recommendations("prices")
+    assert generated == []
+    assert third["changes"] == {}
+    assert third["snapshot_version"] == second["snapshot_version"]
+
+
+@pytest.mark.asyncio
+async def test_new_tick_at_unchanged_price_recomputes_indicators():
+    orchestrator = AgentOrchestrator()
+    history = orchestrator.price_monitor.price_history["az_gold"] = PriceRingBuffer(100)
+    for i in range(30):
+        history.append(20.0 + i * 0.2, 0.1, 0, 1000.0 + i)
+    orchestrator.last_prices = {"az_gold": {"fund": "az_gold", "price": 25.8, "change": 0.1}}
+    orchestrator._track_prices(["az_gold"])
+    await orchestrator.recompute_recommendations("prices")
+
+    history.append(25.8, 0.1, 0, 1030.0)  # same price, one more tick
+    orchestrator._track_prices(["az_gold"])
+    result = await orchestrator.recompute_recommendations("prices")
+
+    assert result["changes"]["indicators"] == ["az_gold"]
+    assert orchestrator.recommendation_engine.rsi_state["az_gold"].last_timestamp == 1030.0
+
+
+@pytest.mark.asyncio
+async def test_strong_signal_trades_once_until_it_changes(monkeypatch):
+    orchestrator = AgentOrchestrator()
+    signal = {"recommendation": "STRONG_BUY"}
+    trades = []
+
+    async def fixed_signal(fund_name, price_data, *args, **kwargs):
+        return {
+            "fund": fund_name, "recommendation": signal["recommendation"], "confidence": 0.95,
+            "reason": f"price {price_data['price']}", "price_change": price_data["change"], "sentiment_score": 0.0,
+        }
+
+    monkeypatch.setattr(orchestrator.recommendation_engine, "generate_recommendation", fixed_signal)
+    monkeypatch.setattr(orchestrator_module.trading_service, "execute_paper_trade",
+                        lambda fund, action, price, confidence: trades.append((fund, action, price)))
+
+    async def tick(price):
+        orchestrator.last_prices = {"az_gold": {"fund": "az_gold", "price": price, "change": 0.5}}
+        orchestrator._track_prices(["az_gold"])
+        await orchestrator.recompute_recommendations("prices")
+
+    # Every tick moves the price, but the STRONG_BUY signal itself is unchanged
+    for price in (10.0, 10.1, 10.2):
+        await tick(price)
+    assert trades == [("az_gold", "BUY", 10.0)]
+
+    signal["recommendation"] = "HOLD"
+    await tick(10.3)
+    signal["recommendation"] = "STRONG_BUY"
+    await tick(10.4)
+    assert trades == [("az_gold", "BUY", 10.0), ("az_gold", "BUY", 10.4)]
@@ -0,0 +1,60 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.services.executors import BoundedExecutor, ExecutorSaturatedError
+
+
+@pytest.mark.asyncio
+async def test_run_returns_result_and_records_metrics():
+    executor = BoundedExecutor("test", max_workers=2, max_queue=2)
+    try:
+        assert await executor.run(sum, [1, 2, 3]) == 6
+        stats = executor.get_stats()
+        assert stats["submitted"] == 1
+        assert stats["completed"] == 1
+        assert stats["queue_depth"] == 0
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_rejects_work_when_saturated():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        blocked = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(ExecutorSaturatedError):
+            await executor.run(release.wait)
+
+        stats = executor.get_stats()
+        assert stats["rejected"] == 1
+        assert stats["running"] == 1
+        assert stats["queue_depth"] == 1
+    finally:
+        release.set()
+        await asyncio.gather(*blocked)
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_timed_out_thread_keeps_its_slot_and_is_reported_stuck():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=0, stuck_after=0.0)
+    release = threading.Event()
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.run(release.wait, timeout=0.05)
+
+        # The abandoned thread is still running, so the pool is still full
+        with pytest.raises(ExecutorSaturatedError):
+            await executor.run(release.wait)
+
+        stuck = executor.check_stuck()
+        assert len(stuck) == 1
+        assert executor.get_stats()["timeouts"] == 1
+    finally:
+        release.set()
+        executor.shutdown()
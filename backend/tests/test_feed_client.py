@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from app.services.feed_client import FeedClient
+from app.services.http_client import HttpClient
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test</title>
+<item><title>Gold rallies</title><link>http://example.com/1</link></item>
+</channel></rss>"""
+
+
+@pytest_asyncio.fixture
+async def feed_url(local_server):
+    served = {"full": 0, "not_modified": 0}
+
+    async def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            served["not_modified"] += 1
+            return web.Response(status=304)
+        served["full"] += 1
+        return web.Response(body=RSS, content_type="application/rss+xml", headers={"ETag": '"v1"'})
+
+    base_url = await local_server({"/feed.rss": handler})
+    return f"{base_url}/feed.rss", served
+
+
+@pytest.mark.asyncio
+async def test_not_modified_reuses_parsed_feed(feed_url):
+    url, served = feed_url
+    http = HttpClient()
+    client = FeedClient(http=http)
+    try:
+        first = await client.fetch(url)
+        second = await client.fetch(url)
+    finally:
+        await http.close()
+
+    assert first.entries[0].title == "Gold rallies"
+    assert second is first
+    assert served == {"full": 1, "not_modified": 1}
+    assert client.get_stats()["parsed"] == 1
+    assert client.get_stats()["not_modified"] == 1
+
+
+@pytest.mark.asyncio
+async def test_index_is_shared_across_queries_within_ttl(feed_url):
+    url, served = feed_url
+    http = HttpClient()
+    client = FeedClient(http=http)
+    try:
+        indexes = await asyncio.gather(*(client.fetch_index(url, ttl=60) for _ in range(8)))
+        again = await client.fetch_index(url, ttl=60)
+    finally:
+        await http.close()
+
+    assert served == {"full": 1, "not_modified": 0}
+    assert all(index is again for index in indexes)
+    assert list(again)[0][1] == "gold rallies "
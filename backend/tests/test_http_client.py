@@ -0,0 +1,33 @@
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from app.services.http_client import HttpClient
+
+
+@pytest_asyncio.fixture
+async def server(local_server):
+    peers = []
+
+    async def handler(request):
+        peers.append(request.transport.get_extra_info("peername"))
+        return web.json_response({"ok": True})
+
+    return await local_server({"/data.json": handler}), peers
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_pooled_connections(server):
+    base_url, peers = server
+    client = HttpClient(limit_per_host=2)
+    await client.start()
+    try:
+        for _ in range(5):
+            assert await client.get_json(f"{base_url}/data.json") == {"ok": True}
+    finally:
+        await client.close()
+
+    # Sequential requests ride one kept-alive connection
+    assert len(set(peers)) == 1
+    assert client.get_stats()["sessions_created"] == 1
+    assert client.get_stats()["open"] is False
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from app.agents.recommendation_engine import RecommendationEngine
+from app.services.indicators import WilderRSI, compute_signals, ema, wilder_rsi
+from app.services.ring_buffer import PriceRingBuffer
+
+# Classic Wilder example series (RSI(14) after the 15th close is ~70.46)
+CLOSES = [44.34, 44.09, 44.15, 43.61, 44.33, 44.83, 45.10, 45.42, 45.84,
+          46.08, 45.89, 46.03, 45.61, 46.28, 46.28, 46.00, 46.03, 46.41,
+          46.22, 45.64]
+
+
+def test_seed_matches_textbook_value():
+    assert wilder_rsi(CLOSES[:15]) == pytest.approx(70.46, abs=0.05)
+
+
+def test_incremental_updates_match_full_recomputation():
+    state = WilderRSI(14)
+    for i, price in enumerate(CLOSES):
+        value = state.update(price, timestamp=float(i))
+        assert value == wilder_rsi(CLOSES[: i + 1])
+
+
+def test_duplicate_ticks_are_ignored():
+    state = WilderRSI(14).backfill(CLOSES, timestamps=range(len(CLOSES)))
+    before = state.value
+    state.update(1000.0, timestamp=len(CLOSES) - 1)
+    assert state.value == before
+
+
+def test_engine_syncs_only_new_ticks_from_ring_buffer():
+    engine = RecommendationEngine()
+    buffer = PriceRingBuffer(capacity=100)
+    for i, price in enumerate(CLOSES[:15]):
+        buffer.append(price, timestamp=float(i))
+
+    assert engine.sync_indicators("az_gold", buffer) == pytest.approx(70.46, abs=0.05)
+
+    for i, price in enumerate(CLOSES[15:], start=15):
+        buffer.append(price, timestamp=float(i))
+    assert engine.sync_indicators("az_gold", buffer) == wilder_rsi(CLOSES)
+    assert engine.get_rsi("az_gold") == wilder_rsi(CLOSES)
+
+
+def test_vectorized_signals_cover_every_fund_in_one_pass():
+    histories = {}
+    for fund_name, n in [("long", 120), ("short", 10)]:
+        buffer = PriceRingBuffer(capacity=500)
+        for i in range(n):
+            buffer.append(100.0 + (i % 7), timestamp=float(i))
+        histories[fund_name] = buffer
+
+    signals = compute_signals(histories)
+
+    assert signals["long"]["macd_hist"] is not None
+    assert signals["long"]["bb_upper"] > signals["long"]["bb_lower"]
+    assert signals["long"]["volatility"] > 0
+    # Not enough ticks yet for the windowed indicators
+    assert signals["short"]["bb_upper"] is None
+    assert signals["short"]["macd"] is None
+
+
+def test_ema_matches_recursive_definition():
+    prices = np.array([[1.0, 2.0, 3.0, 4.0]])
+    alpha = 2.0 / (3 + 1)
+    expected = 1.0
+    for price in prices[0, 1:]:
+        expected = alpha * price + (1 - alpha) * expected
+    assert ema(prices, 3)[0, -1] == pytest.approx(expected)
+
+
+@pytest.mark.asyncio
+async def test_close_below_lower_band_is_a_buy_signal():
+    engine = RecommendationEngine()
+    indicators = {"bb_percent_b": -0.2, "bb_width": 0.05, "macd_hist": 0.1}
+
+    rec = await engine.generate_recommendation(
+        "az_gold", {"price": 26.0, "change": 0.5}, {"overall_score": 0.0}, indicators=indicators
+    )
+
+    assert rec["recommendation"] == "BUY"
+    assert "Below lower Bollinger band" in rec["reason"]
+
+
+def test_state_created_before_history_loaded_is_backfilled():
+    engine = RecommendationEngine()
+    buffer = PriceRingBuffer(capacity=100)
+    assert engine.sync_indicators("az_gold", buffer) == 50.0  # no history yet
+
+    for i, price in enumerate(CLOSES):
+        buffer.append(price, timestamp=float(i))
+    assert engine.sync_indicators("az_gold", buffer) == wilder_rsi(CLOSES)
@@ -0,0 +1,63 @@
+from app.services.keyword_matcher import KeywordMatcher
+from app.services.sentiment_fetcher import FUND_MATCHER
+
+
+def test_matches_respect_word_boundaries():
+    matcher = KeywordMatcher({"pos": ["up"], "neg": ["risk"]})
+    assert matcher.count("Strong support despite brisk trading") == {"pos": 0, "neg": 0}
+    assert matcher.count("Shares up, RISK ahead") == {"pos": 1, "neg": 1}
+
+
+def test_counts_every_fund_lexicon():
+    counts = FUND_MATCHER.count("Gold rally: bullish momentum as a safe haven, but inflation risk")
+
+    assert counts[("az_gold", "positive")] == 3  # gold, rally, safe haven
+    assert counts[("az_opportunity", "positive")] == 3  # bullish, momentum, rally
+    assert counts[("az_opportunity", "negative")] == 1  # risk
+    assert counts[("halan_saving", "negative")] == 2  # inflation, risk
+    assert counts[("az_shariah", "positive")] == 0
+
+
+def test_longer_keyword_wins_over_its_prefix():
+    counts = FUND_MATCHER.count("Fund flagged as non-compliant")
+    assert counts[("az_shariah", "negative")] == 1
+    assert counts[("az_shariah", "positive")] == 0
+
+
+def test_overlapping_keywords_of_different_funds_both_count():
+    counts = FUND_MATCHER.count("Investors seek a safe haven")
+    assert counts[("az_gold", "positive")] == 1  # safe haven
+    assert counts[("halan_saving", "positive")] == 1  # safe
+
+    matcher = KeywordMatcher({"gold": ["safe haven"], "saving": ["safe"]})
+    assert matcher.count("safe haven demand") == {"gold": 1, "saving": 1}
+    assert matcher.find("safe haven demand") == {"safe haven", "safe"}
+
+
+def test_scans_each_text_once_for_every_fund():
+    class CountingPattern:
+        def __init__(self, pattern):
+            self.pattern = pattern
+            self.calls = 0
+
+        def finditer(self, text):
+            self.calls += 1
+            return self.pattern.finditer(text)
+
+    matcher = KeywordMatcher.from_fund_lexicons(
+        {
+            "gold": {"positive": ["gold", "safe haven"], "negative": ["risk"]},
+            "saving": {"positive": ["safe"], "negative": ["inflation", "risk"]},
+        }
+    )
+    matcher._pattern = CountingPattern(matcher._pattern)
+
+    counts = matcher.count("Gold as a safe haven despite inflation risk")
+
+    assert matcher._pattern.calls == 1
+    assert counts == {
+        ("gold", "positive"): 2,
+        ("gold", "negative"): 1,
+        ("saving", "positive"): 1,
+        ("saving", "negative"): 2,
+    }
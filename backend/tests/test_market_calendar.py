@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.agents import price_monitor as monitor_module
+from app.agents.price_monitor import PriceMonitor
+from app.services.adaptive_polling import AdaptivePolling
+from app.services.market_calendar import MarketCalendar
+
+CALENDAR = MarketCalendar.from_dict({
+    "markets": {
+        "EGX": {
+            "timezone": "Africa/Cairo",
+            "sessions": {day: [["10:00", "14:30"]] for day in ["sun", "mon", "tue", "wed", "thu"]},
+            "holidays": ["2026-10-06"],
+        },
+        "COMEX": {
+            "timezone": "America/New_York",
+            "sessions": {
+                "sun": [["18:00", "24:00"]],
+                "mon": [["00:00", "17:00"], ["18:00", "24:00"]],
+                "fri": [["00:00", "17:00"]],
+            },
+        },
+    },
+    "symbols": {"^CASE30": "EGX", "GC=F": "COMEX"},
+})
+
+
+def utc(text):
+    return datetime.fromisoformat(text).replace(tzinfo=timezone.utc)
+
+
+def test_sessions_weekends_and_holidays():
+    assert CALENDAR.is_open("^CASE30", utc("2026-10-18T09:00"))  # Sunday 12:00 Cairo
+    assert not CALENDAR.is_open("^CASE30", utc("2026-10-16T09:00"))  # Friday
+    assert not CALENDAR.is_open("^CASE30", utc("2026-10-06T09:00"))  # holiday
+    assert not CALENDAR.is_open("^CASE30", utc("2026-10-18T12:00"))  # after 14:30
+
+    status = CALENDAR.status("^CASE30", utc("2026-10-16T09:00"))
+    assert status["open"] is False
+    assert status["last_close"] == "2026-10-15T14:30:00+03:00"
+    assert status["next_open"] == "2026-10-18T10:00:00+03:00"
+
+    # Sunday evening session runs into Monday without a close at midnight
+    assert CALENDAR.is_open("GC=F", utc("2026-10-19T04:00"))
+    assert CALENDAR.last_close("GC=F", utc("2026-10-19T04:00")).isoformat() == "2026-10-16T17:00:00-04:00"
+
+    # Symbols without a market are never considered closed
+    assert CALENDAR.is_open("UNKNOWN", utc("2026-10-17T12:00"))
+
+
+class CountingFetcher:
+    def __init__(self):
+        self.requested = []
+
+    def proxy_symbols(self, fund_name):
+        return ["^CASE30"] if fund_name == "az_opportunity" else []
+
+    async def fetch_prices(self, funds):
+        self.requested.append(sorted(funds))
+        return {
+            name: {"fund": name, "ticker": data["ticker"], "price": 60.0, "change": 0.1, "volume": 0,
+                   "timestamp": datetime.now().isoformat()}
+            for name, data in funds.items()
+        }
+
+
+@pytest.mark.asyncio
+async def test_closed_market_serves_last_close_as_stale(monkeypatch):
+    monkeypatch.setattr(monitor_module, "FUNDS", {
+        "az_opportunity": {"ticker": "AZOPPO"},
+        "halan_saving": {"ticker": "HALAN"},
+    })
+    monitor = PriceMonitor()
+    monitor.fetcher = CountingFetcher()
+    monitor.calendar = CALENDAR
+    monitor.polling = AdaptivePolling(min_interval=0, max_interval=0)  # open markets: every cycle
+    clock = {"now": utc("2026-10-16T09:00")}  # Friday: EGX closed
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock["now"]
+
+    monkeypatch.setattr(monitor_module, "datetime", FrozenDatetime)
+
+    await monitor.monitor_all_funds()  # no price yet: fetched once
+    prices = {p["fund"]: p for p in await monitor.monitor_all_funds()}
+    assert monitor.fetcher.requested == [["az_opportunity", "halan_saving"], ["halan_saving"]]
+    assert prices["az_opportunity"]["stale"] is True
+    assert prices["az_opportunity"]["market"]["next_open"] == "2026-10-18T10:00:00+03:00"
+    assert prices["halan_saving"]["stale"] is False
+    assert monitor.last_fetched == ["halan_saving"]
+
+    # Occasional refresh while closed, then every cycle once the market opens
+    clock["now"] += timedelta(seconds=monitor_module.CLOSED_REFRESH_SECONDS)
+    await monitor.monitor_all_funds()
+    clock["now"] = utc("2026-10-18T08:00")
+    prices = {p["fund"]: p for p in await monitor.monitor_all_funds()}
+    assert monitor.fetcher.requested[2:] == [["az_opportunity", "halan_saving"]] * 2
+    assert prices["az_opportunity"]["stale"] is False
@@ -0,0 +1,121 @@
+import asyncio
+import time
+
+import pytest
+
+from app import orchestrator as orchestrator_module
+from app.orchestrator import AgentOrchestrator
+from app.services.phase_executor import Phase, PhaseExecutor
+
+
+def sleeper(delay, value):
+    async def run():
+        await asyncio.sleep(delay)
+        return value
+    return run
+
+
+@pytest.mark.asyncio
+async def test_independent_phases_overlap_and_dependents_wait():
+    order = []
+
+    async def combine():
+        order.append("combine")
+        return "done"
+
+    started = time.monotonic()
+    results = await PhaseExecutor([
+        Phase("combine", combine, depends_on=("a", "b")),
+        Phase("a", sleeper(0.2, 1)),
+        Phase("b", sleeper(0.2, 2)),
+    ]).run()
+
+    assert time.monotonic() - started < 0.35  # max(a, b), not a + b
+    assert [results[n].value for n in ("a", "b", "combine")] == [1, 2, "done"]
+    assert order == ["combine"]
+
+
+@pytest.mark.asyncio
+async def test_late_or_failing_phase_uses_fallback():
+    async def broken():
+        raise RuntimeError("feed down")
+
+    results = await PhaseExecutor([
+        Phase("slow", sleeper(5, "fresh"), deadline=0.1, fallback=lambda: "last good"),
+        Phase("broken", broken, fallback=lambda: "cached"),
+        Phase("after", sleeper(0, "ran"), depends_on=("slow", "broken")),
+    ]).run()
+
+    assert results["slow"].status == "timeout" and results["slow"].value == "last good"
+    assert results["broken"].stale and results["broken"].error == "feed down"
+    assert results["after"].value == "ran" and not results["after"].stale
+
+    with pytest.raises(ValueError):
+        PhaseExecutor([Phase("x", broken, depends_on=("y",)), Phase("y", broken, depends_on=("x",))])
+
+
+@pytest.mark.asyncio
+async def test_full_cycle_continues_with_stale_sentiment(monkeypatch):
+    monkeypatch.setattr(orchestrator_module, "SENTIMENT_PHASE_DEADLINE", 0.2)
+    orchestrator = AgentOrchestrator()
+    orchestrator.last_sentiment = {"az_gold": {"fund": "az_gold", "overall_score": 0.2}}
+
+    async def prices():
+        await asyncio.sleep(0.1)
+        orchestrator.price_monitor.last_fetched = ["az_gold"]
+        return [{"fund": "az_gold", "price": 26.0, "change": 0.3}]
+
+    async def sentiment():
+        await asyncio.sleep(5)
+        return []
+
+    monkeypatch.setattr(orchestrator.price_monitor, "monitor_all_funds", prices)
+    monkeypatch.setattr(orchestrator.sentiment_analyzer, "analyze_all_funds", sentiment)
+
+    result = await orchestrator.run_full_cycle()
+
+    assert result["status"] == "success"
+    assert result["cycle_time_seconds"] < 1
+    assert result["stale_phases"] == ["sentiment"]
+    assert result["phases"]["prices"]["status"] == "ok"
+    assert result["sentiments"] == [{"fund": "az_gold", "overall_score": 0.2, "stale": True}]
+    assert result["recommendations"][0]["sentiment_score"] == 0.2
+
+
+@pytest.mark.asyncio
+async def test_scheduled_price_job_keeps_last_prices_past_its_deadline(monkeypatch):
+    monkeypatch.setattr(orchestrator_module, "PRICE_PHASE_DEADLINE", 0.1)
+    orchestrator = AgentOrchestrator()
+    orchestrator.last_prices = {"az_gold": {"fund": "az_gold", "price": 26.0, "change": 0.3}}
+
+    async def prices():
+        await asyncio.sleep(5)
+        return []
+
+    monkeypatch.setattr(orchestrator.price_monitor, "monitor_all_funds", prices)
+
+    started = time.monotonic()
+    result = await orchestrator.update_prices()
+
+    assert time.monotonic() - started < 1
+    assert result == [{"fund": "az_gold", "price": 26.0, "change": 0.3, "stale": True}]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fetches_share_one_run(monkeypatch):
+    orchestrator = AgentOrchestrator()
+    calls = []
+
+    async def prices():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        orchestrator.price_monitor.last_fetched = ["az_gold"]
+        return [{"fund": "az_gold", "price": 26.0, "change": 0.3}]
+
+    monkeypatch.setattr(orchestrator.price_monitor, "monitor_all_funds", prices)
+
+    # A scheduled job and a manual refresh landing together
+    first, second = await asyncio.gather(orchestrator.fetch_prices(), orchestrator.fetch_prices())
+
+    assert len(calls) == 1
+    assert first == second
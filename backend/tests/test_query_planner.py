@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from app.services.query_planner import combine, plan_batches
+from app.services.sentiment_fetcher import FUND_QUERIES, RealSentimentFetcher
+
+
+class SearchSource:
+    """Fake OR-capable search source returning a fixed set of headlines"""
+    SUPPORTS_OR = True
+    MAX_QUERY_CHARS = 400
+    RESULTS_PER_QUERY = 5
+
+    def __init__(self, headlines):
+        self.headlines = headlines
+        self.calls = []
+
+    async def fetch(self, query, limit=None):
+        self.calls.append((query, limit))
+        await asyncio.sleep(0.01)
+        return [{"text": text, "source": "search"} for text in self.headlines]
+
+
+def test_plan_batches_respects_query_length():
+    queries = {"a": "x" * 10, "b": "y" * 10, "c": "z" * 10}
+    assert combine(["gold", "silver"]) == "(gold) OR (silver)"
+    assert plan_batches(queries, max_chars=100) == [["a", "b", "c"]]
+    assert plan_batches(queries, max_chars=30) == [["a", "b"], ["c"]]
+    assert plan_batches(queries, max_chars=5) == [["a"], ["b"], ["c"]]
+
+
+@pytest.mark.asyncio
+async def test_funds_share_one_combined_request():
+    source = SearchSource([
+        "Gold bullion rally continues",
+        "Halal sukuk issuance grows as investors seek sharia compliant products",
+        "Bank deposit rates unchanged",
+        "Emerging markets stocks breakout",
+        "Local football results",
+    ])
+    fetcher = RealSentimentFetcher(sources=[source], deadline=5)
+
+    results = await asyncio.gather(*(fetcher.fetch_sentiment(fund) for fund in FUND_QUERIES))
+    by_fund = {fund: result for fund, result in zip(FUND_QUERIES, results)}
+
+    assert len(source.calls) == 1
+    query, limit = source.calls[0]
+    assert query.count(" OR ") == len(FUND_QUERIES) - 1
+    assert limit == 5 * len(FUND_QUERIES)
+
+    assert [i["text"] for i in by_fund["az_gold"]["recent_items"]] == ["Gold bullion rally continues"]
+    assert [i["text"] for i in by_fund["az_shariah"]["recent_items"]] == [
+        "Halal sukuk issuance grows as investors seek sharia compliant products"
+    ]
+    assert fetcher.planner.get_stats()["unassigned"] == 1
+
+    # Served from the planner's cache within its TTL
+    await fetcher.fetch_sentiment("az_gold")
+    assert len(source.calls) == 1
@@ -0,0 +1,145 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from app.agents import price_monitor as monitor_module
+from app.agents.price_monitor import PriceMonitor
+from app.services.adaptive_polling import AdaptivePolling
+from app.services.market_calendar import MarketCalendar
+from app.services.quote_cache import QuoteCache
+from app.services.price_fetcher import RealPriceFetcher
+
+
+def test_hit_after_miss():
+    cache = QuoteCache()
+    loader = MagicMock(return_value={"close": 1.0, "open": 1.0, "volume": 0})
+
+    assert cache.get_or_fetch("GC=F", loader)["close"] == 1.0
+    assert cache.get_or_fetch("GC=F", loader)["close"] == 1.0
+
+    assert loader.call_count == 1
+    stats = cache.get_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["upstream_calls"] == 1
+
+
+def test_per_symbol_ttl_expiry():
+    cache = QuoteCache(ttls={"GC=F": 0.0, "EGP=X": 60.0})
+    loader = MagicMock(return_value={"close": 1.0, "open": 1.0, "volume": 0})
+
+    cache.get_or_fetch("GC=F", loader)
+    cache.get_or_fetch("GC=F", loader)
+    cache.get_or_fetch("EGP=X", loader)
+    cache.get_or_fetch("EGP=X", loader)
+
+    # GC=F expires immediately, EGP=X is served from cache the second time
+    assert loader.call_count == 3
+
+
+def test_concurrent_callers_share_one_fetch():
+    cache = QuoteCache()
+    calls = []
+
+    def slow_loader():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"close": 2.0, "open": 2.0, "volume": 0}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_fetch("^CASE30", slow_loader)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert len(results) == 5
+    assert cache.get_stats()["coalesced"] == 4
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "quotes.json")
+    QuoteCache(disk_path=path).set("EGP=X", {"close": 48.5, "open": 48.4, "volume": 0})
+
+    restarted = QuoteCache(disk_path=path)
+    loader = MagicMock()
+
+    assert restarted.get_or_fetch("EGP=X", loader)["close"] == 48.5
+    assert not loader.called
+    assert restarted.get_stats()["disk_hits"] == 1
+
+
+def test_fetcher_downloads_each_symbol_once_per_ttl():
+    history = pd.DataFrame({"Open": [100.0], "Close": [101.0], "Volume": [10]})
+    fake_yf = MagicMock()
+    fake_yf.Ticker.return_value.history.return_value = history
+
+    fetcher = RealPriceFetcher(cache=QuoteCache())
+    fetcher.yf = fake_yf
+
+    for fund in ["az_gold", "az_opportunity", "az_shariah"]:
+        assert fetcher._fetch_sync(fund, {"ticker": fund.upper()}) is not None
+
+    requested = sorted(call.args[0] for call in fake_yf.Ticker.call_args_list)
+    assert requested == ["EGP=X", "GC=F", "^CASE30"]
+
+
+def test_batch_fetch_uses_one_bulk_download():
+    columns = pd.MultiIndex.from_product([["GC=F", "^CASE30", "EGP=X"], ["Open", "Close", "Volume"]])
+    frame = pd.DataFrame([[2000.0, 2010.0, 5, 30000.0, 30300.0, 7, 48.0, 48.5, 0]], columns=columns)
+    fake_yf = MagicMock()
+    fake_yf.download.return_value = frame
+
+    fetcher = RealPriceFetcher(cache=QuoteCache())
+    fetcher.yf = fake_yf
+
+    funds = {
+        "halan_saving": {"ticker": "HALAN"},
+        "az_gold": {"ticker": "AZGOLD"},
+        "az_opportunity": {"ticker": "AZOPPO"},
+        "az_shariah": {"ticker": "ASO"},
+    }
+    results = fetcher._fetch_many_sync(funds)
+
+    assert fake_yf.download.call_count == 1
+    assert sorted(fake_yf.download.call_args.args[0]) == ["EGP=X", "GC=F", "^CASE30"]
+    assert not fake_yf.Ticker.called
+    assert all(results[fund] is not None for fund in funds)
+    assert results["az_opportunity"]["price"] == round(30300.0 / 500, 2)
+    assert results["az_gold"]["volume"] == 5
+
+    # Second cycle inside the TTL is served entirely from cache
+    fetcher._fetch_many_sync(funds)
+    assert fake_yf.download.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_quotes_are_not_recorded_as_new_ticks(monkeypatch):
+    columns = pd.MultiIndex.from_product([["GC=F", "^CASE30", "EGP=X"], ["Open", "Close", "Volume"]])
+    frame = pd.DataFrame([[2000.0, 2010.0, 5, 30000.0, 30300.0, 7, 48.0, 48.5, 0]], columns=columns)
+    fetcher = RealPriceFetcher(cache=QuoteCache())
+    fetcher.yf = MagicMock()
+    fetcher.yf.download.return_value = frame
+
+    submitted = []
+    monkeypatch.setattr(monitor_module.price_history_writer, "submit", submitted.append)
+    monitor = PriceMonitor()
+    monitor.fetcher = fetcher
+    monitor.calendar = MarketCalendar.from_dict({"markets": {}, "symbols": {}})  # always open
+    monitor.polling = AdaptivePolling(min_interval=0, max_interval=0)
+
+    first = {p["fund"]: p for p in await monitor.monitor_all_funds()}
+    second = {p["fund"]: p for p in await monitor.monitor_all_funds()}  # inside the quote TTL
+
+    assert fetcher.yf.download.call_count == 1
+    assert second["az_gold"]["timestamp"] == first["az_gold"]["timestamp"]
+    assert monitor.last_fetched == ["halan_saving"]  # simulated, so always a fresh tick
+    assert len(monitor.price_history["az_gold"]) == 1
+    assert [tick["fund"] for tick in submitted].count("az_opportunity") == 1
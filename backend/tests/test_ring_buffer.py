@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from app.agents.recommendation_engine import RecommendationEngine
+from app.services.ring_buffer import PriceRingBuffer
+
+
+def test_window_is_chronological_after_wraparound():
+    buffer = PriceRingBuffer(capacity=5)
+    for i in range(12):
+        buffer.append(float(i), change=i / 10, volume=i, timestamp=1000.0 + i)
+
+    assert len(buffer) == 5
+    assert buffer.prices().tolist() == [7.0, 8.0, 9.0, 10.0, 11.0]
+    assert buffer.prices(3).tolist() == [9.0, 10.0, 11.0]
+    assert buffer.volumes().dtype == np.int64
+    assert buffer.last()["price"] == 11.0
+
+
+def test_window_is_a_read_only_view():
+    buffer = PriceRingBuffer(capacity=4)
+    for i in range(6):
+        buffer.append(float(i))
+
+    view = buffer.prices()
+    assert np.shares_memory(view, buffer._arrays["price"])
+    with pytest.raises(ValueError):
+        view[0] = 99.0
+
+
+def test_append_tick_parses_iso_timestamp():
+    buffer = PriceRingBuffer(capacity=2)
+    buffer.append_tick({"price": 26.5, "change": 0.4, "volume": 10, "timestamp": "2026-01-05T10:00:00"})
+
+    record = buffer.to_records()[0]
+    assert record["timestamp"] == "2026-01-05T10:00:00"
+    assert record["price"] == 26.5
+
+
+def test_rsi_reads_directly_from_ring_buffer():
+    buffer = PriceRingBuffer(capacity=100)
+    for i in range(30):
+        buffer.append(100.0 + i)
+
+    engine = RecommendationEngine()
+    assert engine.calculate_rsi(engine._history_prices(buffer)) == 100.0
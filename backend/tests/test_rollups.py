@@ -0,0 +1,76 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database import Base, SentimentRecord, SentimentRollup
+from app.services import rollups
+from app.services.executors import BoundedExecutor
+from app.services.rollups import rollup_rows, rollup_to_point, upsert_sentiment_rollups
+from app.services.write_behind import WriteBehindWriter, sentiment_to_row
+
+
+def sentiment(score, timestamp, count=10, new_items=10):
+    return {
+        "fund": "az_gold",
+        "sentiment_distribution": {"positive": 60.0, "neutral": 30.0, "negative": 10.0},
+        "overall_score": score,
+        "source_count": count,
+        "new_items": new_items,
+        "timestamp": timestamp,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("on_conflict", [True, False], ids=["on_conflict", "read_then_update"])
+async def test_records_and_rollups_written_in_one_batch(tmp_path, monkeypatch, on_conflict):
+    if not on_conflict:
+        monkeypatch.setattr(rollups, "ON_CONFLICT_DIALECTS", ())
+    engine = create_engine(f"sqlite:///{tmp_path / 'rollups.db'}")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    writer = WriteBehindWriter(
+        "sentiment-test",
+        SentimentRecord,
+        sentiment_to_row,
+        batch_size=10,
+        flush_interval=0.05,
+        session_factory=Session,
+        executor=BoundedExecutor("test-db", max_workers=1, max_queue=4),
+        on_batch=upsert_sentiment_rollups,
+    )
+    await writer.start()
+    for score, ts in [(0.2, "2026-03-01T10:05:00+00:00"), (0.4, "2026-03-01T10:45:00+00:00"),
+                      (0.6, "2026-03-01T11:10:00+00:00")]:
+        writer.submit(sentiment(score, ts))
+    await writer.stop()
+
+    # A second batch lands in existing buckets
+    await writer.start()
+    writer.submit(sentiment(0.8, "2026-03-01T11:20:00+00:00"))
+    await writer.stop()
+
+    db = Session()
+    assert db.query(SentimentRecord).count() == 4
+    hourly = db.query(SentimentRollup).filter_by(resolution="hour").order_by(SentimentRollup.bucket_start).all()
+    daily = db.query(SentimentRollup).filter_by(resolution="day").one()
+    db.close()
+
+    assert [rollup_to_point(r)["overall_score"] for r in hourly] == [pytest.approx(0.3), pytest.approx(0.7)]
+    assert hourly[0].bucket_start == datetime(2026, 3, 1, 10)
+    assert (daily.samples, daily.item_count) == (4, 40)
+    assert rollup_to_point(daily)["overall_score"] == pytest.approx(0.5)
+
+
+def test_item_count_sums_new_items_not_running_totals():
+    # source_count is the decayed running total, so consecutive fetches repeat most of it
+    records = [
+        sentiment_to_row(sentiment(0.2, "2026-03-01T10:00:00+00:00", count=25.0, new_items=5)),
+        sentiment_to_row(sentiment(0.4, "2026-03-01T10:05:00+00:00", count=27.4, new_items=3)),
+    ]
+
+    hourly = [row for row in rollup_rows(records) if row["resolution"] == "hour"]
+
+    assert len(hourly) == 1
+    assert (hourly[0]["samples"], hourly[0]["item_count"]) == (2, 8)
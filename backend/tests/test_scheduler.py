@@ -0,0 +1,55 @@
+import pytest
+
+from app.services.scheduler import Scheduler
+
+
+@pytest.mark.asyncio
+async def test_runs_on_fixed_grid_without_drift(clock):
+    scheduler = Scheduler(clock=clock, sleep=clock.sleep)
+    starts = []
+
+    async def job():
+        starts.append(clock())
+        await clock.sleep(3)  # run time must not push later slots back
+
+    scheduler.add("fast", job, interval=10)
+    scheduler.start()
+    await clock.advance(55)
+    await scheduler.stop()
+
+    assert starts == [1000 + i * 10 for i in range(6)]
+    status = scheduler.get_status()["fast"]
+    assert status["runs"] == 6 and status["coalesced"] == 0
+    assert status["last_lag_seconds"] == 0 and status["last_duration_seconds"] == 3
+
+
+@pytest.mark.asyncio
+async def test_overrunning_job_is_coalesced_not_stacked(clock):
+    scheduler = Scheduler(clock=clock, sleep=clock.sleep)
+    starts = []
+    active = peak = 0
+
+    async def slow():
+        nonlocal active, peak
+        starts.append(clock())
+        active += 1
+        peak = max(peak, active)
+        await clock.sleep(25)
+        active -= 1
+
+    async def failing():
+        raise RuntimeError("upstream down")
+
+    scheduler.add("slow", slow, interval=10)
+    scheduler.add("failing", failing, interval=10)
+    scheduler.start()
+    await clock.advance(60)
+    status = scheduler.get_status()
+    await scheduler.stop()
+
+    assert peak == 1
+    # Slots passed during a run collapse into one catch-up run as soon as it ends
+    assert starts == [1000, 1025, 1050]
+    assert status["slow"]["running"] and status["slow"]["runs"] == 2 and status["slow"]["coalesced"] == 3
+    assert status["failing"]["errors"] == status["failing"]["runs"] == 7
+    assert status["failing"]["last_error"] == "upstream down"
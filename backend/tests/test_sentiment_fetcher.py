@@ -0,0 +1,53 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services.sentiment_fetcher import RealSentimentFetcher
+
+
+class SlowSource:
+    """Fake source that sleeps and records its peak concurrency"""
+
+    def __init__(self, delay, text="gold rally"):
+        self.delay = delay
+        self.text = text
+        self.active = 0
+        self.peak = 0
+
+    async def fetch(self, query):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            return [{"text": self.text, "source": "fake"}]
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_funds_fan_out_concurrently_within_source_limit():
+    source = SlowSource(0.1)
+    fetcher = RealSentimentFetcher(sources=[source], per_source_concurrency=2, deadline=5)
+
+    started = time.monotonic()
+    results = await asyncio.gather(*(fetcher.fetch_sentiment(f) for f in ["az_gold"] * 4))
+    elapsed = time.monotonic() - started
+
+    assert all(r and not r["partial"] for r in results)
+    assert source.peak == 2
+    assert elapsed < 0.35  # two waves of 0.1s, not four
+
+
+@pytest.mark.asyncio
+async def test_deadline_returns_partial_result():
+    fast, slow = SlowSource(0.01), SlowSource(10)
+    fetcher = RealSentimentFetcher(sources=[fast, slow], deadline=0.2)
+
+    started = time.monotonic()
+    result = await fetcher.fetch_sentiment("az_gold")
+
+    assert time.monotonic() - started < 1
+    assert result["partial"] is True
+    assert result["missing_sources"] == ["SlowSource"]
+    assert result["sources"] == ["fake"]
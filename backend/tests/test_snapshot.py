@@ -0,0 +1,33 @@
+import pytest
+
+from app.services.snapshot import SnapshotStore
+
+
+def test_publish_increments_version_and_carries_sections_over():
+    store = SnapshotStore()
+    assert store.current().version == 0
+
+    first = store.publish(prices={"az_gold": {"fund": "az_gold", "price": 26.1}})
+    second = store.publish(sentiments={"az_gold": {"fund": "az_gold", "overall_score": 0.4}})
+
+    assert (first.version, second.version) == (1, 2)
+    assert second.prices["az_gold"]["price"] == 26.1
+    assert "az_gold" not in first.sentiments
+
+
+def test_snapshot_is_isolated_from_later_publishes_and_source_dicts():
+    store = SnapshotStore()
+    prices = {"az_gold": {"fund": "az_gold", "price": 26.1}}
+    snapshot = store.publish(prices=prices)
+
+    prices["az_opportunity"] = {"fund": "az_opportunity", "price": 60.0}
+    store.publish(prices=prices)
+
+    assert list(snapshot.prices) == ["az_gold"]
+    with pytest.raises(TypeError):
+        snapshot.prices["az_shariah"] = {}
+
+
+def test_unknown_section_is_rejected():
+    with pytest.raises(ValueError):
+        SnapshotStore().publish(orders={})
@@ -0,0 +1,57 @@
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.services import text_scorer as scorer_module
+from app.services.text_scorer import LexiconScorer, score_batch
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    return LexiconScorer().load()
+
+
+def test_matches_textblob_on_modifiers_and_negation(scorer):
+    polarity = scorer.polarities(["good", "very good", "not good", "nothing to see", ""])
+    assert polarity.tolist() == pytest.approx([0.7, 0.91, -0.35, 0.0, 0.0])
+
+
+def test_labels_follow_analyze_tweet_thresholds():
+    scorer = LexiconScorer({"gain": {"polarity": 0.6}, "loss": {"polarity": -0.6}})
+    results = scorer.score_texts(["big gain", "heavy loss", "flat day"], "az_gold")
+    assert [r["sentiment"] for r in results] == ["positive", "negative", "neutral"]
+    assert results[2]["score"] == 0.5
+    assert results[0]["fund"] == "az_gold"
+
+
+@pytest.mark.asyncio
+async def test_large_batches_are_split_across_processes(monkeypatch):
+    monkeypatch.setattr(scorer_module, "PROCESS_POOL_THRESHOLD", 10)
+    monkeypatch.setattr(scorer_module, "PROCESS_POOL_WORKERS", 2)
+    texts = ["good news"] * 15 + ["bad news"] * 15
+    try:
+        results = await score_batch(texts)
+    finally:
+        scorer_module.shutdown_pool()
+
+    assert len(results) == 30
+    assert [r["sentiment"] for r in results] == ["positive"] * 15 + ["negative"] * 15
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_falls_back_to_in_process_scoring(monkeypatch):
+    class BrokenPool(Executor):
+        def submit(self, fn, *args, **kwargs):
+            future = Future()
+            future.set_exception(BrokenProcessPool("worker died"))
+            return future
+
+    monkeypatch.setattr(scorer_module, "PROCESS_POOL_THRESHOLD", 10)
+    monkeypatch.setattr(scorer_module, "PROCESS_POOL_WORKERS", 2)
+    monkeypatch.setattr(scorer_module, "_pool", BrokenPool())
+
+    results = await score_batch(["good news"] * 10 + ["bad news"] * 10)
+
+    assert [r["sentiment"] for r in results] == ["positive"] * 10 + ["negative"] * 10
+    assert scorer_module._pool is None  # replaced on the next large batch
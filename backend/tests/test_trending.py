@@ -0,0 +1,55 @@
+import pytest
+
+from app.routes import sentiment as sentiment_routes
+from app.services import sentiment_fetcher
+from app.services.trending import SpaceSaving, TrendingEngine, TrendingTracker, tokenize
+
+
+def test_tokenize_drops_stopwords_and_repeats():
+    assert tokenize("The gold rally and the GOLD price") == ["gold", "rally", "price"]
+
+
+def test_space_saving_keeps_heavy_hitters_in_fixed_memory():
+    summary = SpaceSaving(capacity=10)
+    for i in range(2000):
+        summary.add("gold" if i % 3 == 0 else f"noise{i}")
+    assert len(summary.counts) == 10
+    assert max(summary.counts, key=summary.counts.get) == "gold"
+    assert summary.counts["gold"] - summary.errors["gold"] <= 667 <= summary.counts["gold"]
+
+
+def test_window_slides_and_rising_beats_baseline(clock):
+    tracker = TrendingTracker(window=600, buckets=6, clock=clock, min_count=2)
+
+    # A long, steady history of "inflation" news builds the baseline
+    for step in range(60):
+        clock.now = step * 100
+        tracker.ingest(["inflation data for egypt", "inflation slows"])
+
+    # Then a burst about devaluation
+    clock.now += 100
+    tracker.ingest(["pound devaluation fears"] * 3 + ["inflation data for egypt"])
+
+    assert tracker.top(1)[0]["term"] == "inflation"
+    assert tracker.rising(1)[0]["term"] in {"pound", "devaluation", "fears"}
+
+    # Once the window has passed, the burst is gone
+    clock.now += 700
+    assert tracker.top() == []
+
+
+@pytest.mark.asyncio
+async def test_trending_route_returns_k_terms_and_no_mock_fallback(monkeypatch):
+    engine = TrendingEngine(min_count=1)
+    monkeypatch.setattr(sentiment_fetcher, "trending_engine", engine)
+    monkeypatch.setattr(sentiment_routes, "trending_engine", engine)
+    monkeypatch.setattr(sentiment_routes.analyzer, "fetcher", sentiment_fetcher.RealSentimentFetcher())
+
+    # No items seen yet: empty, not the mock fetcher's canned keywords
+    empty = await sentiment_routes.get_trending_keywords("az_gold", k=10)
+    assert empty["trending_keywords"] == []
+
+    engine.ingest("az_gold", [" ".join(f"term{chr(97 + i)}" for i in range(15))])
+    result = await sentiment_routes.get_trending_keywords("az_gold", k=15)
+    assert len(result["trending_keywords"]) == 15
+    assert len(result["terms"]["top"]) == 15
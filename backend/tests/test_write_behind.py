@@ -0,0 +1,66 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models.database import PriceHistory
+from app.services.executors import BoundedExecutor
+from app.services.write_behind import WriteBehindWriter, price_tick_to_row
+
+
+def make_writer(session_factory, **kwargs):
+    return WriteBehindWriter(
+        "test",
+        PriceHistory,
+        price_tick_to_row,
+        session_factory=session_factory,
+        executor=BoundedExecutor("test-db", max_workers=1, max_queue=4),
+        **kwargs,
+    )
+
+
+def tick(i):
+    return {"fund": "az_gold", "ticker": "AZGOLD", "price": 26.0 + i, "change": 0.1,
+            "volume": 5, "timestamp": "2026-01-05T10:00:00"}
+
+
+@pytest.mark.asyncio
+async def test_rows_are_written_in_one_transaction_per_batch():
+    session = MagicMock()
+    writer = make_writer(lambda: session, batch_size=3, flush_interval=0.05)
+    await writer.start()
+
+    for i in range(3):
+        writer.submit(tick(i))
+    await writer.stop()
+
+    assert session.execute.call_count == 1
+    assert len(session.execute.call_args.args[1]) == 3
+    assert session.commit.call_count == 1
+    assert writer.stats["written"] == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried():
+    session = MagicMock()
+    session.execute.side_effect = [RuntimeError("db down"), None]
+    writer = make_writer(lambda: session, batch_size=1, flush_interval=0.01, retry_delay=0.01)
+    await writer.start()
+
+    writer.submit(tick(0))
+    await writer.stop()
+
+    assert session.rollback.call_count == 1
+    assert writer.stats["retries"] == 1
+    assert writer.stats["written"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_is_bounded_and_drops_oldest():
+    writer = make_writer(MagicMock, max_queue=2)
+
+    for i in range(5):
+        writer.submit(tick(i))
+
+    assert writer.get_stats()["queue_depth"] == 2
+    assert writer.stats["dropped"] == 3
+    assert writer._drain(2)[0]["price"] == 29.0
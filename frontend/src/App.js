@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from "react";
 import PriceMonitor from "./components/PriceMonitor";
 import SentimentDashboard from "./components/SentimentDashboard";
-import { priceService, sentimentService } from "./services/api";
+import { priceService, sentimentService, streamService } from "./services/api";
 
 function App() {
   const [activeTab, setActiveTab] = useState("split");
@@ -39,10 +39,47 @@ function App() {
     }
   };
 
+  // Apply a cycle pushed by the backend orchestrator
+  const applyCycle = (cycle) => {
+    if (cycle.status !== "success") return;
+    setPrices(cycle.prices || []);
+    setOpportunities(cycle.opportunities || []);
+    setSentiments(cycle.sentiments || []);
+    setAlerts(
+      (cycle.alerts || [])
+        .filter((a) => a.type.startsWith("SENTIMENT_"))
+        .map((a) => ({ fund: a.fund, alert: a.title }))
+    );
+    setLoading(false);
+    setError(null);
+  };
+
   useEffect(() => {
     fetchGlobalData();
-    const interval = setInterval(fetchGlobalData, 10000); // 10s refresh
-    return () => clearInterval(interval);
+
+    // Poll only while the live stream is unavailable
+    let interval = null;
+    const startPolling = () => {
+      if (!interval) interval = setInterval(fetchGlobalData, 10000); // 10s refresh
+    };
+    const stopPolling = () => {
+      clearInterval(interval);
+      interval = null;
+    };
+
+    startPolling();
+    const unsubscribe = streamService.subscribeCycles(
+      (cycle) => {
+        stopPolling();
+        applyCycle(cycle);
+      },
+      () => startPolling() // EventSource reconnects on its own
+    );
+
+    return () => {
+      stopPolling();
+      unsubscribe();
+    };
   }, []);
 
   const sharedProps = { prices, opportunities, sentiments, alerts, loading, error };
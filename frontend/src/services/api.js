@@ -52,6 +52,8 @@ export const sentimentService = {
   getTrendingKeywords: (fundName) =>
     api.get(`/sentiment/trending/${fundName}`),
   getSentimentAlerts: () => api.get("/sentiment/alerts"),
+  getSentimentHistory: (fundName, days = 7, resolution = "hour") =>
+    api.get(`/sentiment/history/${fundName}`, { params: { days, resolution } }),
 };
 
 // Recommendation endpoints
@@ -62,4 +64,14 @@ export const recommendationService = {
     api.get(`/recommendations/risk/${fundName}`),
 };
 
+// Live cycle stream (Server-Sent Events). Returns an unsubscribe function.
+export const streamService = {
+  subscribeCycles: (onCycle, onError) => {
+    const source = new EventSource(`${API_BASE_URL}/stream/cycles`);
+    source.addEventListener("cycle", (event) => onCycle(JSON.parse(event.data)));
+    source.onerror = onError;
+    return () => source.close();
+  },
+};
+
 export default api;